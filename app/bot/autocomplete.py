@@ -0,0 +1,162 @@
+import logging
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Iterable, Iterator
+
+from app.utils.fuzzy import normalize, trigrams
+from app.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+NameLoader = Callable[[], Awaitable[Iterable[str]]]
+
+# Discord shows at most 25 choices
+DEFAULT_LIMIT = 24
+
+
+class AutocompleteIndex:
+    """
+    Names searchable by prefix and substring, normalized once at build time.
+
+    Whole names and every word inside them are kept in sorted arrays, so a
+    prefix lookup is a binary search. Substrings of three or more characters
+    go through a trigram index and are verified against the normalized key.
+    Results are ranked exact match, name prefix, word prefix, then
+    substring.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        unique = {name: normalize(name) for name in names if name}
+        self.names: list[str] = list(unique)
+        self._keys: list[str] = list(unique.values())
+
+        self._exact: dict[str, int] = {}
+        self._prefixes: list[tuple[str, int]] = []
+        self._words: list[tuple[str, int]] = []
+        self._postings: dict[str, set[int]] = defaultdict(set)
+
+        for name_id, key in enumerate(self._keys):
+            self._exact.setdefault(key, name_id)
+            self._prefixes.append((key, name_id))
+            words = key.split(" ")
+            for position in range(1, len(words)):
+                self._words.append((" ".join(words[position:]), name_id))
+            for gram in trigrams(key):
+                self._postings[gram].add(name_id)
+
+        self._prefixes.sort()
+        self._words.sort()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @staticmethod
+    def _with_prefix(entries: list[tuple[str, int]], prefix: str) -> Iterator[int]:
+        for position in range(bisect_left(entries, (prefix,)), len(entries)):
+            key, name_id = entries[position]
+            if not key.startswith(prefix):
+                break
+            yield name_id
+
+    def _containing(self, query: str) -> list[int]:
+        grams = trigrams(query)
+        # padding trigrams only match at word starts, drop them for substrings
+        grams = {gram for gram in grams if " " not in gram} or grams
+        postings = sorted(
+            (self._postings.get(gram, set()) for gram in grams), key=len
+        )
+        found = set.intersection(*postings) if postings else set()
+        return sorted(
+            (name_id for name_id in found if query in self._keys[name_id]),
+            key=lambda name_id: (
+                self._keys[name_id].index(query),
+                len(self._keys[name_id]),
+            ),
+        )
+
+    def _ranked(self, query: str) -> Iterator[int]:
+        # lazy, so substring lookups only run when prefixes did not fill a page
+        if query in self._exact:
+            yield self._exact[query]
+        yield from self._with_prefix(self._prefixes, query)
+        yield from self._with_prefix(self._words, query)
+        if len(query) >= 3:
+            yield from self._containing(query)
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> list[str]:
+        query = normalize(query)
+        if not query:
+            return self.names[:limit]
+
+        results: dict[int, None] = {}
+        for name_id in self._ranked(query):
+            results.setdefault(name_id)
+            if len(results) >= limit:
+                break
+        return [self.names[name_id] for name_id in results]
+
+
+class AutocompleteEngine:
+    """
+    Autocomplete indexes keyed by dataset, rebuilt only when the version
+    reported for that dataset changes.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._indexes = {}
+            cls._instance._stats = {"hits": 0, "builds": 0}
+        return cls._instance
+
+    async def index(
+        self, dataset: str, version: Any, load: NameLoader
+    ) -> AutocompleteIndex:
+        cached = self._indexes.get(dataset)
+        if cached is not None and cached[0] == version:
+            self._stats["hits"] += 1
+            return cached[1]
+
+        index = AutocompleteIndex(await load())
+        # an empty source is usually not loaded yet, try again next keystroke
+        if len(index):
+            self._stats["builds"] += 1
+            self._indexes[dataset] = (version, index)
+            logger.info(
+                f"Built autocomplete index {dataset} ({len(index)} names, "
+                f"version {version})"
+            )
+        return index
+
+    async def search(
+        self,
+        dataset: str,
+        version: Any,
+        load: NameLoader,
+        query: str,
+        limit: int = DEFAULT_LIMIT,
+    ) -> list[str]:
+        index = await self.index(dataset, version, load)
+        with metrics.timer(f"autocomplete.{dataset}"):
+            return index.search(query, limit)
+
+    def invalidate(self, dataset: str | None = None) -> None:
+        if dataset is None:
+            self._indexes = {}
+        else:
+            self._indexes.pop(dataset, None)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "datasets": {
+                dataset: {"version": version, "names": len(index)}
+                for dataset, (version, index) in self._indexes.items()
+            },
+            "latency": metrics.snapshot("autocomplete."),
+            **self._stats,
+        }
+
+
+autocomplete = AutocompleteEngine()
@@ -3,8 +3,9 @@ import logging
 import discord
 from discord.ext import commands
 
-from app.clients.redis.client import RedisClient
+from app.clients.redis import async_redis_client
 from app.config.settings import settings
+from app.utils.readiness import ReadinessState, readiness
 
 
 class JeffersonBot(commands.Bot):
@@ -22,7 +23,7 @@ class JeffersonBot(commands.Bot):
             case_insensitive=True,
         )
 
-        self.redis = RedisClient()
+        self.redis = async_redis_client
         self.logger = logging.getLogger("jefferson_bot")
 
     async def setup_hook(self):
@@ -55,6 +56,17 @@ class JeffersonBot(commands.Bot):
         self.logger.info(f"Bot is ready! Logged in as {self.user}")
         self.logger.info(f"Bot ID: {self.user.id}")
         self.logger.info(f"Connected to {len(self.guilds)} guilds")
+        readiness.set("bot", ReadinessState.READY, f"logged in as {self.user}")
+
+    async def on_command_completion(self, ctx: commands.Context):
+        readiness.command_served()
+
+    async def on_app_command_completion(
+        self,
+        interaction: discord.Interaction,
+        command: discord.app_commands.Command | discord.app_commands.ContextMenu,
+    ):
+        readiness.command_served()
 
     async def on_command_error(
         self, ctx: commands.Context, error: commands.CommandError
@@ -5,7 +5,8 @@ from dataclasses import dataclass
 import discord
 from discord.ext import commands
 
-from app.clients.warframe.worldstate.client import worldstate_client
+from app.bot.render_cache import render_cache
+from app.clients.warframe.worldstate.parsers.worldstate import WorldstateModel
 
 
 class Alerts(commands.Cog):
@@ -23,10 +24,7 @@ class Alerts(commands.Cog):
         """
         try:
             start = time.time()
-            worldstate = await worldstate_client.get_worldstate()
-            parsed_alerts = AlertsBuilder.parse_alerts(worldstate.alerts)
-
-            message = AlertsBuilder.build_alerts_message(parsed_alerts)
+            message = await render_cache.get("alerts", AlertsBuilder.render)
 
             processing_time = round((time.time() - start) * 1000)
             message["embed"].set_footer(text=f"Processing time: {processing_time}ms")
@@ -79,6 +77,12 @@ class ParsedAlert:
 
 
 class AlertsBuilder:
+    @staticmethod
+    def render(worldstate: WorldstateModel) -> dict:
+        return AlertsBuilder.build_alerts_message(
+            AlertsBuilder.parse_alerts(worldstate.alerts)
+        )
+
     @staticmethod
     def parse_alerts(worldstate_alerts) -> list[ParsedAlert]:
         parsed_alerts: list[ParsedAlert] = []
@@ -1,15 +1,13 @@
-import json
 import logging
-import re
 import time
 from dataclasses import dataclass
 
 import discord
 from discord.ext import commands
 
-from app.clients.redis import redis_client
 from app.clients.warframe.market.price_check import PriceCheck
-from app.config.settings import settings
+from app.clients.warframe.wiki.client import wiki_client
+from app.clients.warframe.wiki.models import Arcane as ArcaneModel
 
 
 class Arcane(commands.Cog):
@@ -74,63 +72,35 @@ class ArcaneBuilder:
         return {"embed": embed}
 
     @staticmethod
-    def _get_arcane_data() -> dict | None:
-        cached_data = redis_client.get(f"arcane:{settings.CACHE_VERSION}")
-        if not cached_data:
-            return None
-        return json.loads(cached_data).get("Arcanes")
-
-    @staticmethod
-    def _find_matching_arcane(
-        arcane_name: str, arcane_data: dict
-    ) -> tuple[str | None, dict | None]:
-        # exact match
-        for key, value in arcane_data.items():
-            if key.lower() == arcane_name.lower():
-                return key, value
-
-        # fuzzy match
-        for key, value in arcane_data.items():
-            if arcane_name.lower() in key.lower():
-                return key, value
-
-        return None, None
-
-    @staticmethod
-    def _build_stats(matching_arcane: dict) -> str:
-        criteria = ""
-        if matching_arcane.get("Criteria"):
-            criteria = f"{matching_arcane['Criteria']}:\n"
-        return f"{criteria}" + re.sub(
-            r"<br />", "\n", str(matching_arcane["Description"])
-        )
+    async def _get_arcane_data(
+        arcane_name: str,
+    ) -> tuple[str | None, ArcaneModel | None]:
+        return await wiki_client.find_arcane(arcane_name)
 
     @staticmethod
     async def build_arcane_message(arcane_name: str) -> dict:
         if not arcane_name:
             return ArcaneBuilder._error_message("Please provide an arcane name.")
 
-        arcane_data = ArcaneBuilder._get_arcane_data()
-        if not arcane_data:
-            return ArcaneBuilder._error_message(
-                "No data available. Please try again later."
-            )
-
-        matching_arcane_name, matching_arcane = ArcaneBuilder._find_matching_arcane(
-            arcane_name, arcane_data
+        matching_arcane_name, matching_arcane = await ArcaneBuilder._get_arcane_data(
+            arcane_name
         )
         if not matching_arcane or not matching_arcane_name:
             return ArcaneBuilder._error_message("No matching arcane found.")
 
         price_check = PriceCheck(item=matching_arcane_name)
         price_unranked = await price_check.check(rank=0)
-        price_ranked = await price_check.check(rank=matching_arcane.get("MaxRank"))
+        price_ranked = await price_check.check(rank=matching_arcane.max_rank)
 
         parsed = ParsedArcane(
             name=matching_arcane_name,
-            rarity=matching_arcane.get("Rarity", "Unknown"),
-            max_rank=matching_arcane.get("MaxRank", "Unknown"),
-            stats=ArcaneBuilder._build_stats(matching_arcane),
+            rarity=matching_arcane.rarity,
+            max_rank=(
+                matching_arcane.max_rank
+                if matching_arcane.max_rank is not None
+                else "Unknown"
+            ),
+            stats=matching_arcane.stats,
             price_unranked=price_unranked,
             price_ranked=price_ranked,
         )
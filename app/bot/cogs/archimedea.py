@@ -1,13 +1,16 @@
 import logging
 import time
 from dataclasses import dataclass
+from functools import partial
 from typing import Literal
 
 import discord
 from discord.ext import commands
 
+from app.bot.render_cache import render_cache
 from app.clients.warframe.worldstate.client import worldstate_client
 from app.clients.warframe.worldstate.parsers.archimedea import Archimedea
+from app.clients.warframe.worldstate.parsers.worldstate import WorldstateModel
 
 
 class WeeklyArchimedea(commands.Cog):
@@ -26,10 +29,9 @@ class WeeklyArchimedea(commands.Cog):
     async def archimedea(self, ctx: commands.Context, type: Literal["eta", "eda"]):
         try:
             start = time.time()
-            worldstate = await worldstate_client.get_worldstate()
-            eta, eda = ArchimedeaBuilder.parse(worldstate.conquests)
-
-            message = ArchimedeaBuilder.build_message(eta if type == "eta" else eda)
+            message = await render_cache.get(
+                f"archimedea:{type}", partial(ArchimedeaBuilder.render, type=type)
+            )
 
             processing_time = round((time.time() - start) * 1000)
             message["embed"].set_footer(
@@ -118,6 +120,11 @@ class ParsedArchimedea:
 
 
 class ArchimedeaBuilder:
+    @staticmethod
+    def render(worldstate: WorldstateModel, type: Literal["eta", "eda"]) -> dict:
+        eta, eda = ArchimedeaBuilder.parse(worldstate.conquests)
+        return ArchimedeaBuilder.build_message(eta if type == "eta" else eda)
+
     @staticmethod
     def parse(worldstate_archimedea: list[Archimedea]):
         eta_raw = filter(lambda a: a.type == "CT_HEX", worldstate_archimedea).__next__()
@@ -5,8 +5,9 @@ from dataclasses import dataclass
 import discord
 from discord.ext import commands
 
-from app.clients.warframe.worldstate.client import worldstate_client
+from app.bot.render_cache import render_cache
 from app.clients.warframe.worldstate.parsers.archon import ArchonHunt as ArchonHuntModel
+from app.clients.warframe.worldstate.parsers.worldstate import WorldstateModel
 
 
 class ArchonHunt(commands.Cog):
@@ -36,10 +37,7 @@ class ArchonHunt(commands.Cog):
         """
         try:
             start = time.time()
-            worldstate = await worldstate_client.get_worldstate()
-            parsed_archon = ArchonBuilder.parse_archon(worldstate.lite_sorties)
-
-            message = ArchonBuilder.build_archon_message(parsed_archon)
+            message = await render_cache.get("archon", ArchonBuilder.render)
 
             processing_time = round((time.time() - start) * 1000)
             message["embed"].set_footer(text=f"Processing time: {processing_time}ms")
@@ -82,6 +80,12 @@ class ParsedArchon:
 
 
 class ArchonBuilder:
+    @staticmethod
+    def render(worldstate: WorldstateModel) -> dict:
+        return ArchonBuilder.build_archon_message(
+            ArchonBuilder.parse_archon(worldstate.lite_sorties)
+        )
+
     @staticmethod
     def get_shard(boss: str):
         boss = boss.lower()
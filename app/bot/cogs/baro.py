@@ -5,8 +5,9 @@ from dataclasses import dataclass
 import discord
 from discord.ext import commands
 
-from app.clients.warframe.worldstate.client import worldstate_client
+from app.bot.render_cache import render_cache
 from app.clients.warframe.worldstate.parsers.baro import Baro as BaroModel
+from app.clients.warframe.worldstate.parsers.worldstate import WorldstateModel
 
 
 class Baro(commands.Cog):
@@ -26,10 +27,7 @@ class Baro(commands.Cog):
         """
         try:
             start = time.time()
-            worldstate = await worldstate_client.get_worldstate()
-            parsed_baro = BaroBuilder.parse(worldstate.void_traders)
-
-            message = BaroBuilder.build_message(parsed_baro)
+            message = await render_cache.get("baro", BaroBuilder.render)
 
             processing_time = round((time.time() - start) * 1000)
             # add latency footer to all embeds
@@ -141,6 +139,10 @@ class ParsedBaro:
 class BaroBuilder:
     items_per_page = 15  # discord limit on embed fields
 
+    @staticmethod
+    def render(worldstate: WorldstateModel) -> dict:
+        return BaroBuilder.build_message(BaroBuilder.parse(worldstate.void_traders))
+
     @staticmethod
     def parse(worldstate_baro: list[BaroModel]) -> ParsedBaro:
 
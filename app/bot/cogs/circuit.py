@@ -5,8 +5,9 @@ from dataclasses import dataclass
 import discord
 from discord.ext import commands
 
-from app.clients.warframe.worldstate.client import worldstate_client
+from app.bot.render_cache import render_cache
 from app.clients.warframe.worldstate.parsers.circuit import Circuit as CircuitModel
+from app.clients.warframe.worldstate.parsers.worldstate import WorldstateModel
 
 
 class Circuit(commands.Cog):
@@ -22,9 +23,7 @@ class Circuit(commands.Cog):
     async def circuit(self, ctx: commands.Context):
         try:
             start = time.time()
-            worldstate = await worldstate_client.get_worldstate()
-            parsed_circuit = CircuitBuilder.parse(worldstate.circuits)
-            message = CircuitBuilder.build_message(parsed_circuit)
+            message = await render_cache.get("circuit", CircuitBuilder.render)
             processing_time = round((time.time() - start) * 1000)
             embed = message["embed"]
             embed.set_footer(text=f"Processing time: {processing_time}ms")
@@ -54,6 +53,10 @@ class ParsedCircuit:
 
 
 class CircuitBuilder:
+    @staticmethod
+    def render(worldstate: WorldstateModel) -> dict:
+        return CircuitBuilder.build_message(CircuitBuilder.parse(worldstate.circuits))
+
     @staticmethod
     def parse(worldstate_circuit: list[CircuitModel]) -> ParsedCircuit:
         circuits = worldstate_circuit
@@ -5,8 +5,9 @@ from dataclasses import dataclass
 import discord
 from discord.ext import commands
 
-from app.clients.warframe.worldstate.client import worldstate_client
+from app.bot.render_cache import render_cache
 from app.clients.warframe.worldstate.parsers.darvo import Darvo as DarvoModel
+from app.clients.warframe.worldstate.parsers.worldstate import WorldstateModel
 
 
 class Darvo(commands.Cog):
@@ -26,10 +27,7 @@ class Darvo(commands.Cog):
         """
         try:
             start = time.time()
-            worldstate = await worldstate_client.get_worldstate()
-            parsed_darvo = DarvoBuilder.parse(worldstate.daily_deals)
-
-            message = DarvoBuilder.build_message(parsed_darvo)
+            message = await render_cache.get("darvo", DarvoBuilder.render)
 
             processing_time = round((time.time() - start) * 1000)
             embed = message["embed"]
@@ -75,6 +73,10 @@ class ParsedDarvo:
 
 
 class DarvoBuilder:
+    @staticmethod
+    def render(worldstate: WorldstateModel) -> dict:
+        return DarvoBuilder.build_message(DarvoBuilder.parse(worldstate.daily_deals))
+
     @staticmethod
     def parse(worldstate_darvo: list[DarvoModel]) -> ParsedDarvo:
         darvo = worldstate_darvo[0]
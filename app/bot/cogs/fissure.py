@@ -1,16 +1,18 @@
 import logging
 import time
 from dataclasses import dataclass
+from functools import partial
 from typing import Literal
 
 import discord
 from discord.ext import commands
 
-from app.clients.warframe.worldstate.client import worldstate_client
+from app.bot.render_cache import render_cache
 from app.clients.warframe.worldstate.parsers.fissure import Fissure as FissureModel
 from app.clients.warframe.worldstate.parsers.voidstorm import (
     VoidStorm as VoidStormModel,
 )
+from app.clients.warframe.worldstate.parsers.worldstate import WorldstateModel
 
 
 class Fissure(commands.Cog):
@@ -30,7 +32,6 @@ class Fissure(commands.Cog):
         """
         try:
             start = time.time()
-            worldstate = await worldstate_client.get_worldstate()
             if fissure_type.lower() not in ["sp", "rj", ""]:
                 embed = discord.Embed(
                     color=discord.Color.red(),
@@ -39,14 +40,11 @@ class Fissure(commands.Cog):
                 )
                 await ctx.send(embed=embed)
                 return
-            parsed_alerts = FissureBuilder.parse(
-                starchart=worldstate.active_missions,
-                railjack=worldstate.void_storms,
-                fissure_type=fissure_type.lower(),
+            message = await render_cache.get(
+                f"fissure:{fissure_type.lower()}",
+                partial(FissureBuilder.render, fissure_type=fissure_type.lower()),
             )
 
-            message = FissureBuilder.build_message(parsed_alerts, fissure_type.lower())
-
             processing_time = round((time.time() - start) * 1000)
             message["embed"].set_footer(
                 text=f"Valid fissure types are: rj (Railjack), sp (Steel Path), <empty> (Normal)\nProcessing time: {processing_time}ms"
@@ -83,6 +81,17 @@ class ParsedFissure:
 
 
 class FissureBuilder:
+    @staticmethod
+    def render(
+        worldstate: WorldstateModel, fissure_type: Literal["sp", "rj", ""]
+    ) -> dict:
+        parsed_fissures = FissureBuilder.parse(
+            starchart=worldstate.active_missions,
+            railjack=worldstate.void_storms,
+            fissure_type=fissure_type,
+        )
+        return FissureBuilder.build_message(parsed_fissures, fissure_type)
+
     @staticmethod
     def parse(
         starchart: list[FissureModel],
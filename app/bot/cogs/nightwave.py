@@ -5,10 +5,11 @@ from dataclasses import dataclass
 import discord
 from discord.ext import commands
 
-from app.clients.warframe.worldstate.client import worldstate_client
+from app.bot.render_cache import render_cache
 from app.clients.warframe.worldstate.parsers.nightwave import (
     Nightwave as NightwaveModel,
 )
+from app.clients.warframe.worldstate.parsers.worldstate import WorldstateModel
 
 
 class Nightwave(commands.Cog):
@@ -34,9 +35,7 @@ class Nightwave(commands.Cog):
     async def nightwave(self, ctx: commands.Context):
         try:
             start = time.time()
-            worldstate = await worldstate_client.get_worldstate()
-            parsed_nightwave = NightwaveBuilder.parse(worldstate.season_info)
-            message = NightwaveBuilder.build_message(parsed_nightwave)
+            message = await render_cache.get("nightwave", NightwaveBuilder.render)
             processing_time = round((time.time() - start) * 1000)
             embed = message["embed"]
             embed.set_footer(text=f"Latency: {processing_time}ms")
@@ -77,6 +76,12 @@ class ParsedNightwave:
 
 
 class NightwaveBuilder:
+    @staticmethod
+    def render(worldstate: WorldstateModel) -> dict:
+        return NightwaveBuilder.build_message(
+            NightwaveBuilder.parse(worldstate.season_info)
+        )
+
     @staticmethod
     def parse(worldstate_nightwave: NightwaveModel) -> ParsedNightwave:
         challenges = [
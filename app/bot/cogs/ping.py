@@ -15,7 +15,8 @@ class Ping(commands.Cog):
         """Check if the bot is responsive."""
         try:
             # Test Redis connection
-            self.bot.redis.client.ping()
+            if not await self.bot.redis.ping():
+                raise ConnectionError("no PONG from Redis")
             status = "✅ All systems operational"
         except Exception as e:
             self.logger.error(f"Redis ping failed: {str(e)}")
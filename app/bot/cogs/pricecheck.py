@@ -3,17 +3,18 @@ import json
 import logging
 import re
 import time
+from dataclasses import dataclass
 
 import discord
 from discord.ext import commands
-from Levenshtein import distance
 from openai import OpenAI
 from pydantic import BaseModel, ValidationError
-from warframe_market.client import WarframeMarketClient
 from warframe_market.models.item import ItemShortModel
 
+from app.clients.warframe.market.client import market_client
 from app.clients.warframe.market.price_check import PriceCheck
 from app.config.settings import settings
+from app.utils.fuzzy import FuzzyIndex
 
 logger = logging.getLogger(__name__)
 
@@ -98,7 +99,12 @@ class ItemValidator:
     _instance = None
     _cached_items: list[ItemShortModel] | None = None
     _cached_time: float = 0
+    _index: FuzzyIndex[ItemShortModel] | None = None
+    # the item list being fetched, shared by every caller while it loads
+    _loading: asyncio.Task | None = None
     _CACHE_TTL = 60 * 60 * 2
+    # scraped names scoring below this are treated as misreads and dropped
+    _MIN_SCORE = 0.5
 
     def __new__(cls):
         if cls._instance is None:
@@ -106,17 +112,26 @@ class ItemValidator:
         return cls._instance
 
     async def _get_all_market_items(self) -> list[ItemShortModel] | None:
-        now = time.time()
         if (
             self._cached_items is not None
-            and (now - self._cached_time) < self._CACHE_TTL
+            and (time.time() - self._cached_time) < self._CACHE_TTL
         ):
             return self._cached_items
+        if self._loading is None or self._loading.done():
+            self._loading = asyncio.create_task(self._load_market_items())
+        # shielded so a cancelled caller does not cancel it for the others
+        return await asyncio.shield(self._loading)
+
+    async def _load_market_items(self) -> list[ItemShortModel] | None:
+        now = time.time()
         try:
-            client = WarframeMarketClient()
-            response = await client.get_all_items()
+            response = await market_client.get_all_items()
             self._cached_items = list(response.data)
             self._cached_time = now
+            self._index = FuzzyIndex(
+                (item, (item.slug, *(i18n.name for i18n in item.i18n.values())))
+                for item in self._cached_items
+            )
             return self._cached_items
         except Exception as e:
             logger.error(f"Error fetching items: {e}")
@@ -124,24 +139,111 @@ class ItemValidator:
 
     async def validate_items(self, items: list[str]) -> list[ItemShortModel]:
         all_items = await self._get_all_market_items()
-        if not all_items:
+        if not all_items or self._index is None:
             return []
 
         valid_items: list[ItemShortModel] = []
         for item in items:
-            item_slug = "_".join(item.lower().strip().split(" "))
-            closest_match: ItemShortModel | None = None
-            closest_distance = float("inf")
-            for market_item in all_items:
-                dist = distance(item_slug, market_item.slug)
-                if dist < closest_distance:
-                    closest_distance = dist
-                    closest_match = market_item
-            if closest_match:
-                valid_items.append(closest_match)
+            match = self._index.best(item, min_score=self._MIN_SCORE)
+            if match:
+                valid_items.append(match.item)
+            else:
+                logger.info(f"No market item close enough to {item!r}")
         return valid_items
 
 
+@dataclass
+class StageTiming:
+    # seconds since the pipeline started, from the first job to the last
+    started: float | None = None
+    finished: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or self.started) - self.started
+
+
+class PriceCheckPipeline:
+    """
+    Screenshot price check as a staged pipeline.
+
+    Screenshots are scraped a few at a time, the names of each are matched
+    to market items and deduplicated as soon as it is read, and every new
+    item is priced right away through the shared market order cache. Each
+    stage has its own concurrency limit, results are available while the
+    pipeline runs and every stage records when it was busy.
+    """
+
+    STAGES = ("scrape", "match", "price")
+
+    def __init__(self, scraper: ScreenshotScraper, validator: ItemValidator):
+        self.scraper = scraper
+        self.validator = validator
+        self.items: list[ItemShortModel] = []
+        self.results: list[tuple[ItemShortModel, list[int]]] = []
+        self.scraped = 0
+        self.timings = {stage: StageTiming() for stage in self.STAGES}
+        self._seen: set[str] = set()
+        self._started = 0.0
+        self._scrape_limit = asyncio.Semaphore(settings.PRICECHECK_SCRAPE_CONCURRENCY)
+        self._match_limit = asyncio.Semaphore(settings.PRICECHECK_MATCH_CONCURRENCY)
+        self._price_limit = asyncio.Semaphore(settings.PRICECHECK_PRICE_CONCURRENCY)
+        self._prices: list[asyncio.Task] = []
+
+    def _start(self, stage: str) -> None:
+        timing = self.timings[stage]
+        if timing.started is None:
+            timing.started = time.perf_counter() - self._started
+
+    def _finish(self, stage: str) -> None:
+        self.timings[stage].finished = time.perf_counter() - self._started
+
+    async def run(
+        self, image_urls: list[str]
+    ) -> list[tuple[ItemShortModel, list[int]]]:
+        self._started = time.perf_counter()
+        await asyncio.gather(*(self._scrape(url) for url in image_urls))
+        await asyncio.gather(*self._prices)
+        return self.results
+
+    async def _scrape(self, image_url: str) -> None:
+        async with self._scrape_limit:
+            self._start("scrape")
+            scraped = await self.scraper.scrape(image_url)
+            self._finish("scrape")
+        self.scraped += 1
+        if scraped is None:
+            return
+
+        async with self._match_limit:
+            self._start("match")
+            matched = await self.validator.validate_items(scraped.items)
+            for item in matched:
+                if item.slug not in self._seen:
+                    self._seen.add(item.slug)
+                    self.items.append(item)
+                    self._prices.append(asyncio.create_task(self._price(item)))
+            self._finish("match")
+
+    async def _price(self, item: ItemShortModel) -> None:
+        async with self._price_limit:
+            self._start("price")
+            try:
+                price_list = await PriceCheck(item=item.slug).check_raw()
+                self.results.append((item, price_list))
+            except Exception as e:
+                logger.error(f"Error checking price for {item.i18n['en'].name}: {e}")
+            finally:
+                self._finish("price")
+
+    def format_timings(self) -> str:
+        return " | ".join(
+            f"{stage} {self.timings[stage].elapsed:.1f}s" for stage in self.STAGES
+        )
+
+
 class PriceCheckPaginationView(discord.ui.View):
     def __init__(
         self, pages: list[discord.Embed], author_id: int, *, timeout: float = 180
@@ -153,6 +255,11 @@ class PriceCheckPaginationView(discord.ui.View):
         self.message: discord.Message | None = None
         self._update_buttons()
 
+    def set_pages(self, pages: list[discord.Embed]):
+        self.pages = pages
+        self.index = min(self.index, len(pages) - 1)
+        self._update_buttons()
+
     def _update_buttons(self):
         self.prev_button.disabled = self.index <= 0
         self.next_button.disabled = self.index >= (len(self.pages) - 1)
@@ -237,85 +344,121 @@ class Pricecheck(commands.Cog):
             return
 
         async with ctx.typing():
-            valid_items: list[ItemShortModel] = []
-            seen_slugs: set[str] = set()
+            pipeline = PriceCheckPipeline(self.scraper, self.validator)
+            task = asyncio.create_task(
+                pipeline.run([image.url for image in valid_images])
+            )
+            status_msg = await ctx.send(
+                f"Reading {len(valid_images)} screenshot(s)..."
+            )
 
-            for image in valid_images:
-                scraped = await self.scraper.scrape(image.url)
-                if scraped is None:
+            view: PriceCheckPaginationView | None = None
+            rendered = None
+            while not task.done():
+                await asyncio.wait({task}, timeout=settings.PRICECHECK_RENDER_INTERVAL)
+                progress = (
+                    pipeline.scraped,
+                    len(pipeline.items),
+                    len(pipeline.results),
+                )
+                if task.done() or progress == rendered or not pipeline.items:
                     continue
+                rendered = progress
+                view = await self._render(ctx, status_msg, view, pipeline, start)
+            await task
 
-                items = await self.validator.validate_items(scraped.items)
-                for item in items:
-                    if item.slug not in seen_slugs:
-                        valid_items.append(item)
-                        seen_slugs.add(item.slug)
-
-            if not valid_items:
+            if not pipeline.items:
                 embed = discord.Embed(
                     color=discord.Color.red(),
                     description="No valid items found in the screenshots.",
                 )
-                await ctx.send(embed=embed)
+                await status_msg.edit(content="", embed=embed)
                 return
 
-            status_msg = await ctx.send(
-                f"Found {len(valid_items)} items. Doing Price checks..."
-            )
+            await self._render(ctx, status_msg, view, pipeline, start, done=True)
 
-            items_with_price: list[tuple[ItemShortModel, list[int]]] = []
-            for i, item in enumerate(valid_items):
-                try:
-                    price_check = PriceCheck(item=item.slug)
-                    price_list = await price_check.check_raw()
-                    items_with_price.append((item, price_list))
-                except Exception as e:
-                    logger.error(
-                        f"Error checking price for {item.i18n['en'].name}: {e}"
-                    )
-
-                if (i + 1) % 3 == 0:
-                    await asyncio.sleep(1)
-                    await status_msg.edit(
-                        content=f"Found {len(valid_items)} items. Doing Price checks... ({i + 1}/{len(valid_items)})"
-                    )
-
-            items_with_price.sort(
-                key=lambda x: (
-                    x[1][0] if x[1] else 0,
-                    sum(x[1]) / len(x[1]) if x[1] else 0,
-                ),
-                reverse=True,
+    @staticmethod
+    async def _render(
+        ctx: commands.Context,
+        status_msg: discord.Message,
+        view: PriceCheckPaginationView | None,
+        pipeline: PriceCheckPipeline,
+        start: float,
+        done: bool = False,
+    ) -> PriceCheckPaginationView | None:
+        """Show the prices found so far, the pages fill in as they arrive."""
+        pages = PricecheckBuilder.build_pages(pipeline, time.time() - start, done)
+        content = (
+            ""
+            if done
+            else f"Found {len(pipeline.items)} items. Doing Price checks... "
+            f"({len(pipeline.results)}/{len(pipeline.items)})"
+        )
+        if not pages and done:
+            # every price check failed, say so rather than blanking the message
+            embed = discord.Embed(
+                color=discord.Color.red(),
+                description=f"No prices found for the {len(pipeline.items)} "
+                "items in the screenshots.",
             )
+            await status_msg.edit(content="", embed=embed, view=None)
+            return view
+        if not pages:
+            await status_msg.edit(content=content)
+            return view
 
-            total_items = len(items_with_price)
-            per_page = 20
-            pages: list[discord.Embed] = []
-            elapsed = int(time.time() - start)
-
-            for page_index in range(0, total_items, per_page):
-                page_items = items_with_price[page_index : page_index + per_page]
-                item_text = f"Found {total_items} items in the screenshot:\n"
-                for item, prices in page_items:
-                    price_text = PriceCheck.format_output(prices)
-                    item_text += f"- {item.i18n['en'].name}: {price_text}\n"
-
-                page_num = (page_index // per_page) + 1
-                total_pages = (total_items + per_page - 1) // per_page
-                page_embed = discord.Embed(
-                    title="Price Check", color=discord.Color.blue()
-                )
-                page_embed.description = item_text
-                page_embed.set_footer(
-                    text=f"Page {page_num}/{total_pages} \u2022 Processed in {elapsed} seconds"
-                )
-                pages.append(page_embed)
-
-            if pages:
-                view = PriceCheckPaginationView(pages=pages, author_id=ctx.author.id)
-                await status_msg.edit(content="", embed=pages[0], view=view)
-                view.message = status_msg
+        if view is None:
+            view = PriceCheckPaginationView(pages=pages, author_id=ctx.author.id)
+            view.message = status_msg
+        else:
+            view.set_pages(pages)
+        await status_msg.edit(content=content, embed=pages[view.index], view=view)
+        return view
 
 
 async def setup(bot):
     await bot.add_cog(Pricecheck(bot))
+
+
+class PricecheckBuilder:
+    per_page = 20
+
+    @staticmethod
+    def build_pages(
+        pipeline: PriceCheckPipeline, elapsed: float, done: bool
+    ) -> list[discord.Embed]:
+        items_with_price = sorted(
+            pipeline.results,
+            key=lambda x: (
+                x[1][0] if x[1] else 0,
+                sum(x[1]) / len(x[1]) if x[1] else 0,
+            ),
+            reverse=True,
+        )
+
+        total_items = len(items_with_price)
+        per_page = PricecheckBuilder.per_page
+        total_pages = (total_items + per_page - 1) // per_page
+        status = (
+            f"Processed in {elapsed:.0f} seconds"
+            if done
+            else f"Checked {total_items}/{len(pipeline.items)} so far"
+        )
+
+        pages: list[discord.Embed] = []
+        for page_index in range(0, total_items, per_page):
+            page_items = items_with_price[page_index : page_index + per_page]
+            item_text = f"Found {len(pipeline.items)} items in the screenshot:\n"
+            for item, prices in page_items:
+                price_text = PriceCheck.format_output(prices)
+                item_text += f"- {item.i18n['en'].name}: {price_text}\n"
+
+            page_num = (page_index // per_page) + 1
+            page_embed = discord.Embed(title="Price Check", color=discord.Color.blue())
+            page_embed.description = item_text
+            page_embed.set_footer(
+                text=f"Page {page_num}/{total_pages} \u2022 {status}"
+                f" \u2022 {pipeline.format_timings()}"
+            )
+            pages.append(page_embed)
+        return pages
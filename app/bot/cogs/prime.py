@@ -4,8 +4,10 @@ import time
 import discord
 from discord.ext import commands
 
+from app.bot.autocomplete import autocomplete
 from app.clients.warframe.market.price_check import PriceCheck
 from app.clients.warframe.wiki.client import wiki_client
+from app.clients.warframe.wiki.snapshot import wiki_snapshot_store
 
 
 class Prime(commands.Cog):
@@ -42,13 +44,13 @@ class Prime(commands.Cog):
     async def prime_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> list[discord.app_commands.Choice[str]]:
-        names = wiki_client.get_prime_names()
-        matches = [
-            discord.app_commands.Choice(name=key, value=key)
-            for key in names
-            if current.lower() in key.lower()
-        ]
-        return matches[:24]
+        names = await autocomplete.search(
+            "primes",
+            await wiki_snapshot_store.current_version(),
+            wiki_client.get_prime_names,
+            current,
+        )
+        return [discord.app_commands.Choice(name=name, value=name) for name in names]
 
 
 async def setup(bot):
@@ -73,33 +75,31 @@ class PrimeBuilder:
         if "forma" in part.lower():
             return PrimeBuilder._error_message("Forma is not implemented for now")
 
-        void_data = wiki_client.get_void_data()
+        void_data = await wiki_client.get_void_data()
         if not void_data:
             return PrimeBuilder._error_message(
                 "No data available. Please try again later."
             )
 
-        relics = void_data.get("RelicData", {})
+        relics = void_data.relic_data
         parsed = wiki_client.parse_prime_input(part)
         if not parsed:
             return PrimeBuilder._error_message("Invalid input format.")
 
         item_name, part_name = parsed
 
-        prime_key, prime_dict = wiki_client.find_prime(item_name)
-        if not prime_dict:
+        prime_key, prime = await wiki_client.find_prime(item_name)
+        if not prime:
             item_name = part.split()[0]
-            prime_key, prime_dict = wiki_client.find_prime(item_name)
-            if not prime_dict:
+            prime_key, prime = await wiki_client.find_prime(item_name)
+            if not prime:
                 return PrimeBuilder._error_message(
                     "Did not find the prime item!"
                 )
             part_name = " ".join(part.split()[1:])
 
-        part_key, part_dict = wiki_client.find_prime_part(
-            prime_dict, part_name
-        )
-        if not part_dict:
+        part_key, prime_part = wiki_client.find_prime_part(prime, part_name)
+        if not prime_part:
             return PrimeBuilder._error_message(
                 f"Did not find the part for {prime_key}!"
             )
@@ -112,14 +112,9 @@ class PrimeBuilder:
             display_item += f" {display_part}"
 
         lines = []
-        drops = part_dict.get("Drops", {})
-        for relic_name, rarity in drops.items():
-            relic_info = relics.get(relic_name, {})
-            info = ""
-            if relic_info.get("IsBaro"):
-                info = "(B)"
-            elif relic_info.get("Vaulted"):
-                info = "(V)"
+        for relic_name, rarity in prime_part.drops.items():
+            relic = relics.get(relic_name)
+            info = relic.tag if relic else ""
             lines.append(f"`{info:3} {relic_name} - {rarity}`")
 
         price_name = display_item.strip()
@@ -1,13 +1,22 @@
-import asyncio
 import logging
 import time
+from datetime import datetime
+from typing import Literal
 
 import discord
 from discord.ext import commands
-from warframe_market.common import Subtype
+from pytz import UTC
 
+from app.bot.autocomplete import autocomplete
 from app.clients.warframe.market.price_check import PriceCheck
+from app.clients.warframe.market.prime_sets import (
+    PrimeSetValue,
+    prime_set_store,
+    value_prime_set,
+)
+from app.clients.warframe.market.scheduler import Priority
 from app.clients.warframe.wiki.client import wiki_client
+from app.clients.warframe.wiki.snapshot import wiki_snapshot_store
 
 
 class Pset(commands.Cog):
@@ -44,13 +53,42 @@ class Pset(commands.Cog):
     async def pset_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> list[discord.app_commands.Choice[str]]:
-        names = wiki_client.get_prime_names()
-        matches = [
-            discord.app_commands.Choice(name=key, value=key)
-            for key in names
-            if current.lower() in key.lower()
-        ]
-        return matches[:24]
+        names = await autocomplete.search(
+            "primes",
+            await wiki_snapshot_store.current_version(),
+            wiki_client.get_prime_names,
+            current,
+        )
+        return [discord.app_commands.Choice(name=name, value=name) for name in names]
+
+    @commands.hybrid_command(
+        name="psets",
+        with_app_command=True,
+        description="Prime sets ranked by how much more their parts sell for",
+    )
+    async def psets(
+        self,
+        ctx: commands.Context,
+        sort: Literal["spread", "ducats", "set_price", "parts_price"] = "spread",
+    ):
+        start = time.time()
+
+        try:
+            message = await PsetBuilder.build_psets_message(sort)
+            if "embed" in message:
+                processing_time = round((time.time() - start) * 1000)
+                message["embed"].set_footer(
+                    text=f"Processing time: {processing_time}ms"
+                )
+            await ctx.send(**message)
+        except Exception as e:
+            self.logger.error(f"Error in psets command: {str(e)}")
+            embed = discord.Embed(
+                color=discord.Color.red(),
+                title="Error",
+                description="Failed to rank prime sets. Please try again later.",
+            )
+            await ctx.send(embed=embed)
 
 
 async def setup(bot):
@@ -58,6 +96,10 @@ async def setup(bot):
 
 
 class PsetBuilder:
+    platinum = PriceCheck.platinum
+    ducat = "<:Ducat:967433339868950638>"
+    limit = 15
+
     @staticmethod
     def _error_message(description: str) -> dict:
         embed = discord.Embed(
@@ -66,66 +108,85 @@ class PsetBuilder:
         return {"embed": embed}
 
     @staticmethod
-    async def _fetch_price(
-        price_checker: PriceCheck, part_key: str, returns_dict: dict
-    ):
-        try:
-            result = await price_checker.check(subtype=Subtype.BLUEPRINT)
-            returns_dict[part_key] = result
-        except Exception:
-            returns_dict[part_key] = "(failed)"
+    def _price(price: float | None) -> str:
+        return f"{price:g}{PsetBuilder.platinum}" if price is not None else "(N/A)"
+
+    @staticmethod
+    async def _get_value(prime_key: str) -> PrimeSetValue:
+        """The cached valuation, priced right away for sets not valued yet."""
+        await prime_set_store.touch(prime_key)
+        value = await prime_set_store.get(prime_key)
+        if value is None:
+            value = await value_prime_set(prime_key, priority=Priority.INTERACTIVE)
+            await prime_set_store.save([value])
+        return value
 
     @staticmethod
     async def build_pset_message(prime_set: str) -> dict:
         if not prime_set:
-            return PsetBuilder._error_message(
-                "Be sure to provide a prime name"
-            )
+            return PsetBuilder._error_message("Be sure to provide a prime name")
 
         if "forma" in prime_set.lower():
-            return PsetBuilder._error_message(
-                "Why would you search forma"
-            )
+            return PsetBuilder._error_message("Why would you search forma")
 
-        prime_key, _ = wiki_client.find_prime(prime_set)
+        prime_key, _ = await wiki_client.find_prime(prime_set)
         if not prime_key:
             return PsetBuilder._error_message(
                 "Did not find any primes with that name"
             )
 
-        try:
-            set_name = f"{prime_key} set"
-            set_price_checker = PriceCheck(item=set_name)
-            pieces = await set_price_checker.get_set_pieces()
-        except Exception:
-            set_price_checker = PriceCheck(item=prime_key)
-            pieces = await set_price_checker.get_set_pieces()
-
-        returns: dict[str, str] = {}
-        await asyncio.gather(
-            *[
-                PsetBuilder._fetch_price(
-                    PriceCheck(item=data["slug"]), piece, returns
-                )
-                for piece, data in pieces.items()
-            ]
-        )
-
-        set_piece = next(x for x in pieces.items() if x[1]["set"])
-        pieces.pop(set_piece[0])
+        value = await PsetBuilder._get_value(prime_key)
 
         text_lines = []
-        for part_name, data in pieces.items():
-            part_display = part_name.replace(prime_key, "").strip()
-            quantity = data["quantity"]
-            text_lines.append(
-                f"{quantity}\u00d7 {part_display}: {returns.get(part_name, '(N/A)')}"
-            )
-
-        set_price = f"Full set: {returns.get(set_piece[0], '(N/A)')}"
+        for part in value.parts:
+            part_display = part.name.replace(prime_key, "").strip()
+            price = PsetBuilder._price(part.price)
+            text_lines.append(f"{part.quantity}\u00d7 {part_display}: {price}")
+
+        summary = [
+            f"Full set: {PsetBuilder._price(value.set_price)}",
+            f"Parts: {PsetBuilder._price(value.parts_price)}",
+        ]
+        if value.spread is not None:
+            summary.append(f"Parts vs set: {value.spread:+g}{PsetBuilder.platinum}")
+        summary.append(f"Ducats: {value.ducats}{PsetBuilder.ducat}")
 
+        # the timestamp shows when the set was priced
         embed = discord.Embed(
-            description=set_price + "\n\n" + "\n".join(text_lines),
+            description="\n".join(summary) + "\n\n" + "\n".join(text_lines),
             title=prime_key,
+            timestamp=datetime.fromtimestamp(value.updated_at, tz=UTC),
         )
-        return {"embed": embed}
\ No newline at end of file
+        return {"embed": embed}
+
+    @staticmethod
+    async def build_psets_message(sort: str) -> dict:
+        values = await prime_set_store.ranking(sort, PsetBuilder.limit)
+        if not values:
+            return PsetBuilder._error_message(
+                "Prime sets are not valued yet, try again later."
+            )
+
+        lines = []
+        for position, value in enumerate(values, start=1):
+            set_price = PsetBuilder._price(value.set_price)
+            parts_price = PsetBuilder._price(value.parts_price)
+            line = f"{position}. **{value.name}**: set {set_price}, parts {parts_price}"
+            if value.spread is not None:
+                line += f" ({value.spread:+g})"
+            if sort == "ducats" and value.ducats_per_platinum is not None:
+                line += f", {value.ducats_per_platinum:g}{PsetBuilder.ducat}/plat"
+            lines.append(line)
+
+        titles = {
+            "spread": "Best prime sets to sell as parts",
+            "ducats": "Prime sets with the most ducats per platinum",
+            "set_price": "Most valuable prime sets",
+            "parts_price": "Prime sets with the most valuable parts",
+        }
+        embed = discord.Embed(
+            title=titles[sort],
+            color=discord.Colour.gold(),
+            description="\n".join(lines),
+        )
+        return {"embed": embed}
@@ -5,8 +5,11 @@ import time
 import discord
 from discord.ext import commands
 
+from app.bot.autocomplete import autocomplete
 from app.clients.warframe.market.price_check import PriceCheck
+from app.clients.warframe.market.relic_value import relic_value_store
 from app.clients.warframe.wiki.client import wiki_client
+from app.clients.warframe.wiki.snapshot import wiki_snapshot_store
 
 
 class Relic(commands.Cog):
@@ -43,13 +46,13 @@ class Relic(commands.Cog):
     async def relic_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> list[discord.app_commands.Choice[str]]:
-        names = wiki_client.get_relic_names()
-        matches = [
-            discord.app_commands.Choice(name=key, value=key)
-            for key in names
-            if current.lower() in key.lower()
-        ]
-        return matches[:24]
+        names = await autocomplete.search(
+            "relics",
+            await wiki_snapshot_store.current_version(),
+            wiki_client.get_relic_names,
+            current,
+        )
+        return [discord.app_commands.Choice(name=name, value=name) for name in names]
 
 
 async def setup(bot):
@@ -84,35 +87,18 @@ class RelicBuilder:
                 "Please provide a relic to check."
             )
 
-        void_data = wiki_client.get_void_data()
-        if not void_data:
-            return RelicBuilder._error_message(
-                "No data available. Please try again later."
-            )
-
-        relics = void_data.get("RelicData", {})
-        relic_key = None
-        for key in relics:
-            if key.lower() == relic_name.lower():
-                relic_key = key
-                break
-
-        if not relic_key:
+        relic_key, relic = await wiki_client.find_relic(relic_name)
+        if not relic_key or relic is None:
             return RelicBuilder._error_message(
                 "This relic doesn't exist! \nCheck if you typed it correctly."
             )
 
-        relic_data = relics[relic_key]
-        drops = relic_data.get("Drops", [])
+        drops = relic.drops
 
         relic_check = PriceCheck(item=relic_key + " relic")
         price = await relic_check.check_with_quantity()
 
-        info = ""
-        if relic_data.get("IsBaro"):
-            info = "(B) "
-        elif relic_data.get("Vaulted"):
-            info = "(V) "
+        info = f"{relic.tag} " if relic.tag else ""
 
         embed = discord.Embed(
             title=f"{info}{relic_key}\n",
@@ -125,7 +111,7 @@ class RelicBuilder:
         for x in range(min(6, len(drops))):
             returns[x] = {}
             drop = drops[x]
-            name = drop["Item"] + " " + drop["Part"]
+            name = drop.name
             returns[x]["name"] = name
             price_checker = PriceCheck(item=name)
             task = asyncio.create_task(
@@ -155,4 +141,16 @@ class RelicBuilder:
                 inline=False,
             )
 
+        value = await relic_value_store.relic(relic_key)
+        if value is not None:
+            platinum = PriceCheck.platinum
+            embed.add_field(
+                name="Expected value",
+                value=f"Intact solo: {value.value('intact', 'solo', 'platinum'):g}"
+                f"{platinum}\n"
+                f"Radiant radshare: "
+                f"{value.value('radiant', 'radshare', 'platinum'):g}{platinum}",
+                inline=False,
+            )
+
         return {"embed": embed}
\ No newline at end of file
@@ -0,0 +1,116 @@
+import logging
+import time
+from datetime import datetime
+from typing import Literal
+
+import discord
+from discord.ext import commands
+from pytz import UTC
+
+from app.clients.warframe.market.relic_value import RelicValue, relic_value_store
+
+Refinement = Literal["intact", "exceptional", "flawless", "radiant"]
+Mode = Literal["solo", "radshare"]
+Currency = Literal["platinum", "ducats"]
+
+
+class RelicEV(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.logger = logging.getLogger(__name__)
+
+    @commands.hybrid_command(
+        name="relicev",
+        with_app_command=True,
+        description="Rank relics by the platinum or ducats they are expected to give",
+        aliases=["relicvalue", "bestrelic"],
+    )
+    async def relicev(
+        self,
+        ctx: commands.Context,
+        refinement: Refinement = "radiant",
+        mode: Mode = "radshare",
+        currency: Currency = "platinum",
+        vaulted: bool = True,
+    ):
+        start = time.time()
+
+        try:
+            message = await RelicEVBuilder.build_message(
+                refinement, mode, currency, vaulted
+            )
+            if "embed" in message:
+                processing_time = round((time.time() - start) * 1000)
+                message["embed"].set_footer(
+                    text=f"Processing time: {processing_time}ms"
+                )
+            await ctx.send(**message)
+        except Exception as e:
+            self.logger.error(f"Error in relicev command: {str(e)}")
+            embed = discord.Embed(
+                color=discord.Color.red(),
+                title="Error",
+                description="Failed to rank relics. Please try again later.",
+            )
+            await ctx.send(embed=embed)
+
+
+async def setup(bot):
+    await bot.add_cog(RelicEV(bot))
+
+
+class RelicEVBuilder:
+    platinum_emoji = "<:Platinum:992917150358589550>"
+    ducats_emoji = "<:Ducat:967433339868950638>"
+    limit = 15
+
+    @staticmethod
+    def _error_message(description: str) -> dict:
+        embed = discord.Embed(
+            color=discord.Color.red(), title="Error", description=description
+        )
+        return {"embed": embed}
+
+    @staticmethod
+    def format_relic(
+        relic: RelicValue, refinement: str, mode: str, currency: str
+    ) -> str:
+        emoji = (
+            RelicEVBuilder.platinum_emoji
+            if currency == "platinum"
+            else RelicEVBuilder.ducats_emoji
+        )
+        value = relic.value(refinement, mode, currency)
+        tag = " (V)" if relic.vaulted else " (B)" if relic.is_baro else ""
+        line = f"**{relic.relic}**{tag}: {value:g}{emoji}"
+        if relic.price is not None:
+            line += f" · relic {relic.price:g}{RelicEVBuilder.platinum_emoji}"
+        return line
+
+    @staticmethod
+    async def build_message(
+        refinement: str, mode: str, currency: str, vaulted: bool
+    ) -> dict:
+        values = await relic_value_store.get()
+        if values is None:
+            return RelicEVBuilder._error_message(
+                "Relic values are not computed yet, try again later."
+            )
+
+        relics = await relic_value_store.ranking(
+            refinement, mode, currency, RelicEVBuilder.limit, include_vaulted=vaulted
+        )
+        lines = [
+            f"{position}. "
+            + RelicEVBuilder.format_relic(relic, refinement, mode, currency)
+            for position, relic in enumerate(relics, start=1)
+        ]
+
+        # the timestamp shows when the prices were taken
+        embed = discord.Embed(
+            title=f"Best {refinement} relics for {currency} ({mode})",
+            color=discord.Colour.gold(),
+            description="\n".join(lines) or "No relics found.",
+            timestamp=datetime.fromtimestamp(values.prices_taken_at, tz=UTC),
+        )
+        return {"embed": embed}
@@ -4,6 +4,7 @@ import time
 import discord
 from discord.ext import commands
 
+from app.bot.autocomplete import autocomplete
 from app.clients.warframe.market.riven_cache import riven_cache
 from app.clients.warframe.market.riven_client import riven_client
 
@@ -42,13 +43,12 @@ class Riven(commands.Cog):
     async def riven_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> list[discord.app_commands.Choice[str]]:
-        names = await riven_cache.get_weapon_names()
-        matches = [
-            discord.app_commands.Choice(name=name, value=name)
-            for name in names
-            if current.lower() in name.lower()
-        ]
-        return matches[:24]
+        # refreshes the weapons first when they expired
+        await riven_cache.get_weapon_names()
+        names = await autocomplete.search(
+            "riven_weapons", riven_cache.version, riven_cache.get_weapon_names, current
+        )
+        return [discord.app_commands.Choice(name=name, value=name) for name in names]
 
 
 async def setup(bot):
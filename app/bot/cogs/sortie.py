@@ -5,8 +5,9 @@ from dataclasses import dataclass
 import discord
 from discord.ext import commands
 
-from app.clients.warframe.worldstate.client import worldstate_client
+from app.bot.render_cache import render_cache
 from app.clients.warframe.worldstate.parsers.sortie import Sortie as SortieModel
+from app.clients.warframe.worldstate.parsers.worldstate import WorldstateModel
 
 
 class Sortie(commands.Cog):
@@ -26,10 +27,7 @@ class Sortie(commands.Cog):
         """
         try:
             start = time.time()
-            worldstate = await worldstate_client.get_worldstate()
-            parsed_sortie = SortieBuilder.parse(worldstate.sorties)
-
-            message = SortieBuilder.build_message(parsed_sortie)
+            message = await render_cache.get("sortie", SortieBuilder.render)
 
             processing_time = round((time.time() - start) * 1000)
             message["embed"].set_footer(text=f"Processing time: {processing_time}ms")
@@ -72,6 +70,10 @@ class ParsedSortie:
 
 
 class SortieBuilder:
+    @staticmethod
+    def render(worldstate: WorldstateModel) -> dict:
+        return SortieBuilder.build_message(SortieBuilder.parse(worldstate.sorties))
+
     @staticmethod
     def parse(worldstate_sortie: list[SortieModel]) -> ParsedSortie:
         sortie = worldstate_sortie[0]  # list with 1 element
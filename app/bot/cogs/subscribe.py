@@ -0,0 +1,330 @@
+import asyncio
+import logging
+from typing import Optional
+
+import discord
+from discord.ext import commands
+
+from app.clients.warframe.utils.constant import VOID_TYPE
+from app.clients.warframe.worldstate.client import worldstate_client
+from app.clients.warframe.worldstate.diff import WorldstateEvent
+from app.clients.warframe.worldstate.subscriptions import (
+    Match,
+    Subscription,
+    subscription_store,
+)
+from app.config.settings import settings
+
+# Discord accepts at most 10 embeds per message
+MAX_EMBEDS_PER_MESSAGE = 10
+
+
+class Subscribe(commands.Cog):
+    """Notifications for new fissures, alerts and Baro items."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.logger = logging.getLogger(__name__)
+        self.notifier = Notifier(bot)
+
+    async def cog_load(self):
+        await subscription_store.load()
+        worldstate_client.add_listener(self.on_worldstate_events)
+
+    async def cog_unload(self):
+        worldstate_client.remove_listener(self.on_worldstate_events)
+
+    async def on_worldstate_events(self, events: list[WorldstateEvent]):
+        matches = await subscription_store.match(events)
+        if matches:
+            await self.notifier.send(matches)
+
+    async def _target(
+        self, ctx: commands.Context, here: bool
+    ) -> tuple[str, int] | None:
+        """Resolve where notifications go, checking channel permissions."""
+        if not here:
+            return "user", ctx.author.id
+
+        permissions = getattr(ctx.author, "guild_permissions", None)
+        if ctx.guild is None or not permissions or not permissions.manage_channels:
+            await ctx.send(
+                embed=SubscribeBuilder.error(
+                    "You need the Manage Channels permission to subscribe a channel."
+                )
+            )
+            return None
+        return "channel", ctx.channel.id
+
+    async def _store(self, ctx: commands.Context, here: bool, **fields):
+        target = await self._target(ctx, here)
+        if target is None:
+            return
+
+        target_type, target_id = target
+        subscription = await subscription_store.add(
+            target_type=target_type,
+            target_id=target_id,
+            owner_id=ctx.author.id,
+            **fields,
+        )
+        if subscription is None:
+            await ctx.send(
+                embed=SubscribeBuilder.error(
+                    "Failed to save the subscription. Please try again later."
+                )
+            )
+            return
+        await ctx.send(embed=SubscribeBuilder.subscribed(subscription))
+
+    @commands.hybrid_group(
+        name="subscribe",
+        with_app_command=True,
+        description="Get notified about new fissures, alerts and Baro items.",
+    )
+    async def subscribe(self, ctx: commands.Context):
+        """
+        Usage: -subscribe <fissure|alert|baro> ...\n
+        Get notified about new fissures, alerts and Baro items
+        """
+        if ctx.invoked_subcommand is None:
+            await ctx.send(
+                embed=SubscribeBuilder.error(
+                    "Use `subscribe fissure`, `subscribe alert` or `subscribe baro`."
+                )
+            )
+
+    @subscribe.command(
+        name="fissure", description="Get notified when a matching fissure opens."
+    )
+    async def subscribe_fissure(
+        self,
+        ctx: commands.Context,
+        tier: str = "",
+        mission_type: str = "",
+        steel_path: Optional[bool] = None,
+        here: bool = False,
+    ):
+        """
+        Usage: -subscribe fissure <tier> <mission type> <steel path> <here>\n
+        Example: -subscribe fissure omnia survival true
+        """
+        tiers = {value.lower(): value for value in VOID_TYPE.values()}
+        if tier and tier.lower() not in tiers:
+            await ctx.send(
+                embed=SubscribeBuilder.error(
+                    f"Invalid tier. Use one of: {', '.join(tiers.values())}."
+                )
+            )
+            return
+
+        await self._store(
+            ctx,
+            here,
+            kind="fissure",
+            tier=tiers.get(tier.lower()) if tier else None,
+            mission_type=mission_type.title() or None,
+            hard=steel_path,
+        )
+
+    @subscribe.command(
+        name="alert", description="Get notified about alerts, optionally by reward."
+    )
+    async def subscribe_alert(
+        self, ctx: commands.Context, item: str = "", here: bool = False
+    ):
+        """
+        Usage: -subscribe alert <reward item> <here>\n
+        Example: -subscribe alert forma
+        """
+        await self._store(ctx, here, kind="alert", item=item or None)
+
+    @subscribe.command(
+        name="baro", description="Get notified when Baro arrives or brings an item."
+    )
+    async def subscribe_baro(
+        self, ctx: commands.Context, item: str = "", here: bool = False
+    ):
+        """
+        Usage: -subscribe baro <item> <here>\n
+        Example: -subscribe baro primed continuity
+        """
+        await self._store(ctx, here, kind="baro", item=item or None)
+
+    @commands.hybrid_command(
+        name="subscriptions",
+        with_app_command=True,
+        description="List your notification subscriptions.",
+    )
+    async def subscriptions(self, ctx: commands.Context):
+        """
+        Usage: -subscriptions\n
+        List your notification subscriptions
+        """
+        subscriptions = await subscription_store.for_owner(ctx.author.id)
+        await ctx.send(embed=SubscribeBuilder.listing(subscriptions))
+
+    @commands.hybrid_command(
+        name="unsubscribe",
+        with_app_command=True,
+        description="Remove a notification subscription.",
+    )
+    async def unsubscribe(self, ctx: commands.Context, subscription_id: str):
+        """
+        Usage: -unsubscribe <id>\n
+        Remove one of your subscriptions, see -subscriptions for ids
+        """
+        removed = await subscription_store.remove(subscription_id, ctx.author.id)
+        if not removed:
+            await ctx.send(embed=SubscribeBuilder.error("No such subscription."))
+            return
+        embed = discord.Embed(
+            color=discord.Color.green(),
+            title="Unsubscribed",
+            description=f"Removed subscription `{subscription_id}`.",
+        )
+        await ctx.send(embed=embed)
+
+
+async def setup(bot):
+    await bot.add_cog(Subscribe(bot))
+
+
+class SubscribeBuilder:
+    @staticmethod
+    def error(description: str) -> discord.Embed:
+        return discord.Embed(
+            color=discord.Color.red(), title="Error", description=description
+        )
+
+    @staticmethod
+    def subscribed(subscription: Subscription) -> discord.Embed:
+        where = "this channel" if subscription.target_type == "channel" else "DMs"
+        return discord.Embed(
+            color=discord.Color.green(),
+            title="Subscribed",
+            description=(
+                f"{subscription.description}\n"
+                f"Notifications go to {where}. Id: `{subscription.id}`"
+            ),
+        )
+
+    @staticmethod
+    def listing(subscriptions: list[Subscription]) -> discord.Embed:
+        embed = discord.Embed(color=discord.Color.blue(), title="Your subscriptions")
+        if not subscriptions:
+            embed.description = "You have no subscriptions."
+            return embed
+
+        embed.description = "\n".join(
+            f"`{sub.id}` {sub.description}"
+            + (f" in <#{sub.target_id}>" if sub.target_type == "channel" else "")
+            for sub in subscriptions
+        )
+        return embed
+
+    @staticmethod
+    def notification(match: Match) -> discord.Embed:
+        event = match.event
+        entry = event.new
+
+        if event.section == "active_missions":
+            steel_path = " Steel Path" if entry.hard else ""
+            embed = discord.Embed(
+                color=discord.Colour.blue(),
+                title=f"New {entry.modifier}{steel_path} fissure",
+                description=(
+                    f"{entry.mission_type} - {entry.node}\n"
+                    f"Ends: <t:{int(entry.expiry.timestamp())}:R>"
+                ),
+            )
+        elif event.section == "alerts":
+            info = entry.mission_info
+            embed = discord.Embed(
+                color=discord.Colour.orange(),
+                title=f"New alert: {info.mission_type}",
+                description=(
+                    f"{info.location} ({info.faction})\n"
+                    f"Ends: <t:{int(entry.expiry.timestamp())}:R>"
+                ),
+            )
+        else:
+            embed = discord.Embed(
+                color=discord.Colour.gold(),
+                title="Baro Ki'Teer has arrived",
+                description=(
+                    f"{entry.node}\nLeaves: <t:{int(entry.expiry.timestamp())}:R>"
+                ),
+            )
+
+        if match.items:
+            embed.add_field(name="Matched", value="\n".join(match.items)[:1024])
+        return embed
+
+
+class Notifier:
+    """
+    Sends matched notifications grouped per destination.
+
+    Each destination gets its embeds in as few messages as possible, and
+    only NOTIFY_MAX_CONCURRENCY sends run at once so a busy rotation does
+    not burst into Discord's global rate limit.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.logger = logging.getLogger(__name__)
+        self._semaphore = asyncio.Semaphore(settings.NOTIFY_MAX_CONCURRENCY)
+
+    @staticmethod
+    def group(
+        matches: list[Match],
+    ) -> dict[tuple[str, int], list[discord.Embed]]:
+        """Embeds per destination, built once per entry and deduplicated."""
+        grouped: dict[tuple[str, int], dict[str, discord.Embed]] = {}
+        for match in matches:
+            embed = None
+            for subscription in match.subscriptions:
+                target = (subscription.target_type, subscription.target_id)
+                embeds = grouped.setdefault(target, {})
+                if match.event.key not in embeds:
+                    embed = embed or SubscribeBuilder.notification(match)
+                    embeds[match.event.key] = embed
+        return {target: list(embeds.values()) for target, embeds in grouped.items()}
+
+    async def send(self, matches: list[Match]) -> None:
+        grouped = self.group(matches)
+        await asyncio.gather(
+            *(
+                self._send_target(target_type, target_id, embeds)
+                for (target_type, target_id), embeds in grouped.items()
+            )
+        )
+
+    async def _resolve(
+        self, target_type: str, target_id: int
+    ) -> discord.abc.Messageable | None:
+        if target_type == "channel":
+            return self.bot.get_channel(target_id) or await self.bot.fetch_channel(
+                target_id
+            )
+        return self.bot.get_user(target_id) or await self.bot.fetch_user(target_id)
+
+    async def _send_target(
+        self, target_type: str, target_id: int, embeds: list[discord.Embed]
+    ) -> None:
+        async with self._semaphore:
+            try:
+                destination = await self._resolve(target_type, target_id)
+                if destination is None:
+                    return
+                for i in range(0, len(embeds), MAX_EMBEDS_PER_MESSAGE):
+                    await destination.send(
+                        embeds=embeds[i : i + MAX_EMBEDS_PER_MESSAGE]
+                    )
+            except discord.HTTPException as e:
+                self.logger.warning(
+                    f"Failed to notify {target_type} {target_id}: {e.status} {e.text}"
+                )
+            except Exception as e:
+                self.logger.error(f"Failed to notify {target_type} {target_id}: {e}")
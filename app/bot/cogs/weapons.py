@@ -5,8 +5,10 @@ from typing import Any
 import discord
 from discord.ext import commands
 
+from app.bot.autocomplete import autocomplete
 from app.clients.warframe.wiki.client import wiki_client
-from app.clients.warframe.wiki.models.weapon import Weapon
+from app.clients.warframe.wiki.models.weapon import Weapon, WeaponData
+from app.clients.warframe.wiki.snapshot import wiki_snapshot_store
 
 
 class Weapons(commands.Cog):
@@ -46,16 +48,13 @@ class Weapons(commands.Cog):
     async def weapon_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> list[discord.app_commands.Choice[str]]:
-        data = wiki_client.get_weapon_data()
-        if not data:
-            return []
-
-        matches = [
-            discord.app_commands.Choice(name=name, value=name)
-            for name in data
-            if current.lower() in name.lower()
-        ]
-        return matches[:24]
+        names = await autocomplete.search(
+            "weapons",
+            await wiki_snapshot_store.current_version(),
+            wiki_client.get_weapon_names,
+            current,
+        )
+        return [discord.app_commands.Choice(name=name, value=name) for name in names]
 
 
 async def setup(bot):
@@ -73,11 +72,13 @@ class WeaponBuilder:
         return {"embed": embed}
 
     @staticmethod
-    def _get_weapon_data() -> dict | None:
-        return wiki_client.get_weapon_data()
+    async def _get_weapon_data() -> WeaponData | None:
+        return await wiki_client.get_weapon_data()
 
     @staticmethod
-    def _find_weapon(weapon_name: str, data: dict) -> tuple[str | None, dict | None]:
+    def _find_weapon(
+        weapon_name: str, data: WeaponData
+    ) -> tuple[str | None, Weapon | None]:
         for key in data:
             if key.lower() == weapon_name.lower():
                 return key, data[key]
@@ -93,20 +94,18 @@ class WeaponBuilder:
         if not weapon_name:
             return WeaponBuilder._error_message("Please provide a weapon name.")
 
-        weapon_data = WeaponBuilder._get_weapon_data()
+        weapon_data = await WeaponBuilder._get_weapon_data()
         if not weapon_data:
             return WeaponBuilder._error_message(
                 "No data available. Please try again later."
             )
 
-        matching_name, matching_data = WeaponBuilder._find_weapon(
+        matching_name, weapon_instance = WeaponBuilder._find_weapon(
             weapon_name, weapon_data
         )
-        if not matching_name or not matching_data:
+        if not matching_name or not weapon_instance:
             return WeaponBuilder._error_message("No matching weapon found.")
 
-        weapon_instance = Weapon.from_dict(matching_name, matching_data)
-
         wiki_url = (
             f"https://wiki.warframe.com/w/{'_'.join(matching_name.split(' '))}"
         )
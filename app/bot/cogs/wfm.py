@@ -1,13 +1,16 @@
 import logging
+import statistics
 import time
 from dataclasses import dataclass
 from typing import Any
 
 import discord
 from discord.ext import commands
-from warframe_market.client import WarframeMarketClient
 
+from app.bot.autocomplete import autocomplete
 from app.clients.warframe.market.items_cache import market_items_cache
+from app.clients.warframe.market.order_cache import market_order_cache
+from app.clients.warframe.market.price_history import price_history, series_id
 
 
 class Wfm(commands.Cog):
@@ -50,12 +53,13 @@ class Wfm(commands.Cog):
         if not items:
             return []
 
-        matches = [
-            discord.app_commands.Choice(name=item["name"], value=item["name"])
-            for item in items
-            if current.lower() in item["name"].lower()
-        ]
-        return matches[:24]
+        names = await autocomplete.search(
+            "market_items",
+            market_items_cache.version,
+            market_items_cache.get_names,
+            current,
+        )
+        return [discord.app_commands.Choice(name=name, value=name) for name in names]
 
 
 async def setup(bot):
@@ -82,6 +86,8 @@ class WfmBuilder:
     platinum_emoji = "<:Platinum:992917150358589550>"
 
     _show_quantity_keywords = {"lith", "meso", "neo", "axi"}
+    # price changes under this fraction of the 7 day average show as flat
+    _trend_threshold = 0.05
 
     @staticmethod
     def _should_show_quantity(item_name: str) -> bool:
@@ -138,15 +144,40 @@ class WfmBuilder:
     async def _get_orders(
         slug: str, rank: int | None = None, charges: int | None = None
     ) -> list[ParsedOrder]:
-        client = WarframeMarketClient()
-        result = await client.get_top_orders_for_item(
-            slug=slug, rank=rank, charges=charges
-        )
+        orders = await market_order_cache.get(slug, rank=rank, charges=charges)
         return [
             ParsedOrder(platinum=order.platinum, quantity=order.quantity)
-            for order in result.data.sell
+            for order in orders
         ][:5]
 
+    @staticmethod
+    async def _format_trend(
+        orders: list[ParsedOrder],
+        slug: str,
+        rank: int | None = None,
+        charges: int | None = None,
+    ) -> str | None:
+        """Current median against the recorded history, None without one."""
+        if not orders:
+            return None
+        current = statistics.median(order.platinum for order in orders)
+        trend = await price_history.trend(series_id(slug, rank, charges), current)
+        if trend.change is None:
+            return None
+
+        if trend.change >= WfmBuilder._trend_threshold:
+            arrow = "\u25b2"
+        elif trend.change <= -WfmBuilder._trend_threshold:
+            arrow = "\u25bc"
+        else:
+            arrow = "\u25ac"
+        lines = [f"{arrow} {trend.change:+.0%} vs 7 day average"]
+        averages = [f"7d: {trend.average_7d:g}{WfmBuilder.platinum_emoji}"]
+        if trend.average_30d is not None:
+            averages.append(f"30d: {trend.average_30d:g}{WfmBuilder.platinum_emoji}")
+        lines.append(" | ".join(averages))
+        return "\n".join(lines)
+
     @staticmethod
     async def build_wfm_message(item_name: str) -> dict:
         if not item_name:
@@ -166,16 +197,26 @@ class WfmBuilder:
 
         ranked_orders = None
         rank_label = None
+        ranked_trend = None
         if matched.get("max_rank") is not None and matched["max_rank"] > 0:
             ranked_orders = await WfmBuilder._get_orders(
                 matched["slug"], rank=matched["max_rank"]
             )
             rank_label = f"Rank {matched['max_rank']}"
+            ranked_trend = await WfmBuilder._format_trend(
+                ranked_orders, matched["slug"], rank=matched["max_rank"]
+            )
         elif matched.get("max_charges") is not None and matched["max_charges"] > 0:
             ranked_orders = await WfmBuilder._get_orders(
                 matched["slug"], charges=matched["max_charges"]
             )
             rank_label = f"{matched['max_charges']} charges"
+            ranked_trend = await WfmBuilder._format_trend(
+                ranked_orders, matched["slug"], charges=matched["max_charges"]
+            )
+        unranked_trend = await WfmBuilder._format_trend(
+            unranked_orders, matched["slug"]
+        )
 
         parsed = ParsedWfmItem(
             name=matched["name"],
@@ -201,6 +242,8 @@ class WfmBuilder:
             value=WfmBuilder._format_orders(parsed.unranked_orders, show_qty),
             inline=False,
         )
+        if unranked_trend:
+            embed.add_field(name="Trend", value=unranked_trend, inline=False)
 
         if parsed.ranked_orders:
             embed.add_field(
@@ -208,5 +251,9 @@ class WfmBuilder:
                 value=WfmBuilder._format_orders(parsed.ranked_orders, show_qty),
                 inline=False,
             )
+        if parsed.ranked_orders and ranked_trend:
+            embed.add_field(
+                name=f"Trend ({rank_label})", value=ranked_trend, inline=False
+            )
 
         return {"embed": embed}
@@ -0,0 +1,85 @@
+import logging
+from typing import Any, Callable
+
+import discord
+
+from app.clients.warframe.worldstate.client import worldstate_client
+from app.clients.warframe.worldstate.parsers.worldstate import WorldstateModel
+
+logger = logging.getLogger(__name__)
+
+MessageBuilder = Callable[[WorldstateModel], dict[str, Any]]
+
+
+class RenderCache:
+    """
+    Rendered worldstate command messages, built once per worldstate version.
+
+    Messages are stored as embed dicts and turned back into fresh
+    discord.Embed objects on every read, so callers can still set their own
+    footer without touching the cached copy. The cache empties itself as
+    soon as the worldstate client decodes a new snapshot.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._version = None
+            cls._instance._entries = {}
+            cls._instance._stats = {"hits": 0, "misses": 0}
+        return cls._instance
+
+    @staticmethod
+    def _freeze(message: dict[str, Any]) -> dict[str, Any]:
+        frozen = {}
+        for key, value in message.items():
+            if isinstance(value, discord.Embed):
+                frozen[key] = value.to_dict()
+            elif key == "embeds":
+                frozen[key] = [embed.to_dict() for embed in value]
+            else:
+                frozen[key] = value
+        return frozen
+
+    @staticmethod
+    def _thaw(frozen: dict[str, Any]) -> dict[str, Any]:
+        message = {}
+        for key, value in frozen.items():
+            if key == "embed":
+                message[key] = discord.Embed.from_dict(value)
+            elif key == "embeds":
+                message[key] = [discord.Embed.from_dict(embed) for embed in value]
+            else:
+                message[key] = value
+        return message
+
+    async def get(self, key: str, build: MessageBuilder) -> dict[str, Any]:
+        """Cached message for key, built from the current worldstate if missing."""
+        worldstate = await worldstate_client.get_worldstate()
+        version = worldstate_client.version
+        if version != self._version:
+            self._version = version
+            self._entries = {}
+
+        if key in self._entries:
+            self._stats["hits"] += 1
+        else:
+            self._stats["misses"] += 1
+            self._entries[key] = self._freeze(build(worldstate))
+        return self._thaw(self._entries[key])
+
+    def invalidate(self) -> None:
+        self._version = None
+        self._entries = {}
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "version": self._version,
+            "cached": sorted(self._entries),
+            **self._stats,
+        }
+
+
+render_cache = RenderCache()
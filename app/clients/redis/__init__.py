@@ -1,3 +1,14 @@
+from .async_client import AsyncRedisClient, async_redis_client
 from .client import RedisClient, redis_client
+from .codec import RedisCodec, redis_codec
+from .lease import Lease
 
-__all__ = ["RedisClient", "redis_client"]
\ No newline at end of file
+__all__ = [
+    "AsyncRedisClient",
+    "Lease",
+    "RedisClient",
+    "RedisCodec",
+    "async_redis_client",
+    "redis_client",
+    "redis_codec",
+]
@@ -0,0 +1,266 @@
+from typing import Any
+
+import redis.asyncio as aioredis
+from redis.asyncio.client import Pipeline
+from redis.client import NEVER_DECODE
+from typing_extensions import Self
+
+from app.clients.redis.codec import redis_codec
+from app.config.settings import settings
+from app.utils.metrics import metrics
+
+
+class AsyncRedisClient:
+    """
+    asyncio Redis client backed by a bounded connection pool.
+
+    Safe to call from cogs, web handlers and jobs sharing the event loop.
+    When every connection is busy, callers wait for a free one for up to
+    REDIS_POOL_TIMEOUT seconds instead of opening new sockets. Each command
+    is timed into the ``redis.<command>`` latency histogram.
+
+    Replies are decoded to str, except through get_bytes and get_decoded
+    which read the binary values written with set_encoded.
+    """
+
+    _instance: Self | None = None
+
+    def __new__(cls) -> Self:
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._pool = None
+            cls._instance._client = None
+        return cls._instance
+
+    def _connect(self) -> None:
+        self._pool = aioredis.BlockingConnectionPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            password=settings.REDIS_PASSWORD,
+            decode_responses=True,
+            socket_connect_timeout=5,
+            retry_on_timeout=True,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+        )
+        self._client = aioredis.Redis(connection_pool=self._pool)
+
+    def get_client(self) -> aioredis.Redis:
+        """Get Redis client instance, creating the pool on first use."""
+        if self._client is None:
+            self._connect()
+        return self._client
+
+    async def get(self, key: str) -> str | None:
+        """Get value from Redis."""
+        try:
+            with metrics.timer("redis.get"):
+                return await self.get_client().get(key)
+        except Exception as e:
+            print(f"Redis get error for key {key}: {e}")
+            return None
+
+    async def get_bytes(self, key: str) -> bytes | None:
+        """Get a value from Redis without decoding it to str."""
+        try:
+            with metrics.timer("redis.get"):
+                return await self.get_client().execute_command(
+                    "GET", key, **{NEVER_DECODE: True}
+                )
+        except Exception as e:
+            print(f"Redis get error for key {key}: {e}")
+            return None
+
+    async def get_decoded(
+        self, key: str, type: Any = Any, strict: bool = True
+    ) -> Any | None:
+        """Get a value written with set_encoded (or plain JSON) and decode it."""
+        data = await self.get_bytes(key)
+        if data is None:
+            return None
+        try:
+            with metrics.timer("redis.decode"):
+                return redis_codec.decode(data, type=type, strict=strict)
+        except Exception as e:
+            print(f"Redis decode error for key {key}: {e}")
+            return None
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        """Get several values from Redis in one round trip."""
+        if not keys:
+            return []
+        try:
+            with metrics.timer("redis.mget"):
+                return await self.get_client().mget(keys)
+        except Exception as e:
+            print(f"Redis mget error for keys {keys}: {e}")
+            return [None] * len(keys)
+
+    async def set(self, key: str, value: str | bytes, ex: int | None = None) -> bool:
+        """Set value in Redis with optional expiration."""
+        try:
+            with metrics.timer("redis.set"):
+                return bool(await self.get_client().set(key, value, ex=ex))
+        except Exception as e:
+            print(f"Redis set error for key {key}: {e}")
+            return False
+
+    async def set_encoded(self, key: str, value: Any, ex: int | None = None) -> bool:
+        """Encode a value with the Redis codec and set it."""
+        return await self.set(key, redis_codec.encode(value), ex=ex)
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists in Redis."""
+        try:
+            with metrics.timer("redis.exists"):
+                return bool(await self.get_client().exists(key))
+        except Exception as e:
+            print(f"Redis exists error for key {key}: {e}")
+            return False
+
+    async def delete(self, key: str) -> bool:
+        """Delete key from Redis."""
+        try:
+            with metrics.timer("redis.delete"):
+                return bool(await self.get_client().delete(key))
+        except Exception as e:
+            print(f"Redis delete error for key {key}: {e}")
+            return False
+
+    async def ttl(self, key: str) -> int | None:
+        """Remaining time to live of a key in seconds."""
+        try:
+            with metrics.timer("redis.ttl"):
+                return await self.get_client().ttl(key)
+        except Exception as e:
+            print(f"Redis ttl error for key {key}: {e}")
+            return None
+
+    async def hget(self, key: str, field: str) -> str | None:
+        """Get a single field from a Redis hash."""
+        try:
+            with metrics.timer("redis.hget"):
+                return await self.get_client().hget(key, field)
+        except Exception as e:
+            print(f"Redis hget error for key {key}: {e}")
+            return None
+
+    async def hmget(self, key: str, fields: list[str]) -> list[str | None]:
+        """Get several fields from a Redis hash in one round trip."""
+        if not fields:
+            return []
+        try:
+            with metrics.timer("redis.hmget"):
+                return await self.get_client().hmget(key, fields)
+        except Exception as e:
+            print(f"Redis hmget error for key {key}: {e}")
+            return [None] * len(fields)
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        """Get every field of a Redis hash."""
+        try:
+            with metrics.timer("redis.hgetall"):
+                return await self.get_client().hgetall(key)
+        except Exception as e:
+            print(f"Redis hgetall error for key {key}: {e}")
+            return {}
+
+    async def hkeys(self, key: str) -> list[str]:
+        """Get the field names of a Redis hash."""
+        try:
+            with metrics.timer("redis.hkeys"):
+                return await self.get_client().hkeys(key)
+        except Exception as e:
+            print(f"Redis hkeys error for key {key}: {e}")
+            return []
+
+    async def zincrby(self, key: str, amount: float, member: str) -> float | None:
+        """Increment the score of a sorted set member."""
+        try:
+            with metrics.timer("redis.zincrby"):
+                return await self.get_client().zincrby(key, amount, member)
+        except Exception as e:
+            print(f"Redis zincrby error for key {key}: {e}")
+            return None
+
+    async def zscores(self, key: str) -> dict[str, float]:
+        """Every member of a sorted set with its score."""
+        try:
+            with metrics.timer("redis.zrange"):
+                return dict(await self.get_client().zrange(key, 0, -1, withscores=True))
+        except Exception as e:
+            print(f"Redis zrange error for key {key}: {e}")
+            return {}
+
+    async def zrangebyscore(
+        self, key: str, min: float | str = "-inf", max: float | str = "+inf"
+    ) -> list[str]:
+        """Members of a sorted set with a score between min and max."""
+        try:
+            with metrics.timer("redis.zrangebyscore"):
+                return await self.get_client().zrangebyscore(key, min, max)
+        except Exception as e:
+            print(f"Redis zrangebyscore error for key {key}: {e}")
+            return []
+
+    async def smembers(self, key: str) -> list[str]:
+        """Every member of a set."""
+        try:
+            with metrics.timer("redis.smembers"):
+                return list(await self.get_client().smembers(key))
+        except Exception as e:
+            print(f"Redis smembers error for key {key}: {e}")
+            return []
+
+    def pipeline(self, transaction: bool = False) -> Pipeline:
+        """Create a pipeline. Run it with execute_pipeline to get it timed."""
+        return self.get_client().pipeline(transaction=transaction)
+
+    async def execute_pipeline(self, pipe: Pipeline) -> list[Any] | None:
+        """Send a queued pipeline in one round trip."""
+        try:
+            with metrics.timer("redis.pipeline"):
+                return await pipe.execute()
+        except Exception as e:
+            print(f"Redis pipeline error: {e}")
+            return None
+
+    async def info(self) -> dict[str, Any]:
+        """Server INFO section."""
+        try:
+            with metrics.timer("redis.info"):
+                return await self.get_client().info()
+        except Exception as e:
+            print(f"Redis info error: {e}")
+            return {}
+
+    async def ping(self) -> bool:
+        """Ping Redis to check connection."""
+        try:
+            with metrics.timer("redis.ping"):
+                return bool(await self.get_client().ping())
+        except Exception as e:
+            print(f"Redis ping error: {e}")
+            return False
+
+    def pool_stats(self) -> dict[str, int]:
+        if self._pool is None:
+            return {"max_connections": settings.REDIS_MAX_CONNECTIONS}
+        return {
+            "max_connections": self._pool.max_connections,
+            "in_use": len(self._pool._in_use_connections),
+            "idle": len(self._pool._available_connections),
+        }
+
+    async def close(self) -> None:
+        """Close the pool and all its connections."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+        if self._pool:
+            await self._pool.disconnect()
+            self._pool = None
+
+
+async_redis_client = AsyncRedisClient()
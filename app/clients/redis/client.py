@@ -1,3 +1,5 @@
+import time
+
 import redis
 from typing_extensions import Self
 
@@ -5,20 +7,31 @@ from app.config.settings import settings
 
 
 class RedisClient:
+    """
+    Blocking Redis client, for scripts and callers outside the event loop.
+
+    It connects on first use rather than at import, and after a failed
+    connection it does not try again for _retry_after seconds, so callers
+    are not held up by repeated connect timeouts.
+    """
+
     _instance: Self | None = None
+    _retry_after: float = 30
 
     def __new__(cls) -> Self:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._client = None
             cls._instance._connected = False
+            cls._instance._failed_at = None
         return cls._instance
 
-    def __init__(self):
-        if not self._connected:
-            self._connect()
-
     def _connect(self) -> None:
+        if (
+            self._failed_at is not None
+            and time.time() - self._failed_at < self._retry_after
+        ):
+            raise ConnectionError("Redis connection failed recently")
         try:
             self._client = redis.Redis(
                 host=settings.REDIS_HOST,
@@ -32,7 +45,9 @@ class RedisClient:
             # Test connection
             self._client.ping()
             self._connected = True
+            self._failed_at = None
         except Exception as e:
+            self._failed_at = time.time()
             raise ConnectionError(f"Failed to connect to Redis: {e}")
 
     def get_client(self):
@@ -0,0 +1,152 @@
+import logging
+import zlib
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import msgspec
+
+from app.config.settings import settings
+
+try:
+    import zstandard
+except ImportError:  # optional, zlib is used instead
+    zstandard = None
+
+try:
+    import lz4.frame
+except ImportError:  # optional, zlib is used instead
+    lz4 = None
+
+logger = logging.getLogger(__name__)
+
+# JSON text never starts with a NUL byte, so entries written before the
+# codec existed are told apart from framed ones by the first two bytes
+MAGIC = b"\x00J"
+HEADER_SIZE = len(MAGIC) + 2
+
+ENCODINGS = {
+    "msgpack": b"m",
+    "json": b"j",
+    # bytes stored as given, for payloads that already are JSON
+    "raw": b"r",
+}
+
+
+@dataclass(frozen=True)
+class Compression:
+    name: str
+    tag: bytes
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+def _compressions() -> dict[str, Compression]:
+    available = [
+        Compression("none", b"n", bytes, bytes),
+        Compression(
+            "zlib", b"z", lambda data: zlib.compress(data, 6), zlib.decompress
+        ),
+    ]
+    if zstandard is not None:
+        available.append(
+            Compression(
+                "zstd",
+                b"s",
+                zstandard.ZstdCompressor(level=3).compress,
+                zstandard.ZstdDecompressor().decompress,
+            )
+        )
+    if lz4 is not None:
+        available.append(
+            Compression("lz4", b"l", lz4.frame.compress, lz4.frame.decompress)
+        )
+    return {compression.name: compression for compression in available}
+
+
+COMPRESSIONS = _compressions()
+_BY_TAG = {compression.tag: compression for compression in COMPRESSIONS.values()}
+
+
+class RedisCodec:
+    """
+    Encodes values for Redis as a small header followed by the body.
+
+    The header is MAGIC, one byte for the encoding and one for the
+    compression, so entries written with different settings (or before the
+    codec existed, as plain JSON text) can all be read back. Bodies smaller
+    than min_size are not compressed, it would not pay for itself.
+    """
+
+    def __init__(
+        self,
+        encoding: str = "msgpack",
+        compression: str = "zstd",
+        min_size: int = 1024,
+    ):
+        if encoding not in ENCODINGS or encoding == "raw":
+            raise ValueError(f"Unknown Redis encoding {encoding!r}")
+        if compression not in COMPRESSIONS:
+            logger.warning(
+                f"Redis compression {compression!r} is not available, using zlib"
+            )
+            compression = "zlib"
+        self.encoding = encoding
+        self.compression = COMPRESSIONS[compression]
+        self.min_size = min_size
+
+    def _frame(self, encoding: str, body: bytes) -> bytes:
+        compression = COMPRESSIONS["none"]
+        if len(body) >= self.min_size:
+            compression = self.compression
+        header = MAGIC + ENCODINGS[encoding] + compression.tag
+        return header + compression.compress(body)
+
+    def encode(self, value: Any) -> bytes:
+        if self.encoding == "msgpack":
+            body = msgspec.msgpack.encode(value)
+        else:
+            body = msgspec.json.encode(value)
+        return self._frame(self.encoding, body)
+
+    def pack(self, raw: bytes) -> bytes:
+        """Frame JSON that is already encoded, only compressing it."""
+        return self._frame("raw", raw)
+
+    @staticmethod
+    def _unframe(data: bytes | str) -> tuple[bytes, bytes]:
+        """Encoding tag and uncompressed body of a stored value."""
+        if isinstance(data, str):
+            data = data.encode()
+        if not data.startswith(MAGIC):
+            return ENCODINGS["json"], data
+        encoding, tag = data[2:3], data[3:4]
+        compression = _BY_TAG.get(tag)
+        if compression is None:
+            raise ValueError(f"Unsupported compression {tag!r} in cached value")
+        return encoding, compression.decompress(data[HEADER_SIZE:])
+
+    def unpack(self, data: bytes | str) -> bytes:
+        """JSON bytes of a value written with pack(), or of a plain JSON one."""
+        encoding, body = self._unframe(data)
+        if encoding == ENCODINGS["msgpack"]:
+            raise ValueError("Cached value is msgpack, not JSON")
+        return body
+
+    def decode(self, data: bytes | str, type: Any = Any, strict: bool = True) -> Any:
+        """
+        Decode any stored value, optionally straight into `type`. With strict
+        off, numbers stored as strings and the like are coerced.
+        """
+        encoding, body = self._unframe(data)
+        if encoding == ENCODINGS["msgpack"]:
+            return msgspec.msgpack.decode(body, type=type, strict=strict)
+        if encoding in (ENCODINGS["json"], ENCODINGS["raw"]):
+            return msgspec.json.decode(body, type=type, strict=strict)
+        raise ValueError(f"Unsupported encoding {encoding!r} in cached value")
+
+
+redis_codec = RedisCodec(
+    settings.REDIS_ENCODING,
+    settings.REDIS_COMPRESSION,
+    settings.REDIS_COMPRESSION_MIN_SIZE,
+)
@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Any, Callable
+
+from redis.asyncio.client import Pipeline
+from redis.exceptions import WatchError
+
+from app.clients.redis.async_client import async_redis_client
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# identifies this process in lease values
+OWNER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class Lease:
+    """
+    Time-limited exclusive ownership of a named task across replicas.
+
+    Every successful acquisition gets a fencing token from a Redis counter,
+    so tokens only ever increase. While held, the lease is renewed in the
+    background. Writes that must not come from a stale holder go through
+    fenced(), which only applies them while the lease is still ours and no
+    newer token has written before.
+    """
+
+    def __init__(self, name: str, ttl: int | None = None):
+        self.name = name
+        self.ttl = ttl or settings.LEASE_TTL
+        self.token: int | None = None
+        self._expires_at = 0.0
+        self._renewer: asyncio.Task | None = None
+
+    @property
+    def key(self) -> str:
+        return f"lease:{self.name}:{settings.CACHE_VERSION}"
+
+    @property
+    def token_key(self) -> str:
+        return f"lease_token:{self.name}:{settings.CACHE_VERSION}"
+
+    @property
+    def fence_key(self) -> str:
+        return f"lease_fence:{self.name}:{settings.CACHE_VERSION}"
+
+    @property
+    def value(self) -> str:
+        return f"{OWNER_ID}:{self.token}"
+
+    @property
+    def held(self) -> bool:
+        return self.token is not None and time.monotonic() < self._expires_at
+
+    async def acquire(self) -> bool:
+        """Take the lease if it is free. Returns True if this process holds it."""
+        if self.held:
+            return True
+
+        client = async_redis_client.get_client()
+        try:
+            token = await client.incr(self.token_key)
+            acquired = await client.set(
+                self.key, f"{OWNER_ID}:{token}", nx=True, ex=self.ttl
+            )
+        except Exception as e:
+            logger.error(f"Failed to acquire lease {self.name}: {e}")
+            return False
+        if not acquired:
+            return False
+
+        self.token = token
+        self._expires_at = time.monotonic() + self.ttl
+        if self._renewer is None or self._renewer.done():
+            self._renewer = asyncio.create_task(self._renew_loop())
+        logger.info(f"Acquired lease {self.name} with token {token}")
+        return True
+
+    async def _if_owner(self, apply: Callable[[Pipeline], Any], *watch: str) -> bool:
+        """Run apply in a transaction that aborts if the lease changed hands."""
+        if self.token is None:
+            return False
+        client = async_redis_client.get_client()
+        try:
+            async with client.pipeline(transaction=True) as pipe:
+                await pipe.watch(self.key, *watch)
+                if await pipe.get(self.key) != self.value:
+                    return False
+                if watch:
+                    fence = await pipe.get(self.fence_key)
+                    if fence is not None and int(fence) > self.token:
+                        return False
+                pipe.multi()
+                apply(pipe)
+                await pipe.execute()
+                return True
+        except WatchError:
+            return False
+        except Exception as e:
+            logger.error(f"Lease {self.name} transaction failed: {e}")
+            return False
+
+    async def renew(self) -> bool:
+        renewed = await self._if_owner(lambda pipe: pipe.expire(self.key, self.ttl))
+        if renewed:
+            self._expires_at = time.monotonic() + self.ttl
+        return renewed
+
+    async def _renew_loop(self) -> None:
+        while self.token is not None:
+            await asyncio.sleep(self.ttl / 3)
+            if self.token is None:
+                break
+            if not await self.renew():
+                # someone else may own it by now, stop acting as the holder
+                logger.warning(f"Lost lease {self.name} (token {self.token})")
+                self.token = None
+
+    async def fenced(self, apply: Callable[[Pipeline], Any]) -> bool:
+        """
+        Queue writes with apply and execute them only if this process still
+        holds the lease and its token is the newest that ever wrote.
+        """
+
+        def with_fence(pipe: Pipeline) -> None:
+            pipe.set(self.fence_key, self.token)
+            apply(pipe)
+
+        return await self._if_owner(with_fence, self.fence_key)
+
+    async def release(self) -> None:
+        if self._renewer is not None:
+            self._renewer.cancel()
+            self._renewer = None
+        if self.token is not None:
+            await self._if_owner(lambda pipe: pipe.delete(self.key))
+            logger.info(f"Released lease {self.name} (token {self.token})")
+        self.token = None
+        self._expires_at = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        return {"held": self.held, "token": self.token, "owner": OWNER_ID}
@@ -0,0 +1,77 @@
+import json
+from typing import Any, Type
+
+import aiohttp
+from warframe_market.client import Klass, WarframeMarketClient
+from warframe_market.exceptions import (
+    WFMApiError,
+    WFMAuthError,
+    WFMNotFoundError,
+    WFMRateLimitError,
+    WFMServerError,
+    WFMTooManyConnectionsError,
+)
+
+from app.clients.warframe.market.scheduler import (
+    market_scheduler,
+    parse_retry_after,
+)
+from app.utils.http import http_client
+
+
+def raise_for_status(response: aiohttp.ClientResponse, body: str) -> None:
+    """Map an error response to the warframe_market exception for its status."""
+    status = response.status
+    if status in (429, 509):
+        error_class = WFMRateLimitError if status == 429 else WFMTooManyConnectionsError
+        error = error_class(body=body)
+        error.retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        raise error
+    if status == 404:
+        raise WFMNotFoundError(body=body)
+    if status in (401, 403):
+        raise WFMAuthError(status=status, body=body)
+    if status >= 500:
+        raise WFMServerError(status=status, body=body)
+    if status != 200:
+        raise WFMApiError(status=status, body=body)
+
+
+class MarketClient(WarframeMarketClient):
+    """
+    WarframeMarketClient that sends every request through the market
+    scheduler instead of the library's own per-class limiter.
+    """
+
+    async def get(self, request_class: Type[Klass], slug: str = "", **kwargs) -> Klass:
+        return await market_scheduler.run(
+            lambda: self._request(request_class, slug, **kwargs)
+        )
+
+    async def _request(
+        self, request_class: Type[Klass], slug: str = "", **kwargs
+    ) -> Klass:
+        endpoint = request_class._get_endpoint(slug=slug, **kwargs)
+        # the scheduler retries market requests, at the rate it allows
+        async with http_client.get(
+            f"{self.base_url}{endpoint}", headers=self.headers, retries=0
+        ) as response:
+            body = await response.text()
+            raise_for_status(response, body)
+            return request_class._decode(body)
+
+    async def get_json(self, url: str) -> Any:
+        """Scheduled GET of a raw URL, for endpoints the library does not wrap."""
+
+        async def _request() -> Any:
+            async with http_client.get(
+                url, headers=self.headers, retries=0
+            ) as response:
+                body = await response.text()
+                raise_for_status(response, body)
+                return json.loads(body)
+
+        return await market_scheduler.run(_request)
+
+
+market_client = MarketClient()
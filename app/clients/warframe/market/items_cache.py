@@ -1,16 +1,16 @@
-import json
 import time
 from typing import Any
 
-from warframe_market.client import WarframeMarketClient
-
-from app.clients.redis import redis_client
+from app.clients.redis import async_redis_client
+from app.clients.warframe.market.client import market_client
 from app.config.settings import settings
 
 
 class MarketItemsCache:
     _instance = None
     _items: list[dict[str, Any]] | None = None
+    _by_slug: dict[str, dict[str, Any]] = {}
+    _by_slug_version: float | None = None
     _last_fetch: float = 0
     _ttl: int = 3600
 
@@ -25,15 +25,30 @@ class MarketItemsCache:
             and (time.time() - self._last_fetch) < self._ttl
         )
 
+    @property
+    def version(self) -> float:
+        """Time of the last load, changes whenever the items are replaced."""
+        return self._last_fetch
+
+    async def get_names(self) -> list[str]:
+        return [item["name"] for item in await self.get_items() if item["name"]]
+
+    async def get_item(self, slug: str) -> dict[str, Any] | None:
+        items = await self.get_items()
+        if self._by_slug_version != self._last_fetch:
+            self._by_slug = {item["slug"]: item for item in items}
+            self._by_slug_version = self._last_fetch
+        return self._by_slug.get(slug)
+
     async def get_items(self) -> list[dict[str, Any]]:
         if self._is_fresh():
             return self._items
 
-        redis_data = redis_client.get(
+        redis_data = await async_redis_client.get_decoded(
             f"market_items:{settings.CACHE_VERSION}"
         )
         if redis_data:
-            self._items = json.loads(redis_data)
+            self._items = redis_data
             self._last_fetch = time.time()
             return self._items
 
@@ -41,8 +56,7 @@ class MarketItemsCache:
         return items
 
     async def _from_api(self) -> list[dict[str, Any]]:
-        client = WarframeMarketClient()
-        items_response = await client.get_all_items()
+        items_response = await market_client.get_all_items()
 
         serialized = []
         for item in items_response.data:
@@ -52,21 +66,23 @@ class MarketItemsCache:
 
             serialized.append(
                 {
+                    "id": item.id,
                     "name": en_name,
                     "slug": item.slug,
                     "max_rank": item.max_rank,
                     "max_charges": item.max_charges,
                     "subtypes": item.subtypes,
                     "tags": item.tags,
+                    "ducats": item.ducats,
                 }
             )
 
         self._items = serialized
         self._last_fetch = time.time()
 
-        redis_client.set(
+        await async_redis_client.set_encoded(
             f"market_items:{settings.CACHE_VERSION}",
-            json.dumps(serialized),
+            serialized,
             ex=settings.DATA_CACHE_SECONDS,
         )
 
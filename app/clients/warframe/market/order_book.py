@@ -0,0 +1,234 @@
+import bisect
+import logging
+import time
+from typing import Any, Iterable
+
+import msgspec
+from cachetools import LRUCache
+
+from app.clients.warframe.market.items_cache import market_items_cache
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+OrderKey = tuple[str, int | None, int | None, str | None]
+
+# sell orders a book serves, as many as the top orders endpoint returns
+BOOK_DEPTH = 5
+
+# last part of the websocket event route -> whether it adds or removes
+ORDER_EVENTS = {
+    "newOrder": True,
+    "updatedOrder": True,
+    "removedOrder": False,
+    "deletedOrder": False,
+}
+
+
+class StreamUser(msgspec.Struct, gc=False):
+    status: str | None = None
+
+
+class StreamOrder(msgspec.Struct, gc=False):
+    """An order as the websocket sends it, removals only carry the id."""
+
+    id: str
+    type: str = "sell"
+    platinum: int = 0
+    quantity: int = 1
+    visible: bool = True
+    item_id: str | None = msgspec.field(default=None, name="itemId")
+    rank: int | None = None
+    charges: int | None = None
+    subtype: str | None = None
+    user: StreamUser | None = None
+
+    @property
+    def ingame(self) -> bool:
+        # the top orders endpoint the books start from only lists these
+        return self.user is not None and self.user.status == "ingame"
+
+
+class OrderBook:
+    """
+    Sell orders of one order cache key, cheapest first.
+
+    Prices are kept in a sorted list, so adding or removing an order is a
+    binary search and the cheapest orders are the head of the list. The
+    book starts from the orders fetched over REST, the orders behind those
+    are unknown, so it is only complete while it holds at least as many
+    orders as it started with.
+    """
+
+    def __init__(self, key: OrderKey, orders: Iterable[StreamOrder]):
+        self.key = key
+        self._prices: list[tuple[int, str]] = []
+        self._orders: dict[str, StreamOrder] = {}
+        for order in orders:
+            self.add(order)
+        self.depth = len(self._orders)
+        self.updated_at = time.time()
+
+    def matches(self, order: StreamOrder) -> bool:
+        # orders of items without ranks or charges leave them unset, they
+        # match a book keyed with the defaults callers pass for them
+        _, rank, charges, subtype = self.key
+        return (
+            (rank is None or order.rank is None or order.rank == rank)
+            and (charges is None or order.charges is None or order.charges == charges)
+            and (subtype is None or order.subtype == subtype)
+        )
+
+    def add(self, order: StreamOrder) -> None:
+        self.remove(order.id)
+        self._orders[order.id] = order
+        bisect.insort(self._prices, (order.platinum, order.id))
+        self.updated_at = time.time()
+
+    def remove(self, order_id: str) -> bool:
+        order = self._orders.pop(order_id, None)
+        if order is None:
+            return False
+        index = bisect.bisect_left(self._prices, (order.platinum, order_id))
+        del self._prices[index]
+        self.updated_at = time.time()
+        return True
+
+    @property
+    def complete(self) -> bool:
+        return len(self._orders) >= self.depth
+
+    def top(self) -> list[StreamOrder]:
+        return [self._orders[order_id] for _, order_id in self._prices[:BOOK_DEPTH]]
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self._orders
+
+
+class LocalOrderBook:
+    """
+    Live sell orders of the items looked up recently, kept up to date from
+    the market websocket.
+
+    An item is tracked from the moment the order cache fetches its orders
+    over REST. While the feed is connected, order events update the books
+    and the order cache reads them instead of asking the market again.
+    Events missed while disconnected cannot be recovered, so the books are
+    dropped on disconnect and everything goes back to REST polling.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._books = LRUCache(maxsize=settings.MARKET_ORDERS_LOCAL_SIZE)
+            cls._instance._by_slug = {}
+            cls._instance._slugs = {}
+            cls._instance._slugs_version = None
+            cls._instance.live = False
+            cls._instance._stats = {
+                "events": 0,
+                "ignored": 0,
+                "seeded": 0,
+                "reads": 0,
+                "incomplete": 0,
+            }
+        return cls._instance
+
+    async def load_items(self, items: list[dict[str, Any]] | None = None) -> None:
+        """
+        Map market item ids to slugs, events only name the item id. Items
+        default to the market items cache, mapped again once it reloads.
+        """
+        if items is None:
+            if self._slugs and market_items_cache.version == self._slugs_version:
+                return
+            items = await market_items_cache.get_items()
+        self._slugs = {item["id"]: item["slug"] for item in items if item.get("id")}
+        self._slugs_version = market_items_cache.version
+
+    def seed(self, key: OrderKey, orders: Iterable[Any]) -> None:
+        """Track key from orders fetched over REST, while the feed is live."""
+        if not self.live:
+            return
+        self._books[key] = OrderBook(
+            key,
+            (
+                StreamOrder(
+                    id=order.id,
+                    platinum=order.platinum,
+                    quantity=order.quantity,
+                    rank=order.rank,
+                    charges=order.charges,
+                    subtype=order.subtype,
+                )
+                for order in orders
+            ),
+        )
+        self._by_slug.setdefault(key[0], set()).add(key)
+        self._stats["seeded"] += 1
+
+    def top(self, key: OrderKey) -> list[StreamOrder] | None:
+        """Cheapest sell orders of key, None unless the book can be trusted."""
+        if not self.live:
+            return None
+        book = self._books.get(key)
+        if book is None:
+            return None
+        if not book.complete:
+            self._stats["incomplete"] += 1
+            return None
+        self._stats["reads"] += 1
+        return book.top()
+
+    def _books_of(self, slug: str) -> list[OrderBook]:
+        # books evicted from the LRU are forgotten here as well
+        keys = {key for key in self._by_slug.get(slug, ()) if key in self._books}
+        if keys:
+            self._by_slug[slug] = keys
+        else:
+            self._by_slug.pop(slug, None)
+        return [self._books[key] for key in keys]
+
+    def apply(self, message: dict[str, Any]) -> bool:
+        """Apply a websocket message, False if it is not an order event."""
+        action = str(message.get("route", "")).rsplit("/", 1)[-1]
+        adds = ORDER_EVENTS.get(action)
+        try:
+            if adds is None:
+                raise ValueError(f"not an order event: {action}")
+            order = msgspec.convert(message.get("payload"), type=StreamOrder)
+        except (ValueError, msgspec.ValidationError) as e:
+            logger.debug(f"Ignored market event: {e}")
+            self._stats["ignored"] += 1
+            return False
+
+        self._stats["events"] += 1
+        slug = self._slugs.get(order.item_id)
+        if slug is not None:
+            books = self._books_of(slug)
+        else:
+            # removals may only carry the order id
+            books = [book for book in self._books.values() if order.id in book]
+
+        # a seller leaving the game takes their orders out of the book
+        keep = adds and order.type == "sell" and order.visible and order.ingame
+        for book in books:
+            if keep and book.matches(order):
+                book.add(order)
+            else:
+                book.remove(order.id)
+        return True
+
+    def reset(self) -> None:
+        """Stop serving from the books, they miss the events of a disconnect."""
+        self.live = False
+        self._books.clear()
+        self._by_slug.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {"live": self.live, "books": len(self._books), **self._stats}
+
+
+order_book = LocalOrderBook()
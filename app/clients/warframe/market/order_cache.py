@@ -0,0 +1,259 @@
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+
+from cachetools import LRUCache
+from warframe_market.common import Subtype
+
+from app.clients.redis import async_redis_client
+from app.clients.warframe.market.client import MarketClient, market_client
+from app.clients.warframe.market.items_cache import market_items_cache
+from app.clients.warframe.market.order_book import order_book
+from app.clients.warframe.market.price_history import price_history, series_id
+from app.clients.warframe.market.scheduler import Priority, market_priority
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+OrderKey = tuple[str, int | None, int | None, str | None]
+
+
+@dataclass(frozen=True)
+class TopOrder:
+    platinum: int
+    quantity: int
+
+
+@dataclass(frozen=True)
+class CachedOrders:
+    orders: tuple[TopOrder, ...]
+    fetched_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.age < settings.MARKET_ORDERS_TTL
+
+    @property
+    def is_usable(self) -> bool:
+        return self.age < settings.MARKET_ORDERS_STALE_TTL
+
+
+class MarketOrderCache:
+    """
+    Top sell orders per (slug, rank, charges, subtype).
+
+    Entries live in process memory and in Redis, so every cog and every
+    process shares the same results. Fresh entries are returned as is.
+    Stale entries are still returned, with a refresh started in the
+    background. Concurrent requests for the same key share one upstream
+    call. Rank and charges are dropped for items that have none, so every
+    caller of an item shares one entry whatever defaults it passes. While the market order feed is connected, items it tracks are
+    read from the live local order book instead. Price history is recorded
+    from either source, at most once per MARKET_ORDERS_TTL for each key.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._local = LRUCache(
+                maxsize=settings.MARKET_ORDERS_LOCAL_SIZE
+            )
+            cls._instance._inflight = {}
+            # when price history was last recorded for a key
+            cls._instance._recorded_at = LRUCache(
+                maxsize=settings.MARKET_ORDERS_LOCAL_SIZE
+            )
+            cls._instance._stats = {
+                "hits": 0,
+                "stale_hits": 0,
+                "redis_hits": 0,
+                "book_hits": 0,
+                "misses": 0,
+                "coalesced": 0,
+                "upstream_errors": 0,
+            }
+        return cls._instance
+
+    @property
+    def client(self) -> MarketClient:
+        return market_client
+
+    @staticmethod
+    def make_key(
+        slug: str,
+        rank: int | None = None,
+        charges: int | None = None,
+        subtype: Subtype | None = None,
+    ) -> OrderKey:
+        return (slug, rank, charges, subtype.value if subtype else None)
+
+    async def canonical_key(
+        self,
+        slug: str,
+        rank: int | None = None,
+        charges: int | None = None,
+        subtype: Subtype | None = None,
+    ) -> OrderKey:
+        """make_key without the rank or charges an item does not have."""
+        try:
+            item = await market_items_cache.get_item(slug)
+        except Exception as e:
+            logger.warning(f"Could not look up market item {slug}: {e}")
+            item = None
+        if item is not None:
+            if item.get("max_rank") is None:
+                rank = None
+            if item.get("max_charges") is None:
+                charges = None
+        return self.make_key(slug, rank, charges, subtype)
+
+    @staticmethod
+    def redis_key(key: OrderKey) -> str:
+        slug, rank, charges, subtype = key
+        return (
+            f"wfm_orders:{slug}:{rank}:{charges}:{subtype}:{settings.CACHE_VERSION}"
+        )
+
+    async def get(
+        self,
+        slug: str,
+        rank: int | None = None,
+        charges: int | None = None,
+        subtype: Subtype | None = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> list[TopOrder]:
+        """Top sell orders, cheapest first. Misses are fetched in `priority`."""
+        key = await self.canonical_key(slug, rank, charges, subtype)
+
+        live = order_book.top(key)
+        if live is not None:
+            self._stats["book_hits"] += 1
+            # the book replaces REST fetches, so it feeds the history too
+            await self._record(key, [order.platinum for order in live])
+            return [
+                TopOrder(platinum=order.platinum, quantity=order.quantity)
+                for order in live
+            ]
+
+        cached = self._local.get(key)
+        if cached is None or not cached.is_fresh:
+            shared = await self._load_shared(key)
+            if shared is not None and (
+                cached is None or shared.fetched_at > cached.fetched_at
+            ):
+                self._stats["redis_hits"] += 1
+                self._local[key] = cached = shared
+
+        if cached is not None and cached.is_fresh:
+            self._stats["hits"] += 1
+            return list(cached.orders)
+
+        if cached is not None and cached.is_usable:
+            self._stats["stale_hits"] += 1
+            # refreshes of data we can still serve wait behind interactive calls
+            self._fetch(key, subtype, Priority.BACKGROUND)
+            return list(cached.orders)
+
+        self._stats["misses"] += 1
+        # shielded so a cancelled caller does not cancel it for the others
+        fetched = await asyncio.shield(
+            self._fetch(key, subtype, priority)
+        )
+        return list(fetched.orders)
+
+    def _fetch(
+        self, key: OrderKey, subtype: Subtype | None, priority: Priority
+    ) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is not None:
+            self._stats["coalesced"] += 1
+            return task
+
+        task = asyncio.create_task(self._fetch_upstream(key, subtype, priority))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._on_fetched(key, done))
+        return task
+
+    def _on_fetched(self, key: OrderKey, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            self._stats["upstream_errors"] += 1
+            logger.warning(f"Failed to fetch orders for {key}: {task.exception()}")
+
+    async def _fetch_upstream(
+        self, key: OrderKey, subtype: Subtype | None, priority: Priority
+    ) -> CachedOrders:
+        slug, rank, charges, _ = key
+        with market_priority(priority):
+            result = await self.client.get_top_orders_for_item(
+                slug=slug, rank=rank, charges=charges, subtype=subtype
+            )
+        cached = CachedOrders(
+            orders=tuple(
+                TopOrder(platinum=order.platinum, quantity=order.quantity)
+                for order in result.data.sell
+            ),
+            fetched_at=time.time(),
+        )
+        self._local[key] = cached
+        # the live book starts from these and follows the feed from now on
+        order_book.seed(key, result.data.sell)
+        await self._store_shared(key, cached)
+        await self._record(key, [order.platinum for order in cached.orders])
+        return cached
+
+    async def _record(self, key: OrderKey, platinum: list[int]) -> None:
+        now = time.time()
+        if now - self._recorded_at.get(key, 0) < settings.MARKET_ORDERS_TTL:
+            return
+        self._recorded_at[key] = now
+        await price_history.record(series_id(*key), platinum)
+
+    async def _load_shared(self, key: OrderKey) -> CachedOrders | None:
+        raw = await async_redis_client.get(self.redis_key(key))
+        if not raw:
+            return None
+        try:
+            data = json.loads(raw)
+            return CachedOrders(
+                orders=tuple(
+                    TopOrder(platinum=platinum, quantity=quantity)
+                    for platinum, quantity in data["orders"]
+                ),
+                fetched_at=data["fetched_at"],
+            )
+        except Exception as e:
+            logger.warning(f"Invalid cached orders for {key}: {e}")
+            return None
+
+    async def _store_shared(self, key: OrderKey, cached: CachedOrders) -> None:
+        payload = {
+            "fetched_at": cached.fetched_at,
+            "orders": [[order.platinum, order.quantity] for order in cached.orders],
+        }
+        await async_redis_client.set(
+            self.redis_key(key),
+            json.dumps(payload),
+            ex=settings.MARKET_ORDERS_STALE_TTL,
+        )
+
+    def invalidate(self) -> None:
+        self._local.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "local_entries": len(self._local),
+            "inflight": len(self._inflight),
+            **self._stats,
+        }
+
+
+market_order_cache = MarketOrderCache()
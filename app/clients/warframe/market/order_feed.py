@@ -0,0 +1,120 @@
+import asyncio
+import json
+import logging
+import random
+import time
+
+import aiohttp
+
+from app.clients.warframe.market.order_book import order_book
+from app.config.settings import settings
+from app.utils.http import http_client
+
+logger = logging.getLogger(__name__)
+
+# asks the market to send every new, changed and removed order
+SUBSCRIBE = {"route": "@wfm|cmd/subscribe/newOrders", "payload": {}}
+
+
+class MarketOrderFeed:
+    """
+    Keeps the local order book live from the warframe.market websocket.
+
+    The book is served only while the socket is connected. On disconnect it
+    is reset, commands go back to REST polling through the order cache and
+    the feed reconnects with jittered backoff.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._task = None
+            cls._instance._stats = {
+                "connected": False,
+                "connections": 0,
+                "disconnects": 0,
+                "messages": 0,
+                "last_message_at": None,
+            }
+        return cls._instance
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, url: str | None = None) -> asyncio.Task:
+        """Start the background task that follows the websocket."""
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run(url or settings.MARKET_WS_URL))
+        return self._task
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        order_book.reset()
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        return random.uniform(0, min(settings.MARKET_WS_MAX_BACKOFF, 2**attempt))
+
+    async def _run(self, url: str) -> None:
+        logger.info(f"Market order feed started on {url}")
+        attempt = 0
+        while True:
+            try:
+                await self._consume(url)
+                attempt = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Market order feed disconnected: {e}")
+                attempt += 1
+            finally:
+                order_book.reset()
+                if self._stats["connected"]:
+                    self._stats["disconnects"] += 1
+                self._stats["connected"] = False
+            await asyncio.sleep(self._backoff(attempt))
+
+    async def _consume(self, url: str) -> None:
+        await order_book.load_items()
+        async with http_client.ws_connect(
+            url, heartbeat=settings.MARKET_WS_HEARTBEAT, protocols=("wfm",)
+        ) as ws:
+            await ws.send_json(SUBSCRIBE)
+            self._stats["connected"] = True
+            self._stats["connections"] += 1
+            order_book.live = True
+            logger.info("Market order feed connected, serving live order books")
+
+            async for message in ws:
+                if message.type == aiohttp.WSMsgType.TEXT:
+                    self._stats["messages"] += 1
+                    self._stats["last_message_at"] = time.time()
+                    self._handle(message.data)
+                elif message.type == aiohttp.WSMsgType.ERROR:
+                    raise ws.exception() or ConnectionError("websocket error")
+        logger.info("Market order feed closed by the server")
+
+    @staticmethod
+    def _handle(data: str) -> None:
+        try:
+            message = json.loads(data)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Invalid market feed message: {e}")
+            return
+        if isinstance(message, dict):
+            order_book.apply(message)
+
+    def stats(self) -> dict:
+        return {"running": self.is_running, **self._stats, **order_book.stats()}
+
+
+market_order_feed = MarketOrderFeed()
@@ -3,6 +3,9 @@ from enum import Enum
 from warframe_market.client import WarframeMarketClient
 from warframe_market.common import Subtype
 
+from app.clients.warframe.market.client import market_client
+from app.clients.warframe.market.order_cache import market_order_cache
+
 
 class ItemSubtype(Enum):
     CRAFTED = "crafted"
@@ -20,7 +23,7 @@ class PriceCheck:
         self.client = (
             client
             if isinstance(client, WarframeMarketClient)
-            else WarframeMarketClient()
+            else market_client
         )
         self.item = item
 
@@ -56,10 +59,10 @@ class PriceCheck:
         """
         Check the raw price of an item, return a list with the prices
         """
-        orders = await self.client.get_top_orders_for_item(
-            slug=self.slug, rank=rank, charges=charges, subtype=subtype
+        orders = await market_order_cache.get(
+            self.slug, rank=rank, charges=charges, subtype=subtype
         )
-        orders = [order.platinum for order in orders.data.sell]
+        orders = [order.platinum for order in orders]
 
         if len(orders) == 0:
             return []
@@ -72,10 +75,10 @@ class PriceCheck:
         charges: int = 3,
         subtype: Subtype | None = None,
     ):
-        orders = await self.client.get_top_orders_for_item(
-            slug=self.slug, rank=rank, charges=charges, subtype=subtype
+        orders = await market_order_cache.get(
+            self.slug, rank=rank, charges=charges, subtype=subtype
         )
-        orders = [order.platinum for order in orders.data.sell]
+        orders = [order.platinum for order in orders]
         # if less than 5 orders, fill the rest with N/A
         # orders += ["N/A"] * (5 - len(orders))
         if len(orders) == 0:
@@ -90,12 +93,10 @@ class PriceCheck:
         charges: int = 3,
         subtype: Subtype | None = None,
     ):
-        orders = await self.client.get_top_orders_for_item(
-            slug=self.slug, rank=rank, charges=charges, subtype=subtype
+        orders = await market_order_cache.get(
+            self.slug, rank=rank, charges=charges, subtype=subtype
         )
-        orders = [
-            f"{order.platinum}p × ({order.quantity})" for order in orders.data.sell
-        ]
+        orders = [f"{order.platinum}p × ({order.quantity})" for order in orders]
         # if less than 5 orders, fill the rest with N/A
         # orders += ["N/A"] * (5 - len(orders))
         if len(orders) == 0:
@@ -0,0 +1,282 @@
+import logging
+import math
+import statistics
+import time
+from collections import defaultdict
+from typing import Iterable
+
+import msgspec
+from redis.asyncio.client import Pipeline
+
+from app.clients.redis import Lease, async_redis_client
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+HOUR = 3600
+DAY = 86400
+# bucket size of each resolution, raw points are kept as recorded
+RESOLUTIONS: dict[str, int] = {"raw": 0, "hour": HOUR, "day": DAY}
+# which resolution each one is compacted from
+COMPACTED_FROM = {"hour": "raw", "day": "hour"}
+# cheapest sell orders averaged into top5
+TOP_ORDERS = 5
+
+
+class PricePoint(msgspec.Struct, array_like=True, gc=False):
+    """
+    Sell prices of an item at one moment, or over one bucket once compacted:
+    the lowest minimum, the median of the medians and the average top5.
+    """
+
+    at: float
+    min: float
+    median: float
+    # average of the TOP_ORDERS cheapest sell orders
+    top5: float
+    # raw points the bucket was compacted from
+    samples: int = 1
+
+
+def series_id(
+    slug: str,
+    rank: int | None = None,
+    charges: int | None = None,
+    subtype: str | None = None,
+) -> str:
+    return f"{slug}:{rank}:{charges}:{subtype}"
+
+
+def retention(resolution: str) -> int:
+    return {
+        "raw": settings.PRICE_HISTORY_RAW_RETENTION,
+        "hour": settings.PRICE_HISTORY_HOURLY_RETENTION,
+        "day": settings.PRICE_HISTORY_DAILY_RETENTION,
+    }[resolution]
+
+
+def make_point(platinum: list[int], at: float) -> PricePoint | None:
+    """A raw point from sell prices, cheapest first."""
+    if not platinum:
+        return None
+    top = platinum[:TOP_ORDERS]
+    return PricePoint(
+        at=at,
+        min=float(platinum[0]),
+        median=float(statistics.median(platinum)),
+        top5=round(statistics.fmean(top), 2),
+    )
+
+
+def downsample(points: Iterable[PricePoint], size: int) -> list[PricePoint]:
+    """Aggregate points into buckets of size seconds, oldest first."""
+    buckets = defaultdict(list)
+    for point in points:
+        buckets[point.at - point.at % size].append(point)
+    return [
+        PricePoint(
+            at=start,
+            min=min(point.min for point in bucket),
+            median=float(statistics.median(point.median for point in bucket)),
+            top5=round(statistics.fmean(point.top5 for point in bucket), 2),
+            samples=sum(point.samples for point in bucket),
+        )
+        for start, bucket in sorted(buckets.items())
+    ]
+
+
+class PriceTrend(msgspec.Struct, gc=False):
+    current: float
+    # time weighted average of the bucket medians, None without history
+    average_7d: float | None = None
+    average_30d: float | None = None
+
+    @property
+    def change(self) -> float | None:
+        """Current price against the 7 day average, as a fraction."""
+        if not self.average_7d:
+            return None
+        return self.current / self.average_7d - 1
+
+
+class PriceHistory:
+    """
+    Sell price history of every order cache entry, in Redis sorted sets.
+
+    Each series has one sorted set per resolution, scored by time, with one
+    JSON array per point so members stay readable from redis-cli. Raw
+    points are added whenever the order cache fetches orders from the
+    market. The compaction job rolls closed hours of raw points into hourly
+    points and closed days of hourly points into daily ones, and trims
+    every resolution to its retention.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._stats = {"recorded": 0, "compacted": 0}
+        return cls._instance
+
+    @staticmethod
+    def key(series: str, resolution: str) -> str:
+        return f"price_history:{resolution}:{series}:{settings.CACHE_VERSION}"
+
+    @property
+    def index_key(self) -> str:
+        return f"price_history_series:{settings.CACHE_VERSION}"
+
+    @staticmethod
+    def _decode(members: list[str]) -> list[PricePoint]:
+        points = []
+        for member in members:
+            try:
+                points.append(msgspec.json.decode(member, type=PricePoint))
+            except msgspec.DecodeError as e:
+                logger.warning(f"Invalid price history point: {e}")
+        return points
+
+    @staticmethod
+    def _add(pipe: Pipeline, key: str, points: list[PricePoint]) -> None:
+        for point in points:
+            # a bucket compacted again replaces its previous point
+            pipe.zremrangebyscore(key, point.at, point.at)
+        pipe.zadd(
+            key, {msgspec.json.encode(point).decode(): point.at for point in points}
+        )
+
+    async def record(self, series: str, platinum: list[int]) -> bool:
+        """Add a raw point for series from its sell prices, cheapest first."""
+        if not settings.PRICE_HISTORY_ENABLED:
+            return False
+        now = time.time()
+        point = make_point(platinum, now)
+        if point is None:
+            return False
+
+        key = self.key(series, "raw")
+        pipe = async_redis_client.pipeline()
+        self._add(pipe, key, [point])
+        pipe.zremrangebyscore(key, "-inf", now - retention("raw"))
+        pipe.sadd(self.index_key, series)
+        recorded = await async_redis_client.execute_pipeline(pipe) is not None
+        if recorded:
+            self._stats["recorded"] += 1
+        return recorded
+
+    async def buckets(
+        self, series: str, since: float
+    ) -> list[tuple[PricePoint, int]]:
+        """
+        Hourly points since a time with their bucket size, oldest first.
+        Daily points stand in for hours that are no longer kept and hours
+        not compacted yet are downsampled from the raw points on the fly.
+        """
+        pipe = async_redis_client.pipeline()
+        for resolution in RESOLUTIONS:
+            pipe.zrangebyscore(self.key(series, resolution), since, "+inf")
+        results = await async_redis_client.execute_pipeline(pipe)
+        if results is None:
+            return []
+        raw, hours, days = (self._decode(members) for members in results)
+
+        compacted_until = hours[-1].at + HOUR if hours else -math.inf
+        hours += downsample(
+            (point for point in raw if point.at >= compacted_until), HOUR
+        )
+        first_hour = hours[0].at if hours else math.inf
+        return [(day, DAY) for day in days if day.at + DAY <= first_hour] + [
+            (hour, HOUR) for hour in hours
+        ]
+
+    async def trend(self, series: str, current: float) -> PriceTrend:
+        """A current price against the 7 and 30 day averages of series."""
+        now = time.time()
+        buckets = await self.buckets(series, now - 30 * DAY)
+
+        def average(days: int) -> float | None:
+            recent = [
+                (point.median, size)
+                for point, size in buckets
+                if point.at >= now - days * DAY
+            ]
+            total = sum(size for _, size in recent)
+            if not total:
+                return None
+            return round(sum(price * size for price, size in recent) / total, 2)
+
+        return PriceTrend(
+            current=current, average_7d=average(7), average_30d=average(30)
+        )
+
+    async def compact(self, lease: Lease | None = None, batch: int = 200) -> int:
+        """
+        Roll closed buckets up one resolution at a time, hours before days
+        so a day includes the hours compacted in the same run, and apply the
+        retention of every resolution. Returns the number of points written.
+        """
+        series = sorted(await async_redis_client.smembers(self.index_key))
+        written = 0
+        for resolution in COMPACTED_FROM:
+            for i in range(0, len(series), batch):
+                written += await self._compact(
+                    series[i : i + batch], resolution, lease
+                )
+        self._stats["compacted"] += written
+        return written
+
+    async def _compact(
+        self, series: list[str], resolution: str, lease: Lease | None
+    ) -> int:
+        now = time.time()
+        size = RESOLUTIONS[resolution]
+        source = COMPACTED_FROM[resolution]
+
+        # the last compacted point of each series, to resume after it
+        pipe = async_redis_client.pipeline()
+        for name in series:
+            pipe.zrange(self.key(name, resolution), -1, -1, withscores=True)
+        lasts = await async_redis_client.execute_pipeline(pipe)
+        if lasts is None:
+            return 0
+
+        pipe = async_redis_client.pipeline()
+        # only buckets that are over, the current one is still filling
+        end = now - now % size
+        for name, last in zip(series, lasts):
+            start = last[0][1] + size if last else "-inf"
+            pipe.zrangebyscore(self.key(name, source), start, f"({end}")
+        results = await async_redis_client.execute_pipeline(pipe)
+        if results is None:
+            return 0
+
+        compacted = {
+            name: downsample(self._decode(members), size)
+            for name, members in zip(series, results)
+        }
+
+        def apply(pipe: Pipeline) -> None:
+            for name, points in compacted.items():
+                if points:
+                    self._add(pipe, self.key(name, resolution), points)
+                for trimmed in (source, resolution):
+                    pipe.zremrangebyscore(
+                        self.key(name, trimmed), "-inf", now - retention(trimmed)
+                    )
+
+        if lease is not None:
+            stored = await lease.fenced(apply)
+        else:
+            pipe = async_redis_client.pipeline()
+            apply(pipe)
+            stored = await async_redis_client.execute_pipeline(pipe) is not None
+        if not stored:
+            raise RuntimeError("Failed to store compacted price history")
+        return sum(len(points) for points in compacted.values())
+
+    def stats(self) -> dict[str, int]:
+        return dict(self._stats)
+
+
+price_history = PriceHistory()
@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import statistics
+import time
+from typing import Any, Iterable
+
+import msgspec
+from warframe_market.common import Subtype
+
+from app.clients.redis import Lease, async_redis_client, redis_codec
+from app.clients.warframe.market.items_cache import market_items_cache
+from app.clients.warframe.market.order_cache import market_order_cache
+from app.clients.warframe.market.scheduler import Priority
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# sell orders averaged into an item's price, one cheap outlier does not count
+PRICE_ORDERS = 3
+
+
+class PriceSnapshot(msgspec.Struct, gc=False):
+    """Platinum and ducat value of a set of items, by lower-case item name."""
+
+    taken_at: float
+    prices: dict[str, float] = {}
+    ducats: dict[str, int] = {}
+    # names without a market item or without sell orders
+    missing: list[str] = []
+
+    def price(self, name: str) -> float | None:
+        return self.prices.get(name.lower())
+
+    def ducat_value(self, name: str) -> int:
+        return self.ducats.get(name.lower(), 0)
+
+
+def summarize(platinum: list[int]) -> float | None:
+    """Price of an item from its sell orders, cheapest first."""
+    if not platinum:
+        return None
+    return float(statistics.median(platinum[:PRICE_ORDERS]))
+
+
+async def fetch_price(
+    item: dict[str, Any], priority: Priority = Priority.BACKGROUND
+) -> float | None:
+    """
+    Price of a market item from the order cache. Parts that trade as
+    blueprint or crafted are priced as the blueprint, which is what relics
+    drop and sets are made of.
+    """
+    subtype = None
+    if Subtype.BLUEPRINT.value in (item.get("subtypes") or []):
+        subtype = Subtype.BLUEPRINT
+    orders = await market_order_cache.get(
+        item["slug"], subtype=subtype, priority=priority
+    )
+    return summarize([order.platinum for order in orders])
+
+
+async def take_price_snapshot(names: Iterable[str]) -> PriceSnapshot:
+    """
+    Price every item in names from its top sell orders.
+
+    Orders come through the market order cache in the background lane, so
+    the snapshot also warms the cache and never holds up commands. Names
+    are matched to market items by name, ones the market does not list
+    (Forma Blueprint and the like) are only recorded as missing.
+    """
+    by_name = {
+        item["name"].lower(): item
+        for item in await market_items_cache.get_items()
+        if item.get("name")
+    }
+    wanted = sorted({name.lower() for name in names})
+    semaphore = asyncio.Semaphore(settings.PRICE_SNAPSHOT_CONCURRENCY)
+
+    async def fetch(name: str) -> float | None:
+        async with semaphore:
+            try:
+                return await fetch_price(by_name[name])
+            except Exception as e:
+                logger.warning(f"Failed to price {name}: {e}")
+                return None
+
+    listed = [name for name in wanted if name in by_name]
+    prices = await asyncio.gather(*(fetch(name) for name in listed))
+
+    snapshot = PriceSnapshot(
+        taken_at=time.time(),
+        prices={
+            name: price for name, price in zip(listed, prices) if price is not None
+        },
+        ducats={name: by_name[name].get("ducats") or 0 for name in listed},
+    )
+    snapshot.missing = [name for name in wanted if name not in snapshot.prices]
+    return snapshot
+
+
+class PriceSnapshotStore:
+    """
+    The latest price snapshot, shared through Redis.
+
+    The job that takes the snapshot writes it under its lease, every
+    process reads it from Redis at most every _check_interval seconds.
+    """
+
+    _instance = None
+    _check_interval: int = 60
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._snapshot = None
+            cls._instance._checked_at = 0.0
+        return cls._instance
+
+    @property
+    def key(self) -> str:
+        return f"price_snapshot:{settings.CACHE_VERSION}"
+
+    async def get(self) -> PriceSnapshot | None:
+        if time.time() - self._checked_at >= self._check_interval:
+            self._checked_at = time.time()
+            stored = await async_redis_client.get_decoded(
+                self.key, type=PriceSnapshot
+            )
+            if stored is not None:
+                self._snapshot = stored
+        return self._snapshot
+
+    async def save(self, snapshot: PriceSnapshot, lease: Lease | None = None) -> bool:
+        payload = redis_codec.encode(snapshot)
+        if lease is not None:
+            stored = await lease.fenced(lambda pipe: pipe.set(self.key, payload))
+        else:
+            stored = await async_redis_client.set(self.key, payload)
+        if stored:
+            self._snapshot = snapshot
+            self._checked_at = time.time()
+        return bool(stored)
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "taken_at": snapshot.taken_at if snapshot else None,
+            "priced": len(snapshot.prices) if snapshot else 0,
+            "missing": len(snapshot.missing) if snapshot else 0,
+        }
+
+
+price_snapshot_store = PriceSnapshotStore()
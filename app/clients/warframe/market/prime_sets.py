@@ -0,0 +1,239 @@
+import asyncio
+import logging
+import math
+import time
+
+import msgspec
+
+from app.clients.redis import Lease, async_redis_client
+from app.clients.warframe.market.items_cache import market_items_cache
+from app.clients.warframe.market.price_check import PriceCheck
+from app.clients.warframe.market.price_snapshot import fetch_price
+from app.clients.warframe.market.scheduler import Priority, market_priority
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+SORTS = ("spread", "ducats", "set_price", "parts_price")
+
+
+class SetPart(msgspec.Struct, gc=False):
+    name: str
+    slug: str
+    quantity: int = 1
+    price: float | None = None
+    ducats: int = 0
+
+
+class PrimeSetValue(msgspec.Struct, gc=False):
+    """What a prime set is worth whole, in parts and in ducats."""
+
+    name: str
+    slug: str
+    parts: list[SetPart] = []
+    set_price: float | None = None
+    # sum of the parts, None unless every part has a price
+    parts_price: float | None = None
+    # selling the parts instead of the set, positive when the parts earn more
+    spread: float | None = None
+    ducats: int = 0
+    ducats_per_platinum: float | None = None
+    updated_at: float = 0.0
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.updated_at
+
+    def sort_value(self, sort: str) -> float:
+        if sort == "ducats":
+            value = self.ducats_per_platinum
+        else:
+            value = getattr(self, sort)
+        return value if value is not None else -math.inf
+
+
+def valuate(
+    name: str, slug: str, parts: list[SetPart], set_price: float | None
+) -> PrimeSetValue:
+    parts_price = None
+    if parts and all(part.price is not None for part in parts):
+        parts_price = sum(part.price * part.quantity for part in parts)
+    ducats = sum(part.ducats * part.quantity for part in parts)
+
+    spread = ducats_per_platinum = None
+    if parts_price is not None and set_price is not None:
+        spread = parts_price - set_price
+    if parts_price:
+        ducats_per_platinum = round(ducats / parts_price, 2)
+
+    return PrimeSetValue(
+        name=name,
+        slug=slug,
+        parts=parts,
+        set_price=set_price,
+        parts_price=parts_price,
+        spread=spread,
+        ducats=ducats,
+        ducats_per_platinum=ducats_per_platinum,
+        updated_at=time.time(),
+    )
+
+
+async def value_prime_set(
+    name: str,
+    known: PrimeSetValue | None = None,
+    priority: Priority = Priority.BACKGROUND,
+) -> PrimeSetValue:
+    """
+    Price a prime set and its parts. The parts of a set do not change, so
+    those of a known value are reused instead of asking the market again.
+    """
+    items = {item["slug"]: item for item in await market_items_cache.get_items()}
+
+    if known is not None:
+        slug = known.slug
+        parts = [
+            SetPart(name=part.name, slug=part.slug, quantity=part.quantity)
+            for part in known.parts
+        ]
+    else:
+        with market_priority(priority):
+            try:
+                checker = PriceCheck(item=f"{name} set")
+                pieces = await checker.get_set_pieces()
+            except Exception:
+                checker = PriceCheck(item=name)
+                pieces = await checker.get_set_pieces()
+        slug = next(
+            (data["slug"] for data in pieces.values() if data["set"]), checker.slug
+        )
+        parts = [
+            SetPart(name=piece, slug=data["slug"], quantity=data["quantity"] or 1)
+            for piece, data in pieces.items()
+            if not data["set"]
+        ]
+
+    async def price(slug: str) -> float | None:
+        try:
+            return await fetch_price(items.get(slug, {"slug": slug}), priority)
+        except Exception as e:
+            logger.warning(f"Failed to price {slug}: {e}")
+            return None
+
+    prices = await asyncio.gather(
+        price(slug), *(price(part.slug) for part in parts)
+    )
+    for part, part_price in zip(parts, prices[1:]):
+        part.price = part_price
+        part.ducats = (items.get(part.slug) or {}).get("ducats") or 0
+    return valuate(name, slug, parts, prices[0])
+
+
+class PrimeSetStore:
+    """
+    Valuation of every prime set, one Redis hash field per set.
+
+    The prime sets job refreshes the sets with the highest priority first:
+    the older a value and the more often a set is looked up, the sooner it
+    is priced again. Lookups read a single field, the sorted views work
+    from the whole table, read from Redis at most every _check_interval
+    seconds.
+    """
+
+    _instance = None
+    _check_interval: int = 60
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._table = {}
+            cls._instance._checked_at = 0.0
+        return cls._instance
+
+    @property
+    def key(self) -> str:
+        return f"prime_sets:{settings.CACHE_VERSION}"
+
+    @property
+    def popularity_key(self) -> str:
+        return f"prime_sets_popularity:{settings.CACHE_VERSION}"
+
+    @staticmethod
+    def _decode(raw: str | None) -> PrimeSetValue | None:
+        if raw is None:
+            return None
+        try:
+            return msgspec.json.decode(raw, type=PrimeSetValue)
+        except msgspec.DecodeError as e:
+            logger.warning(f"Invalid cached prime set value: {e}")
+            return None
+
+    async def get(self, name: str) -> PrimeSetValue | None:
+        return self._decode(await async_redis_client.hget(self.key, name))
+
+    async def all(self) -> dict[str, PrimeSetValue]:
+        if time.time() - self._checked_at >= self._check_interval:
+            self._checked_at = time.time()
+            stored = await async_redis_client.hgetall(self.key)
+            table = {name: self._decode(raw) for name, raw in stored.items()}
+            self._table = {name: value for name, value in table.items() if value}
+        return self._table
+
+    async def save(
+        self, values: list[PrimeSetValue], lease: Lease | None = None
+    ) -> bool:
+        if not values:
+            return True
+        mapping = {
+            value.name: msgspec.json.encode(value).decode() for value in values
+        }
+        if lease is not None:
+            stored = await lease.fenced(
+                lambda pipe: pipe.hset(self.key, mapping=mapping)
+            )
+        else:
+            pipe = async_redis_client.pipeline()
+            pipe.hset(self.key, mapping=mapping)
+            stored = await async_redis_client.execute_pipeline(pipe) is not None
+        if stored:
+            self._table.update({value.name: value for value in values})
+        return stored
+
+    async def touch(self, name: str) -> None:
+        """Count a lookup, popular sets are refreshed more often."""
+        await async_redis_client.zincrby(self.popularity_key, 1, name)
+
+    async def due(self, names: list[str], limit: int) -> list[str]:
+        """
+        The sets to refresh next. Sets never priced come first, then the
+        ones whose age, weighted by how often they are looked up, is highest.
+        """
+        table = await self.all()
+        popularity = await async_redis_client.zscores(self.popularity_key)
+
+        def priority(name: str) -> float:
+            value = table.get(name)
+            if value is None:
+                return math.inf
+            return value.age * (1 + math.log1p(popularity.get(name, 0)))
+
+        return sorted(names, key=priority, reverse=True)[:limit]
+
+    async def ranking(
+        self, sort: str = "spread", limit: int = 10
+    ) -> list[PrimeSetValue]:
+        """Sets with the highest sort value first."""
+        if sort not in SORTS:
+            raise ValueError(f"Unknown sort {sort}")
+        values = (await self.all()).values()
+        ranked = sorted(values, key=lambda value: value.sort_value(sort), reverse=True)
+        return ranked[:limit] if limit > 0 else ranked
+
+    def stats(self) -> dict:
+        return {
+            "sets": len(self._table),
+            "oldest": max((value.age for value in self._table.values()), default=None),
+        }
+
+
+prime_set_store = PrimeSetStore()
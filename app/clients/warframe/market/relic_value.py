@@ -0,0 +1,243 @@
+import logging
+import time
+
+import msgspec
+import numpy as np
+
+from app.clients.redis import Lease, async_redis_client, redis_codec
+from app.clients.warframe.market.price_snapshot import PriceSnapshot
+from app.clients.warframe.wiki.models.void import Relic
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# chance of each common, uncommon and rare drop of a relic
+REFINEMENTS: dict[str, tuple[float, float, float]] = {
+    "intact": (0.2533, 0.11, 0.02),
+    "exceptional": (0.2333, 0.13, 0.04),
+    "flawless": (0.20, 0.17, 0.06),
+    "radiant": (0.1667, 0.20, 0.10),
+}
+# relics opened per run, in a radshare everyone picks the best of four drops
+MODES: dict[str, int] = {"solo": 1, "radshare": 4}
+CURRENCIES = ("platinum", "ducats")
+
+RARITIES = {"common": 0, "uncommon": 1, "rare": 2}
+# drops without a rarity are listed common first, rare last
+SLOT_RARITIES = (0, 0, 0, 1, 1, 2)
+SLOTS = len(SLOT_RARITIES)
+
+
+def ranking_key(refinement: str, mode: str, currency: str) -> str:
+    return f"{refinement}:{mode}:{currency}"
+
+
+class RelicValue(msgspec.Struct, gc=False):
+    relic: str
+    vaulted: bool = False
+    is_baro: bool = False
+    # market price of the intact relic itself
+    price: float | None = None
+    # "refinement:mode" -> expected platinum and ducats per relic opened
+    expected: dict[str, tuple[float, float]] = {}
+
+    def value(self, refinement: str, mode: str, currency: str) -> float:
+        return self.expected[f"{refinement}:{mode}"][CURRENCIES.index(currency)]
+
+
+class RelicValues(msgspec.Struct):
+    """Expected value of every relic, with the rankings precomputed."""
+
+    computed_at: float
+    prices_taken_at: float
+    relics: dict[str, RelicValue] = {}
+    # ranking_key() -> relic names, most valuable first
+    rankings: dict[str, list[str]] = {}
+    # drops without a price, counted as worth nothing
+    unpriced: list[str] = []
+
+
+def expected_best(values: np.ndarray, chances: np.ndarray, rolls: int) -> np.ndarray:
+    """
+    Expected value of the best of `rolls` independent drops, over the last
+    axis. With drops sorted most valuable first and F(i) the chance of one
+    of the first i, the best is the i-th with probability
+    (1 - F(i-1))^rolls - (1 - F(i))^rolls. Slots with no drop have a zero
+    chance.
+    """
+    order = np.argsort(-values, axis=-1, kind="stable")
+    values = np.take_along_axis(values, order, axis=-1)
+    chances = np.take_along_axis(chances, order, axis=-1)
+    # the radiant chances add up to a hair over 1
+    none_above = (1 - np.cumsum(chances, axis=-1)).clip(min=0)
+    none_before = np.concatenate(
+        [np.ones_like(none_above[..., :1]), none_above[..., :-1]], axis=-1
+    )
+    return ((none_before**rolls - none_above**rolls) * values).sum(axis=-1)
+
+
+def compute_relic_values(
+    relics: dict[str, Relic], snapshot: PriceSnapshot
+) -> RelicValues:
+    """
+    Expected platinum and ducats of every relic, refinement and mode.
+
+    The drops are laid out as (relic, slot) arrays once, then every
+    refinement, currency and mode is computed over all relics at once.
+    """
+    names = list(relics)
+    values = np.zeros((len(CURRENCIES), len(names), SLOTS))
+    rarity = np.zeros((len(names), SLOTS), dtype=np.intp)
+    present = np.zeros((len(names), SLOTS), dtype=bool)
+    unpriced = set()
+
+    for row, name in enumerate(names):
+        for slot, drop in enumerate(relics[name].drops[:SLOTS]):
+            price = snapshot.price(drop.name)
+            if price is None:
+                unpriced.add(drop.name)
+            values[0, row, slot] = price or 0.0
+            values[1, row, slot] = snapshot.ducat_value(drop.name)
+            rarity[row, slot] = RARITIES.get(
+                (drop.rarity or "").lower(), SLOT_RARITIES[slot]
+            )
+            present[row, slot] = True
+
+    # (refinement, relic, slot)
+    chances = np.array(list(REFINEMENTS.values()))[:, rarity] * present
+    shape = (len(REFINEMENTS), len(CURRENCIES), len(names), SLOTS)
+    values = np.broadcast_to(values[np.newaxis], shape)
+    chances = np.broadcast_to(chances[:, np.newaxis], shape)
+
+    # (mode, refinement, currency, relic)
+    expected = np.stack(
+        [expected_best(values, chances, rolls) for rolls in MODES.values()]
+    ).round(2)
+    order = np.argsort(-expected, axis=-1, kind="stable")
+
+    results = {}
+    for row, name in enumerate(names):
+        relic = relics[name]
+        results[name] = RelicValue(
+            relic=name,
+            vaulted=relic.vaulted,
+            is_baro=relic.is_baro,
+            price=snapshot.price(f"{name} Relic"),
+            expected={
+                f"{refinement}:{mode}": (
+                    float(expected[m, r, 0, row]),
+                    float(expected[m, r, 1, row]),
+                )
+                for m, mode in enumerate(MODES)
+                for r, refinement in enumerate(REFINEMENTS)
+            },
+        )
+
+    rankings = {
+        ranking_key(refinement, mode, currency): [names[i] for i in order[m, r, c]]
+        for m, mode in enumerate(MODES)
+        for r, refinement in enumerate(REFINEMENTS)
+        for c, currency in enumerate(CURRENCIES)
+    }
+    return RelicValues(
+        computed_at=time.time(),
+        prices_taken_at=snapshot.taken_at,
+        relics=results,
+        rankings=rankings,
+        unpriced=sorted(unpriced),
+    )
+
+
+class RelicValueStore:
+    """
+    Precomputed relic values, shared through Redis.
+
+    Lookups and rankings only index what the relic values job computed,
+    every process reads it from Redis at most every _check_interval seconds.
+    """
+
+    _instance = None
+    _check_interval: int = 60
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._values = None
+            cls._instance._by_lower = {}
+            cls._instance._checked_at = 0.0
+        return cls._instance
+
+    @property
+    def key(self) -> str:
+        return f"relic_values:{settings.CACHE_VERSION}"
+
+    def _use(self, values: RelicValues) -> None:
+        self._values = values
+        self._by_lower = {name.lower(): name for name in values.relics}
+
+    async def get(self) -> RelicValues | None:
+        if time.time() - self._checked_at >= self._check_interval:
+            self._checked_at = time.time()
+            stored = await async_redis_client.get_decoded(self.key, type=RelicValues)
+            if stored is not None and (
+                self._values is None or stored.computed_at > self._values.computed_at
+            ):
+                self._use(stored)
+        return self._values
+
+    async def save(self, values: RelicValues, lease: Lease | None = None) -> bool:
+        payload = redis_codec.encode(values)
+        if lease is not None:
+            stored = await lease.fenced(lambda pipe: pipe.set(self.key, payload))
+        else:
+            stored = await async_redis_client.set(self.key, payload)
+        if stored:
+            self._use(values)
+            self._checked_at = time.time()
+        return stored
+
+    async def ranking(
+        self,
+        refinement: str = "radiant",
+        mode: str = "radshare",
+        currency: str = "platinum",
+        limit: int = 10,
+        include_vaulted: bool = True,
+    ) -> list[RelicValue]:
+        """Most valuable relics first, limit <= 0 for all of them."""
+        values = await self.get()
+        if values is None:
+            return []
+        ranked = values.rankings.get(ranking_key(refinement, mode, currency))
+        if ranked is None:
+            raise ValueError(f"Unknown ranking {refinement}/{mode}/{currency}")
+
+        results = []
+        for name in ranked:
+            relic = values.relics[name]
+            if not include_vaulted and relic.vaulted:
+                continue
+            results.append(relic)
+            if len(results) == limit:
+                break
+        return results
+
+    async def relic(self, name: str) -> RelicValue | None:
+        values = await self.get()
+        if values is None:
+            return None
+        name = name.lower().removesuffix(" relic").strip()
+        key = self._by_lower.get(name)
+        return values.relics[key] if key else None
+
+    def stats(self) -> dict:
+        values = self._values
+        return {
+            "computed_at": values.computed_at if values else None,
+            "prices_taken_at": values.prices_taken_at if values else None,
+            "relics": len(values.relics) if values else 0,
+            "unpriced": len(values.unpriced) if values else 0,
+        }
+
+
+relic_value_store = RelicValueStore()
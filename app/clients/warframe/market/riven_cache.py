@@ -1,7 +1,9 @@
 import time
 
 from warframe_market.api import Rivens
-from warframe_market.client import WarframeMarketClient
+
+from app.clients.warframe.market.client import market_client
+from app.clients.warframe.market.scheduler import Priority, market_priority
 
 
 class RivenCache:
@@ -23,8 +25,7 @@ class RivenCache:
         )
 
     async def _fetch(self) -> None:
-        client = WarframeMarketClient()
-        rivens = await client.get(Rivens)
+        rivens = await market_client.get(Rivens)
         self._weapon_data = []
         self._weapon_names = []
         for riven in rivens.data:
@@ -35,6 +36,20 @@ class RivenCache:
             self._weapon_data.append({"slug": riven.slug, "name": name.name})
         self._last_fetch = time.time()
 
+    @property
+    def version(self) -> float:
+        """Time of the last fetch, changes whenever the weapons are replaced."""
+        return self._last_fetch
+
+    @property
+    def ttl(self) -> int:
+        return self._ttl
+
+    async def refresh(self) -> None:
+        """Reload the weapons ahead of expiry, behind interactive requests."""
+        with market_priority(Priority.BACKGROUND):
+            await self._fetch()
+
     async def get_weapon_names(self) -> list[str]:
         if not self._is_fresh():
             await self._fetch()
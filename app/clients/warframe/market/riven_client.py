@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-from app.utils.http import http_client
+from app.clients.warframe.market.client import market_client
 
 
 @dataclass(frozen=True)
@@ -45,14 +45,12 @@ class RivenClient:
         return cls._instance
 
     async def search_auctions(self, weapon_slug: str) -> list[RivenListing]:
-        session = http_client.get_session()
         url = (
             f"https://api.warframe.market/v1/auctions/search"
             f"?type=riven&weapon_url_name={weapon_slug}&sort_by=price_asc"
         )
 
-        async with session.get(url) as resp:
-            data = await resp.json()
+        data = await market_client.get_json(url)
 
         auctions = data.get("payload", {}).get("auctions", [])
         listings: list[RivenListing] = []
@@ -0,0 +1,193 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
+from warframe_market.exceptions import WFMRateLimitError, WFMTooManyConnectionsError
+
+from app.config.settings import settings
+from app.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Priority(IntEnum):
+    """Scheduler lanes, lower values are served first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_priority: ContextVar[Priority] = ContextVar(
+    "market_priority", default=Priority.INTERACTIVE
+)
+
+
+@contextmanager
+def market_priority(priority: Priority) -> Iterator[None]:
+    """Run market calls made inside the block in the given lane."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header, in seconds or HTTP-date form."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class MarketRequestScheduler:
+    """
+    Token bucket in front of every warframe.market request.
+
+    Callers wait in a priority queue and are released one token at a time,
+    interactive commands before background refreshes. A rate limit response
+    pauses the whole bucket for its Retry-After delay (or an exponential
+    backoff when the header is missing) and the request is queued again.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._rate = settings.MARKET_RATE_LIMIT
+            cls._instance._burst = settings.MARKET_RATE_BURST
+            cls._instance._tokens = float(settings.MARKET_RATE_BURST)
+            cls._instance._updated = time.monotonic()
+            cls._instance._paused_until = 0.0
+            cls._instance._queue = []
+            cls._instance._sequence = itertools.count()
+            cls._instance._waiting = {priority: 0 for priority in Priority}
+            cls._instance._pump_task = None
+            cls._instance._stats = {
+                "requests": 0,
+                "rate_limited": 0,
+                "retries": 0,
+                "failures": 0,
+            }
+        return cls._instance
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def _delay(self) -> float:
+        """Seconds until a token may be handed out."""
+        self._refill()
+        paused = self._paused_until - time.monotonic()
+        missing = (1 - self._tokens) / self._rate if self._tokens < 1 else 0.0
+        return max(paused, missing, 0.0)
+
+    async def acquire(self, priority: Priority | None = None) -> None:
+        """Wait for a token in the lane of the caller."""
+        lane = _priority.get() if priority is None else priority
+        started = time.perf_counter()
+
+        if not self._queue and self._delay() == 0:
+            self._tokens -= 1
+            metrics.observe(f"market.wait.{lane.name.lower()}", 0.0)
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (lane, next(self._sequence), waiter))
+        self._waiting[lane] += 1
+        if self._pump_task is None or self._pump_task.done():
+            self._pump_task = asyncio.create_task(self._pump())
+
+        try:
+            await waiter
+        finally:
+            self._waiting[lane] -= 1
+            metrics.observe(
+                f"market.wait.{lane.name.lower()}",
+                time.perf_counter() - started,
+                error=waiter.cancelled(),
+            )
+
+    async def _pump(self) -> None:
+        while self._queue:
+            delay = self._delay()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            _, _, waiter = heapq.heappop(self._queue)
+            # waiters cancelled while queued do not consume a token
+            if waiter.done():
+                continue
+            self._tokens -= 1
+            waiter.set_result(None)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every lane for the given time, e.g. after a 429."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[T]],
+        priority: Priority | None = None,
+    ) -> T:
+        """Run call once a token is available, retrying when rate limited."""
+        backoff = settings.MARKET_RETRY_BACKOFF
+        retries = 0
+        while True:
+            await self.acquire(priority)
+            self._stats["requests"] += 1
+            try:
+                return await call()
+            except (WFMRateLimitError, WFMTooManyConnectionsError) as e:
+                self._stats["rate_limited"] += 1
+                retry_after = getattr(e, "retry_after", None)
+                delay = retry_after if retry_after is not None else backoff
+                self.pause(delay)
+                if retries >= settings.MARKET_MAX_RETRIES:
+                    self._stats["failures"] += 1
+                    raise
+                retries += 1
+                backoff *= 2
+                self._stats["retries"] += 1
+                logger.warning(
+                    f"Rate limited by warframe.market ({e.status}), "
+                    f"retrying in {delay:.2f}s"
+                )
+
+    def stats(self) -> dict[str, Any]:
+        self._refill()
+        return {
+            "rate": self._rate,
+            "burst": self._burst,
+            "tokens": round(self._tokens, 2),
+            "paused_for": round(max(0.0, self._paused_until - time.monotonic()), 3),
+            "queued": {
+                priority.name.lower(): count
+                for priority, count in self._waiting.items()
+            },
+            "wait": metrics.snapshot("market.wait."),
+            **self._stats,
+        }
+
+
+market_scheduler = MarketRequestScheduler()
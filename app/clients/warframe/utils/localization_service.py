@@ -0,0 +1,185 @@
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+
+from app.clients.warframe.wiki.hash_store import wiki_hash_store
+from app.clients.warframe.wiki.snapshot import wiki_snapshot_store
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_internal_name(internal_name: str) -> str:
+    """Remove unnecessary characters from an internal name."""
+    new_internal_name = internal_name
+
+    # For vendor items, remove StoreItems from the name
+    new_internal_name = new_internal_name.replace("StoreItems/", "")
+
+    # For nightwave quests, add suffix for description only
+    if new_internal_name.startswith("/Lotus/Types/Challenges/Seasons/"):
+        unique_name = new_internal_name.split("/")[-1]
+        new_internal_name = (
+            f"/Lotus/Language/NightwaveChallenges/Challenge_{unique_name}_Description"
+        )
+
+    # Others
+
+    return new_internal_name
+
+
+@dataclass(frozen=True)
+class LocalizationMaps:
+    """Compact lookup tables projected out of the raw wiki datasets."""
+
+    version: str | None
+    # language -> internal name -> display name (generic names merged in)
+    names: dict[str, dict[str, str]] = field(default_factory=dict)
+    # blueprint internal name -> internal name of the crafted result
+    recipes: dict[str, str] = field(default_factory=dict)
+    # node internal name -> (display name, mission type)
+    missions: dict[str, tuple[str, str]] = field(default_factory=dict)
+
+
+class LocalizationService:
+    """
+    Holds the localization dictionaries in memory for the whole process.
+
+    Maps are rebuilt from the compact wiki hashes only when the wiki dataset
+    version changes. Lookups never touch Redis once the maps are loaded, so
+    they are safe to run inside the worldstate decode for every item. Callers
+    await refresh() before decoding; lookups made before the maps are loaded
+    leave names untranslated and start loading them in the background.
+    """
+
+    _instance = None
+    languages: tuple[str, ...] = ("en",)
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._maps = None
+            cls._instance._loading = None
+        return cls._instance
+
+    async def _build(self, version: str | None) -> LocalizationMaps:
+        generic = await wiki_hash_store.get_all("internalnames")
+
+        names = {}
+        for language in self.languages:
+            names[language] = {
+                **generic,
+                **await wiki_hash_store.get_all(f"internalnames:{language}"),
+            }
+
+        all_recipes = await wiki_hash_store.get_all("recipe")
+        recipes = {
+            key: result_type
+            for key, result_type in all_recipes.items()
+            if "/Components/" in key and key.endswith("Blueprint")
+        }
+
+        nodes = await wiki_hash_store.get_all("missions")
+        missions = {node: self._parse_mission(value) for node, value in nodes.items()}
+
+        logger.info(
+            f"Localization maps loaded for version {version}: "
+            f"{len(generic)} names, {len(recipes)} recipes, {len(missions)} nodes"
+        )
+        return LocalizationMaps(
+            version=version, names=names, recipes=recipes, missions=missions
+        )
+
+    @staticmethod
+    def _parse_mission(value: str) -> tuple[str, str]:
+        mission = json.loads(value)
+        return (
+            f"{mission['Name']} ({mission['Planet']})",
+            mission.get("Type") or "",
+        )
+
+    @property
+    def version(self) -> str | None:
+        return self._maps.version if self._maps else None
+
+    async def refresh(self) -> None:
+        """Rebuild the maps if the wiki job published a new version."""
+        version = await wiki_snapshot_store.current_version()
+        if version is None:
+            # nothing published yet, names stay untranslated until it is
+            return
+        if self._maps is None or self._maps.version != version:
+            self._maps = await self._build(version)
+
+    def invalidate(self) -> None:
+        self._maps = None
+
+    def _load_in_background(self) -> None:
+        """Cold path: start loading the maps without blocking the caller."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._loading is None or self._loading.done():
+            self._loading = loop.create_task(self._safe_refresh())
+
+    async def _safe_refresh(self) -> None:
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.error(f"Failed to load localization maps: {e}")
+
+    def _lookup_name(self, internal_name: str, language: str) -> str | None:
+        if self._maps is None:
+            self._load_in_background()
+            return None
+        names = self._maps.names.get(language)
+        if names is None:
+            names = self._maps.names.get(self.languages[0], {})
+        return names.get(internal_name)
+
+    def _lookup_recipe(self, internal_name: str) -> str | None:
+        if self._maps is None:
+            self._load_in_background()
+            return None
+        return self._maps.recipes.get(internal_name)
+
+    def _lookup_mission(self, node: str) -> tuple[str, str] | None:
+        if self._maps is None:
+            self._load_in_background()
+            return None
+        return self._maps.missions.get(node)
+
+    def localize(self, internal_name: str, language: str = "en") -> str:
+        new_internal_name = normalize_internal_name(internal_name)
+
+        suffix = ""
+        # Is it a blueprint?
+        if "/Components/" in new_internal_name and new_internal_name.endswith(
+            "Blueprint"
+        ):
+            result_type = self._lookup_recipe(new_internal_name)
+            if result_type:
+                new_internal_name = result_type
+                suffix = " Blueprint"
+
+        localized = self._lookup_name(new_internal_name, language)
+        if localized:
+            return localized + suffix
+        return new_internal_name
+
+    def localize_many(
+        self, internal_names: list[str], language: str = "en"
+    ) -> list[str]:
+        return [self.localize(name, language) for name in internal_names]
+
+    def mission_name(self, node: str) -> str:
+        mission = self._lookup_mission(node)
+        return mission[0] if mission else node
+
+    def mission_type(self, node: str) -> str:
+        mission = self._lookup_mission(node)
+        return mission[1] if mission else ""
+
+
+localization_service = LocalizationService()
@@ -1,7 +1,15 @@
-import json
+import msgspec
 
-from app.clients.redis import redis_client
-from app.config.settings import settings
+from app.clients.warframe.wiki.hash_store import wiki_hash_store
+from app.clients.warframe.wiki.models import (
+    Arcane,
+    Prime,
+    PrimePart,
+    Relic,
+    VoidData,
+    WeaponData,
+)
+from app.clients.warframe.wiki.snapshot import wiki_snapshot_store
 
 
 class WikiClient:
@@ -12,37 +20,45 @@ class WikiClient:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def _get_cached(self, key: str) -> dict | None:
-        cached_data = redis_client.get(f"{key}:{settings.CACHE_VERSION}")
-        if not cached_data:
-            return None
-        return json.loads(cached_data)
+    async def _get_cached(self, key: str):
+        return await wiki_snapshot_store.get(key)
+
+    async def get_weapon_data(self) -> WeaponData | None:
+        return await self._get_cached("weapon")
+
+    async def get_weapon_names(self) -> list[str]:
+        weapon_data = await self.get_weapon_data()
+        if not weapon_data:
+            return []
+        return list(weapon_data)
 
-    def get_weapon_data(self) -> dict | None:
-        return self._get_cached("weapon")
+    async def get_void_data(self) -> VoidData | None:
+        return await self._get_cached("void")
 
-    def get_void_data(self) -> dict | None:
-        return self._get_cached("void")
+    async def get_arcane_data(self) -> dict[str, Arcane] | None:
+        arcane_data = await self._get_cached("arcane")
+        if not arcane_data:
+            return None
+        return arcane_data.arcanes
 
-    def get_prime_names(self) -> list[str]:
-        void_data = self.get_void_data()
+    async def get_prime_names(self) -> list[str]:
+        void_data = await self.get_void_data()
         if not void_data:
             return []
-        primes = void_data.get("PrimeData", {})
-        return [key for key in primes if "Prime" in key]
+        return [key for key in void_data.prime_data if "Prime" in key]
 
-    def get_relic_names(self) -> list[str]:
-        void_data = self.get_void_data()
+    async def get_relic_names(self) -> list[str]:
+        void_data = await self.get_void_data()
         if not void_data:
             return []
-        return list(void_data.get("RelicData", {}).keys())
+        return list(void_data.relic_data)
 
-    def find_prime(self, query: str) -> tuple[str | None, dict | None]:
-        void_data = self.get_void_data()
+    async def find_prime(self, query: str) -> tuple[str | None, Prime | None]:
+        void_data = await self.get_void_data()
         if not void_data:
             return None, None
 
-        primes = void_data.get("PrimeData", {})
+        primes = void_data.prime_data
         query_lower = query.lower()
 
         for prime_key in primes:
@@ -53,9 +69,9 @@ class WikiClient:
         return None, None
 
     def find_prime_part(
-        self, prime_dict: dict, part_name: str
-    ) -> tuple[str | None, dict | None]:
-        parts_data = prime_dict.get("Parts", {})
+        self, prime: Prime, part_name: str
+    ) -> tuple[str | None, PrimePart | None]:
+        parts_data = prime.parts
         part_lower = part_name.lower()
 
         for part_key in parts_data:
@@ -79,16 +95,46 @@ class WikiClient:
         else:
             return " ".join(parts[:2]), " ".join(parts[2:])
 
-    def get_relic_data(self, relic_name: str) -> dict | None:
-        void_data = self.get_void_data()
-        if not void_data:
-            return None
+    async def find_relic(self, relic_name: str) -> tuple[str | None, Relic | None]:
+        void_data = await wiki_snapshot_store.peek("void")
+        if void_data is None:
+            key, value = await wiki_hash_store.get_named("relics", relic_name)
+            if key is None:
+                return None, None
+            return key, msgspec.convert(value, Relic, strict=False)
 
-        relics = void_data.get("RelicData", {})
+        relics = void_data.relic_data
         for key in relics:
             if key.lower() == relic_name.lower():
-                return relics[key]
-        return None
+                return key, relics[key]
+        return None, None
+
+    async def get_relic_data(self, relic_name: str) -> Relic | None:
+        return (await self.find_relic(relic_name))[1]
+
+    async def find_arcane(self, arcane_name: str) -> tuple[str | None, Arcane | None]:
+        arcane_data = await wiki_snapshot_store.peek("arcane")
+        if arcane_data is not None:
+            arcanes = arcane_data.arcanes
+            # exact match
+            for key, value in arcanes.items():
+                if key.lower() == arcane_name.lower():
+                    return key, value
+            # fuzzy match
+            for key, value in arcanes.items():
+                if arcane_name.lower() in key.lower():
+                    return key, value
+            return None, None
+
+        key, value = await wiki_hash_store.get_named("arcane", arcane_name)
+        if not key:
+            for field in await wiki_hash_store.keys("arcane"):
+                if arcane_name.lower() in field:
+                    key, value = await wiki_hash_store.get_named("arcane", field)
+                    break
+        if not key:
+            return None, None
+        return key, msgspec.convert(value, Arcane, strict=False)
 
 
 wiki_client = WikiClient()
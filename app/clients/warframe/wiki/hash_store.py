@@ -0,0 +1,214 @@
+import json
+import logging
+import uuid
+from typing import Any, Callable
+
+from redis.asyncio.client import Pipeline
+
+from app.clients.redis import async_redis_client
+from app.clients.warframe.wiki.snapshot import wiki_snapshot_store
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _named(entries: dict[str, Any]) -> dict[str, str]:
+    """Key entities by lowercased name, keeping the original name in the value."""
+    return {
+        name.lower(): json.dumps({"name": name, "data": data})
+        for name, data in entries.items()
+    }
+
+
+def _strings(entries: dict[str, Any]) -> dict[str, str]:
+    return {
+        key: value
+        for key, value in entries.items()
+        if isinstance(value, str) and value
+    }
+
+
+def _missions(data: dict[str, Any]) -> dict[str, str]:
+    by_name = data.get("by", {}).get("InternalName", {})
+    return {
+        node: json.dumps(
+            {
+                "Name": entries[0].get("Name"),
+                "Planet": entries[0].get("Planet"),
+                "Type": entries[0].get("Type"),
+            }
+        )
+        for node, entries in by_name.items()
+        if entries
+    }
+
+
+def _recipes(data: dict[str, Any]) -> dict[str, str]:
+    return {
+        key: recipe["resultType"]
+        for key, recipe in data.items()
+        if isinstance(recipe, dict) and recipe.get("resultType")
+    }
+
+
+# hash name -> (source dataset, projection into hash fields)
+HASH_DATASETS: dict[str, tuple[str, Callable[[dict[str, Any]], dict[str, str]]]] = {
+    "missions": ("missions", _missions),
+    "internalnames": ("internalnames", _strings),
+    "internalnames:en": ("internalnames:en", _strings),
+    "recipe": ("recipe", _recipes),
+    "relics": ("void", lambda data: _named(data.get("RelicData", {}))),
+    "primes": ("void", lambda data: _named(data.get("PrimeData", {}))),
+    "weapon": ("weapon", _named),
+    "arcane": ("arcane", lambda data: _named(data.get("Arcanes", {}))),
+}
+# datasets searched by substring, their field order follows the source file
+ORDERED_DATASETS = frozenset({"relics", "primes", "weapon", "arcane"})
+# staged hashes a loader never swapped in expire after this
+STAGED_TTL = 3600
+
+
+class WikiHashStore:
+    """
+    Field-level access to the hot wiki datasets.
+
+    LoadWikiJob writes each dataset in HASH_DATASETS as a Redis hash keyed by
+    entity, so a single relic or mission node costs one HGET instead of
+    transferring and parsing the full source file. Fetched fields are
+    memoized until the wiki version changes.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._version = None
+            cls._instance._fields = {}
+            cls._instance._keys = {}
+        return cls._instance
+
+    @staticmethod
+    def hash_key(dataset: str) -> str:
+        return f"wiki_hash:{dataset}:{settings.CACHE_VERSION}"
+
+    @staticmethod
+    def order_key(dataset: str) -> str:
+        return f"wiki_hash_order:{dataset}:{settings.CACHE_VERSION}"
+
+    async def _check_version(self) -> None:
+        version = await wiki_snapshot_store.current_version()
+        if version != self._version:
+            self._version = version
+            self._fields = {}
+            self._keys = {}
+
+    async def stage(
+        self, datasets: dict[str, Any], chunk_size: int = 1000
+    ) -> tuple[dict[str, int], Callable[[Pipeline], None]]:
+        """
+        Project loaded source datasets into hashes under staging keys.
+
+        Returns the field counts and a function queueing the swap of the
+        staged hashes into place, for the caller to run in the transaction
+        that publishes them. Nothing readers see changes before that.
+        """
+        suffix = uuid.uuid4().hex[:8]
+        counts = {}
+        swaps: dict[str, str | None] = {}
+        orders: dict[str, str] = {}
+        for dataset, (source, project) in HASH_DATASETS.items():
+            if source not in datasets:
+                continue
+            try:
+                mapping = project(datasets[source])
+            except Exception as e:
+                logger.error(f"Failed to project {source} into hash {dataset}: {e}")
+                continue
+            key = self.hash_key(dataset)
+            if mapping:
+                staged_key = f"{key}:staged:{suffix}"
+                pipe = async_redis_client.pipeline()
+                items = list(mapping.items())
+                for i in range(0, len(items), chunk_size):
+                    pipe.hset(staged_key, mapping=dict(items[i : i + chunk_size]))
+                pipe.expire(staged_key, STAGED_TTL)
+                if await async_redis_client.execute_pipeline(pipe) is None:
+                    continue
+                swaps[key] = staged_key
+            else:
+                swaps[key] = None
+            if dataset in ORDERED_DATASETS:
+                orders[self.order_key(dataset)] = json.dumps(list(mapping))
+            counts[dataset] = len(mapping)
+
+        def swap(pipe: Pipeline) -> None:
+            for key, staged_key in swaps.items():
+                if staged_key is None:
+                    pipe.delete(key)
+                else:
+                    pipe.rename(staged_key, key)
+                    # the staging expiry moves with the rename
+                    pipe.persist(key)
+            for key, order in orders.items():
+                pipe.set(key, order)
+
+        return counts, swap
+
+    async def get(self, dataset: str, field: str) -> str | None:
+        await self._check_version()
+        cache_key = (dataset, field)
+        if cache_key in self._fields:
+            return self._fields[cache_key]
+
+        value = await async_redis_client.hget(self.hash_key(dataset), field)
+        if value is not None:
+            self._fields[cache_key] = value
+        return value
+
+    async def get_many(self, dataset: str, fields: list[str]) -> dict[str, str | None]:
+        await self._check_version()
+        result = {}
+        missing = []
+        for field in dict.fromkeys(fields):
+            if (dataset, field) in self._fields:
+                result[field] = self._fields[(dataset, field)]
+            else:
+                missing.append(field)
+
+        if missing:
+            values = await async_redis_client.hmget(self.hash_key(dataset), missing)
+            for field, value in zip(missing, values):
+                result[field] = value
+                if value is not None:
+                    self._fields[(dataset, field)] = value
+        return result
+
+    async def get_all(self, dataset: str) -> dict[str, str]:
+        return await async_redis_client.hgetall(self.hash_key(dataset))
+
+    async def keys(self, dataset: str) -> list[str]:
+        """Field names, in source order for the ORDERED_DATASETS."""
+        await self._check_version()
+        if dataset not in self._keys:
+            order = None
+            if dataset in ORDERED_DATASETS:
+                order = await async_redis_client.get(self.order_key(dataset))
+            if order:
+                self._keys[dataset] = json.loads(order)
+            else:
+                self._keys[dataset] = sorted(
+                    await async_redis_client.hkeys(self.hash_key(dataset))
+                )
+        return self._keys[dataset]
+
+    async def get_named(self, dataset: str, name: str) -> tuple[str | None, Any | None]:
+        """Case-insensitive lookup in a dataset stored with _named()."""
+        value = await self.get(dataset, name.lower())
+        if not value:
+            return None, None
+        entry = json.loads(value)
+        return entry["name"], entry["data"]
+
+
+wiki_hash_store = WikiHashStore()
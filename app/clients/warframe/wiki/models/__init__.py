@@ -1 +1,47 @@
+from typing import Any
 
+import msgspec
+
+from .arcane import Arcane, ArcaneData
+from .mission import Mission, MissionData
+from .void import Prime, PrimePart, Relic, RelicDrop, VoidData
+from .weapon import Attack, Damage, Weapon, WeaponData
+
+# wiki sources decoded into typed models instead of plain dicts
+DATASET_TYPES: dict[str, Any] = {
+    "weapon": WeaponData,
+    "void": VoidData,
+    "arcane": ArcaneData,
+    "missions": MissionData,
+}
+
+
+def dataset_type(key: str) -> Any:
+    return DATASET_TYPES.get(key, Any)
+
+
+def to_model(key: str, data: Any) -> Any:
+    """Convert an already decoded dataset into its model, if it has one."""
+    if key not in DATASET_TYPES:
+        return data
+    return msgspec.convert(data, DATASET_TYPES[key], strict=False)
+
+
+__all__ = [
+    "Arcane",
+    "ArcaneData",
+    "Attack",
+    "DATASET_TYPES",
+    "Damage",
+    "Mission",
+    "MissionData",
+    "Prime",
+    "PrimePart",
+    "Relic",
+    "RelicDrop",
+    "VoidData",
+    "Weapon",
+    "WeaponData",
+    "dataset_type",
+    "to_model",
+]
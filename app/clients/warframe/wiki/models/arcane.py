@@ -0,0 +1,20 @@
+import re
+from typing import Any
+
+import msgspec
+
+
+class Arcane(msgspec.Struct, rename="pascal", gc=False):
+    criteria: str | None = None
+    description: Any = ""
+    rarity: str = "Unknown"
+    max_rank: int | None = None
+
+    @property
+    def stats(self) -> str:
+        criteria = f"{self.criteria}:\n" if self.criteria else ""
+        return criteria + re.sub(r"<br />", "\n", str(self.description))
+
+
+class ArcaneData(msgspec.Struct, rename="pascal", gc=False):
+    arcanes: dict[str, Arcane] = {}
@@ -0,0 +1,16 @@
+import msgspec
+
+
+class Mission(msgspec.Struct, rename="pascal", gc=False):
+    name: str | None = None
+    planet: str | None = None
+    type: str | None = None
+
+
+class MissionIndex(msgspec.Struct, rename="pascal", gc=False):
+    # node internal name -> missions on that node
+    internal_name: dict[str, list[Mission]] = {}
+
+
+class MissionData(msgspec.Struct, gc=False):
+    by: MissionIndex = msgspec.field(default_factory=MissionIndex)
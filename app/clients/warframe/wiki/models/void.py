@@ -0,0 +1,42 @@
+import msgspec
+
+
+class RelicDrop(msgspec.Struct, rename="pascal", gc=False):
+    item: str
+    part: str
+    rarity: str | None = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.item} {self.part}"
+
+
+class Relic(msgspec.Struct, rename="pascal", gc=False):
+    drops: list[RelicDrop] = []
+    is_baro: bool = False
+    vaulted: bool = False
+
+    @property
+    def tag(self) -> str:
+        """Short marker for Baro Ki'Teer exclusive or vaulted relics."""
+        if self.is_baro:
+            return "(B)"
+        if self.vaulted:
+            return "(V)"
+        return ""
+
+
+class PrimePart(msgspec.Struct, rename="pascal", gc=False):
+    # relic name -> rarity of the part in that relic
+    drops: dict[str, str] = {}
+
+
+class Prime(msgspec.Struct, rename="pascal", gc=False):
+    parts: dict[str, PrimePart] = {}
+
+
+class VoidData(msgspec.Struct, rename="pascal", gc=False):
+    """The void dataset: every relic and the relics each prime part drops from."""
+
+    relic_data: dict[str, Relic] = {}
+    prime_data: dict[str, Prime] = {}
@@ -1,5 +1,7 @@
 from typing import Any
 
+import msgspec
+
 
 class Slot:
     PRIMARY = "Primary"
@@ -28,26 +30,32 @@ class ShotType:
     THROWN = "Thrown"
 
 
-class Damage:
-    def __init__(self, damage_data: dict[str, float]):
-        self.impact = damage_data.get("Impact")
-        self.puncture = damage_data.get("Puncture")
-        self.slash = damage_data.get("Slash")
-        self.heat = damage_data.get("Heat")
-        self.cold = damage_data.get("Cold")
-        self.electricity = damage_data.get("Electricity")
-        self.toxin = damage_data.get("Toxin")
-        self.blast = damage_data.get("Blast")
-        self.corrosive = damage_data.get("Corrosive")
-        self.gas = damage_data.get("Gas")
-        self.magnetic = damage_data.get("Magnetic")
-        self.radiation = damage_data.get("Radiation")
-        self.viral = damage_data.get("Viral")
-        self.void = damage_data.get("Void")
+Number = int | float
+
+
+class Damage(msgspec.Struct, rename="pascal", gc=False):
+    impact: Number | None = None
+    puncture: Number | None = None
+    slash: Number | None = None
+    heat: Number | None = None
+    cold: Number | None = None
+    electricity: Number | None = None
+    toxin: Number | None = None
+    blast: Number | None = None
+    corrosive: Number | None = None
+    gas: Number | None = None
+    magnetic: Number | None = None
+    radiation: Number | None = None
+    viral: Number | None = None
+    void: Number | None = None
 
     @property
     def used(self) -> dict[str, float]:
-        return {key: value for key, value in self.__dict__.items() if value is not None}
+        return {
+            key: value
+            for key in self.__struct_fields__
+            if (value := getattr(self, key)) is not None
+        }
 
     @property
     def total(self) -> float:
@@ -73,41 +81,44 @@ class Damage:
         return damage_text
 
 
-class Attack:
-    def __init__(self, attack_data: dict[str, Any]):
-        self.attack_name = attack_data.get("AttackName", "Normal Attack")
-        self.crit_chance = attack_data.get("CritChance")
-        self.crit_multiplier = attack_data.get("CritMultiplier")
-        self.damage = Damage(attack_data.get("Damage", {}))
-        self.fire_rate = attack_data.get("FireRate")
-        self.is_silent = attack_data.get("IsSilent", False)
-        self.status_chance = attack_data.get("StatusChance")
-        self.multishot = attack_data.get("Multishot")
-        self.ammo_cost = attack_data.get("AmmoCost")
-        self.punch_through = attack_data.get("PunchThrough")
-        self.shot_type = attack_data.get("ShotType")
-        self.shot_speed = attack_data.get("ShotSpeed")
-        self.max_spread = attack_data.get("MaxSpread")
-        self.min_spread = attack_data.get("MinSpread")
-        self.accuracy = attack_data.get("Accuracy")
-        self.range = attack_data.get("Range")
-        self.falloff = attack_data.get("Falloff")
-        self.forced_procs = attack_data.get("ForcedProcs", [])
-        self.charge_time = attack_data.get("ChargeTime")
-        self.trigger = attack_data.get("Trigger")
+class Falloff(msgspec.Struct, rename="pascal", gc=False):
+    start_range: Number | None = None
+    end_range: Number | None = None
+    reduction: Number | None = None
+
+
+class Attack(msgspec.Struct, rename="pascal", gc=False):
+    attack_name: str = "Normal Attack"
+    crit_chance: Number | None = None
+    crit_multiplier: Number | None = None
+    damage: Damage = msgspec.field(default_factory=Damage)
+    fire_rate: Number | None = None
+    is_silent: bool = False
+    status_chance: Number | None = None
+    multishot: Number | None = None
+    ammo_cost: Number | None = None
+    punch_through: Number | None = None
+    shot_type: str | None = None
+    shot_speed: Any = None
+    max_spread: Number | None = None
+    min_spread: Number | None = None
+    accuracy: Number | None = None
+    range: Number | None = None
+    falloff: Falloff | None = None
+    forced_procs: list[str] = []
+    charge_time: Number | None = None
+    trigger: str | None = None
 
     def __repr__(self):
         return f"<Attack: {self.attack_name}-{self.shot_type}>"
 
     @property
     def parsed_falloff(self) -> str | None:
-        if self.falloff:
-            reduction = self.falloff.get("Reduction")
-            if reduction is not None:
-                return (
-                    f"{round(reduction * 100)}% "
-                    f"({self.falloff['StartRange']} - {self.falloff['EndRange']}m)"
-                )
+        if self.falloff and self.falloff.reduction is not None:
+            return (
+                f"{round(self.falloff.reduction * 100)}% "
+                f"({self.falloff.start_range} - {self.falloff.end_range}m)"
+            )
         return None
 
     @property
@@ -147,24 +158,58 @@ class Attack:
         return "\n".join(lines)
 
 
-class Weapon:
-    def __init__(self, name: str, weapon_data: dict[str, Any]):
-        self.name = name
-        self.internal_name = weapon_data.get("InternalName")
-        self.link = weapon_data.get("Link")
-        self.image = weapon_data.get("Image")
-        self.slot = weapon_data.get("Slot")
-        self.class_ = weapon_data.get("Class")
-        self.family = weapon_data.get("Family")
-        self.mastery = weapon_data.get("Mastery")
-        self.max_rank = weapon_data.get("MaxRank", 30)
-        self.disposition = self.parse_disposition(weapon_data.get("Disposition", 0.5))
-        self.sell_price = weapon_data.get("SellPrice")
-        self.introduced = weapon_data.get("Introduced")
-        self.conclave = weapon_data.get("Conclave", False)
-        self.traits = weapon_data.get("Traits", [])
-        self.polarities = weapon_data.get("Polarities", [])
-        self.attacks = [Attack(attack) for attack in weapon_data.get("Attacks", [])]
+class Weapon(msgspec.Struct, rename="pascal", gc=False):
+    """
+    A weapon of the wiki weapon dataset, decoded straight from the cached
+    bytes. Ranged and melee only stats are None for the other kinds.
+    """
+
+    name: str | None = None
+    internal_name: str | None = None
+    link: str | None = None
+    image: str | None = None
+    slot: str | None = None
+    class_: str | None = msgspec.field(default=None, name="Class")
+    family: str | None = None
+    mastery: int | None = None
+    max_rank: int = 30
+    disposition_value: Number = msgspec.field(default=0.5, name="Disposition")
+    sell_price: int | None = None
+    introduced: Any = None
+    conclave: bool = False
+    traits: list[str] = []
+    polarities: list[str] = []
+    attacks: list[Attack] = []
+
+    # ranged
+    ammo_max: Number | None = None
+    ammo_pickup: Number | None = None
+    ammo_type: str | None = None
+    magazine: Number | None = None
+    reload: Number | None = None
+    trigger: str | None = None
+    exilus_polarity: str | None = None
+    tradable: bool | None = None
+    zoom: list[Any] | None = None
+
+    # melee
+    block_angle: Number | None = None
+    combo_dur: Any = "∞"
+    follow_through: Number | None = None
+    melee_range: Number | None = None
+    stance_polarity: str | None = None
+    sweep_radius: Number | None = None
+    wind_up: Number | None = None
+    heavy_attack: Any = None
+    slam_attack: Any = None
+    heavy_slam_attack: Any = None
+    slide_attack: Any = None
+    slam_element: str | None = None
+    slam_radius: Number | None = None
+    slam_forced_procs: list[str] = []
+    heavy_slam_element: str | None = None
+    heavy_slam_radius: Number | None = None
+    heavy_slam_forced_procs: list[str] = []
 
     def __str__(self) -> str:
         return f"{self.name} ({self.class_})"
@@ -181,79 +226,47 @@ class Weapon:
             return "●●○○○"
         return "●○○○○"
 
-    @classmethod
-    def from_dict(cls, name: str, data: dict[str, Any]) -> "Weapon":
-        weapon_slot = data.get("Slot", "")
-        if weapon_slot in (Slot.PRIMARY, Slot.SECONDARY):
-            return RangedWeapon(name, data)
-        elif weapon_slot == Slot.MELEE:
-            return MeleeWeapon(name, data)
-        else:
-            return Weapon(name, data)
+    @property
+    def disposition(self) -> str:
+        return self.parse_disposition(self.disposition_value)
+
+    @property
+    def is_ranged(self) -> bool:
+        return self.slot in (Slot.PRIMARY, Slot.SECONDARY)
+
+    @property
+    def is_melee(self) -> bool:
+        return self.slot == Slot.MELEE
+
+    @property
+    def attack_speed(self) -> float | None:
+        return self.attacks[0].fire_rate if self.attacks else None
 
     def get_description(self) -> str:
         desc = f"Class: {self.slot}\n"
         desc += f"Type: {self.class_}\n"
         desc += f"Mastery: {self.mastery if self.mastery is not None else '-'}\n"
         desc += f"Disposition: {self.disposition}\n"
-        return desc
-
-
-class RangedWeapon(Weapon):
-    def __init__(self, name: str, weapon_data: dict[str, Any]):
-        super().__init__(name, weapon_data)
-        self.accuracy = weapon_data.get("Accuracy")
-        self.ammo_max = weapon_data.get("AmmoMax")
-        self.ammo_pickup = weapon_data.get("AmmoPickup")
-        self.ammo_type = weapon_data.get("AmmoType")
-        self.magazine = weapon_data.get("Magazine")
-        self.reload = weapon_data.get("Reload")
-        self.trigger = weapon_data.get("Trigger")
-        self.exilus_polarity = weapon_data.get("ExilusPolarity")
-        self.tradable = weapon_data.get("Tradable")
-        self.zoom = weapon_data.get("Zoom")
 
-    def get_description(self) -> str:
-        desc = super().get_description()
-        desc += f"Ammo: {self.ammo_max if self.ammo_max is not None else '∞'}\n"
-        if self.ammo_pickup is not None:
-            desc += f"Ammo Pickup: {self.ammo_pickup}\n"
-        desc += f"Magazine: {self.magazine}\n"
-        desc += f"Reload: {self.reload}\n"
-        desc += f"Trigger: {self.trigger}\n"
-        if self.zoom:
-            desc += "**Zoom**:\n- " + "\n- ".join(str(z) for z in self.zoom) + "\n"
+        if self.is_ranged:
+            desc += f"Ammo: {self.ammo_max if self.ammo_max is not None else '∞'}\n"
+            if self.ammo_pickup is not None:
+                desc += f"Ammo Pickup: {self.ammo_pickup}\n"
+            desc += f"Magazine: {self.magazine}\n"
+            desc += f"Reload: {self.reload}\n"
+            desc += f"Trigger: {self.trigger}\n"
+            if self.zoom:
+                zoom = "\n- ".join(str(z) for z in self.zoom)
+                desc += f"**Zoom**:\n- {zoom}\n"
+        elif self.is_melee:
+            if self.block_angle is not None:
+                desc += f"Block Angle: {self.block_angle}\n"
+            desc += f"Combo Duration: {self.combo_dur}\n"
+            desc += f"Follow Through: {self.follow_through}\n"
+            desc += f"Attack Speed: {self.attack_speed}\n"
+            desc += f"Range: {self.melee_range}m\n"
         return desc
 
 
-class MeleeWeapon(Weapon):
-    def __init__(self, name: str, weapon_data: dict[str, Any]):
-        super().__init__(name, weapon_data)
-        self.block_angle = weapon_data.get("BlockAngle")
-        self.combo_dur = weapon_data.get("ComboDur", "∞")
-        self.follow_through = weapon_data.get("FollowThrough")
-        self.melee_range = weapon_data.get("MeleeRange")
-        self.stance_polarity = weapon_data.get("StancePolarity")
-        self.sweep_radius = weapon_data.get("SweepRadius")
-        self.wind_up = weapon_data.get("WindUp")
-        self.attack_speed = self.attacks[0].fire_rate if self.attacks else None
-        self.heavy_attack = weapon_data.get("HeavyAttack")
-        self.slam_attack = weapon_data.get("SlamAttack")
-        self.heavy_slam_attack = weapon_data.get("HeavySlamAttack")
-        self.slide_attack = weapon_data.get("SlideAttack")
-        self.slam_element = weapon_data.get("SlamElement")
-        self.slam_radius = weapon_data.get("SlamRadius")
-        self.slam_forced_procs = weapon_data.get("SlamForcedProcs", [])
-        self.heavy_slam_element = weapon_data.get("HeavySlamElement")
-        self.heavy_slam_radius = weapon_data.get("HeavySlamRadius")
-        self.heavy_slam_forced_procs = weapon_data.get("HeavySlamForcedProcs", [])
-
-    def get_description(self) -> str:
-        desc = super().get_description()
-        if self.block_angle is not None:
-            desc += f"Block Angle: {self.block_angle}\n"
-        desc += f"Combo Duration: {self.combo_dur}\n"
-        desc += f"Follow Through: {self.follow_through}\n"
-        desc += f"Attack Speed: {self.attack_speed}\n"
-        desc += f"Range: {self.melee_range}m\n"
-        return desc
+# the weapon dataset, keyed by weapon name
+WeaponData = dict[str, Weapon]
@@ -0,0 +1,160 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+from redis.asyncio.client import Pipeline
+
+from app.clients.redis import Lease, async_redis_client
+from app.clients.warframe.wiki.models import dataset_type, to_model
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class WikiSnapshot:
+    """Decoded wiki datasets belonging to a single published version."""
+
+    version: str | None
+    datasets: dict[str, Any] = field(default_factory=dict)
+
+
+class WikiSnapshotStore:
+    """
+    Per-process store of decoded wiki datasets.
+
+    Datasets are decoded once per published version and kept in an immutable
+    snapshot. A new version replaces the whole snapshot in a single assignment,
+    so readers never observe a mix of old and new datasets. Datasets listed in
+    DATASET_TYPES are decoded straight into their models.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._snapshot = WikiSnapshot(version=None)
+            cls._instance._checked_at = None
+            cls._instance._published_version = None
+            cls._instance._stats = {"hits": 0, "misses": 0, "refreshes": 0}
+        return cls._instance
+
+    @property
+    def version_key(self) -> str:
+        return f"wiki_version:{settings.CACHE_VERSION}"
+
+    @property
+    def version(self) -> str | None:
+        return self._snapshot.version
+
+    async def current_version(self) -> str | None:
+        """Published version, re-read from Redis at most once per check interval."""
+        now = time.monotonic()
+        if (
+            self._checked_at is not None
+            and now - self._checked_at < settings.WIKI_VERSION_CHECK_SECONDS
+        ):
+            return self._published_version
+
+        self._checked_at = now
+        self._published_version = await async_redis_client.get(self.version_key)
+        return self._published_version
+
+    def _swap(self, snapshot: WikiSnapshot) -> None:
+        if snapshot.version != self._snapshot.version:
+            self._stats["refreshes"] += 1
+            logger.info(f"Wiki snapshot refreshed to version {snapshot.version}")
+        self._snapshot = snapshot
+
+    async def get(self, key: str) -> Any | None:
+        """Get a decoded dataset, loading it from Redis on first use per version."""
+        version = await self.current_version()
+        if version != self._snapshot.version:
+            self._swap(WikiSnapshot(version=version))
+
+        snapshot = self._snapshot
+        if key in snapshot.datasets:
+            self._stats["hits"] += 1
+            return snapshot.datasets[key]
+
+        self._stats["misses"] += 1
+        data = await async_redis_client.get_decoded(
+            f"{key}:{settings.CACHE_VERSION}", type=dataset_type(key), strict=False
+        )
+        if data is None:
+            return None
+
+        self._snapshot = WikiSnapshot(
+            version=snapshot.version, datasets={**snapshot.datasets, key: data}
+        )
+        return data
+
+    async def peek(self, key: str) -> Any | None:
+        """Get a dataset only if it is already decoded for the current version."""
+        if await self.current_version() != self._snapshot.version:
+            return None
+        return self._snapshot.datasets.get(key)
+
+    async def publish(
+        self,
+        version: str,
+        datasets: dict[str, Any],
+        unchanged: Iterable[str] = (),
+        lease: Lease | None = None,
+        writes: Callable[[Pipeline], None] | None = None,
+    ) -> None:
+        """
+        Mark a new version as current, both in Redis and in this process.
+
+        Datasets already in use by this process are carried over from the
+        freshly loaded data, or kept as they are when listed in unchanged,
+        so they do not need to be decoded again.
+
+        Writes queued by writes go in the same transaction as the version,
+        so the data of a version only becomes visible with it. With a lease
+        that transaction only runs if the lease is still held, so a loader
+        that lost it cannot write or publish over a newer one.
+        """
+        # unchanged datasets are only the same data if this process was on
+        # the version they were published with
+        previous = await async_redis_client.get(self.version_key)
+        unchanged = set(unchanged) if previous == self._snapshot.version else set()
+
+        def apply(pipe: Pipeline) -> None:
+            if writes is not None:
+                writes(pipe)
+            pipe.set(self.version_key, version)
+
+        if lease is not None:
+            if not await lease.fenced(apply):
+                raise RuntimeError(f"Lost lease {lease.name}, not publishing {version}")
+        else:
+            pipe = async_redis_client.pipeline(transaction=True)
+            apply(pipe)
+            if await async_redis_client.execute_pipeline(pipe) is None:
+                raise RuntimeError(f"Failed to publish {version}")
+        in_use = {
+            key: to_model(key, datasets[key]) if key in datasets else data
+            for key, data in self._snapshot.datasets.items()
+            if key in datasets or key in unchanged
+        }
+        self._checked_at = time.monotonic()
+        self._published_version = version
+        self._swap(WikiSnapshot(version=version, datasets=in_use))
+
+    def invalidate(self) -> None:
+        self._snapshot = WikiSnapshot(version=None)
+        self._checked_at = None
+        self._published_version = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "version": self._snapshot.version,
+            "loaded_datasets": sorted(self._snapshot.datasets),
+            **self._stats,
+        }
+
+
+wiki_snapshot_store = WikiSnapshotStore()
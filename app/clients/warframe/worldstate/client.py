@@ -1,18 +1,45 @@
 import asyncio
+import hashlib
 import logging
+from typing import Awaitable, Callable
 
-import aiohttp
 import msgspec
 from typing_extensions import Self
 
-from app.clients.warframe.worldstate.parsers.worldstate import WorldstateModel
+from app.clients.redis import Lease, async_redis_client, redis_codec
+from app.clients.warframe.utils.localization_service import localization_service
+from app.clients.warframe.worldstate.diff import WorldstateEvent, diff_worldstate
+from app.clients.warframe.worldstate.parsers.worldstate import (
+    LazyWorldstate,
+    WorldstateModel,
+)
 from app.config.settings import settings
+from app.utils.http import http_client
 
 logger = logging.getLogger(__name__)
 
+WorldstateListener = Callable[[list[WorldstateEvent]], Awaitable[None]]
+
+
+class WorldstateHeader(msgspec.Struct):
+    """Top level fields that change whenever the worldstate is regenerated."""
+
+    build_label: str = msgspec.field(name="BuildLabel", default="")
+    time: int = msgspec.field(name="Time", default=0)
+
 
 class WorldstateClient:
-    """Warframe World State API client with caching."""
+    """
+    Warframe World State API client with caching.
+
+    A background poller keeps the snapshot fresh using conditional requests.
+    With several replicas, the poller holding the worldstate lease fetches
+    and publishes the payload to Redis and the others decode it from there.
+    Payloads whose hash or Time/BuildLabel did not change are not decoded
+    again, and concurrent refreshes share one in-flight request, so command
+    handlers always read a ready snapshot. With WORLDSTATE_LAZY_DECODE, a
+    snapshot only decodes the sections that are actually read.
+    """
 
     _instance: Self | None = None
     _cached_data = None
@@ -21,20 +48,35 @@ class WorldstateClient:
     def __new__(cls) -> Self:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._session = None
+            cls._instance._inflight = None
+            cls._instance._poller = None
+            cls._instance._etag = None
+            cls._instance._last_modified = None
+            cls._instance._payload_hash = None
+            cls._instance._header = None
+            cls._instance._localization_version = None
+            cls._instance._version = 0
+            cls._instance._listeners = []
+            cls._instance._listener_tasks = set()
+            cls._instance._lease = Lease("worldstate_poller")
+            cls._instance._stats = {
+                "decoded": 0,
+                "unchanged": 0,
+                "not_modified": 0,
+                "coalesced": 0,
+                "errors": 0,
+                "events": 0,
+                "published": 0,
+                "shared": 0,
+            }
         return cls._instance
 
-    async def _get_session(self):
-        """Get or create aiohttp session."""
-        if self._session is None:
-            self._session = aiohttp.ClientSession()
-        return self._session
-
     async def get_worldstate_raw(self, params: dict = {}):
         """Get raw world state data without caching."""
         try:
-            session = await self._get_session()
-            async with session.get(settings.WORLDSTATE_URL, params=params) as response:
+            async with http_client.get(
+                settings.WORLDSTATE_URL, params=params
+            ) as response:
                 if response.status == 200:
                     return await response.text()
                 else:
@@ -45,54 +87,281 @@ class WorldstateClient:
             return None
 
     async def get_worldstate(self):
-        """Get current world state with caching."""
-        now = asyncio.get_event_loop().time()
+        """Get current world state, fetching it only if nothing is loaded yet."""
+        if self._cached_data is None:
+            await self.refresh()
+            if self._cached_data is None:
+                raise Exception("Failed to fetch worldstate and no cache available")
+        elif not self.is_polling and self._is_stale():
+            # without the poller, refresh in the background and serve what we have
+            self._inflight_or_new()
 
-        cache_valid = (
-            self._cached_data is not None
-            and self._cached_at is not None
-            and now - self._cached_at < settings.WORLDSTATE_CACHE_TTL
+        return self._cached_data
+
+    def _is_stale(self) -> bool:
+        return (
+            self._cached_at is None
+            or asyncio.get_running_loop().time() - self._cached_at
+            >= settings.WORLDSTATE_CACHE_TTL
         )
 
-        if not cache_valid:
+    def _inflight_or_new(self) -> asyncio.Task:
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._safe_refresh())
+        else:
+            self._stats["coalesced"] += 1
+        return self._inflight
+
+    async def refresh(self) -> bool:
+        """
+        Refresh the worldstate, returning True if a new snapshot was decoded.
+
+        Concurrent callers share a single in-flight request.
+        """
+        return await asyncio.shield(self._inflight_or_new())
+
+    async def _safe_refresh(self) -> bool:
+        try:
+            return await self._refresh()
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.error(f"Error fetching worldstate: {e}")
+            return False
+
+    @property
+    def payload_key(self) -> str:
+        return f"worldstate_payload:{settings.CACHE_VERSION}"
+
+    @property
+    def payload_hash_key(self) -> str:
+        return f"worldstate_payload_hash:{settings.CACHE_VERSION}"
+
+    async def _refresh(self) -> bool:
+        # only a polling replica leads, the others read what it publishes
+        if self.is_polling and await self._lease.acquire():
+            payload = await self._fetch_upstream(publish=True)
+        else:
+            payload = await self._fetch_shared()
+            if payload is None and self._shared_is_behind():
+                # nothing published yet or Redis is down, do not serve a
+                # frozen snapshot while waiting for the leader
+                payload = await self._fetch_upstream(publish=False)
+
+        if payload is None:
+            return False
+        return await self._apply(payload)
+
+    def _shared_is_behind(self) -> bool:
+        """True if the shared copy has not confirmed our snapshot for a poll."""
+        return (
+            self._cached_data is None
+            or self._cached_at is None
+            or asyncio.get_running_loop().time() - self._cached_at
+            >= settings.WORLDSTATE_POLL_INTERVAL
+        )
+
+    async def _fetch_upstream(self, publish: bool) -> bytes | None:
+        """Conditional GET of the worldstate, None if unchanged or failed."""
+        headers = {}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+
+        async with http_client.get(
+            settings.WORLDSTATE_URL, headers=headers
+        ) as response:
+            if response.status == 304:
+                self._cached_at = asyncio.get_running_loop().time()
+                self._stats["not_modified"] += 1
+                return None
+            if response.status != 200:
+                self._stats["errors"] += 1
+                logger.error(f"Worldstate API error: {response.status}")
+                return None
+
+            payload = await response.read()
+            self._etag = response.headers.get("ETag")
+            self._last_modified = response.headers.get("Last-Modified")
+
+        if publish:
+            digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+            packed = redis_codec.pack(payload)
+            published = await self._lease.fenced(
+                lambda pipe: (
+                    pipe.set(self.payload_key, packed),
+                    pipe.set(self.payload_hash_key, digest),
+                )
+            )
+            if published:
+                self._stats["published"] += 1
+        return payload
+
+    async def _fetch_shared(self) -> bytes | None:
+        """Payload published by the leading replica, None if unchanged."""
+        digest = await async_redis_client.get(self.payload_hash_key)
+        if digest is None:
+            return None
+        if self._payload_hash is not None and digest == self._payload_hash.hex():
+            self._cached_at = asyncio.get_running_loop().time()
+            self._stats["not_modified"] += 1
+            return None
+
+        packed = await async_redis_client.get_bytes(self.payload_key)
+        if packed is None:
+            return None
+        self._stats["shared"] += 1
+        return redis_codec.unpack(packed)
+
+    async def _apply(self, payload: bytes) -> bool:
+        """Decode a payload unless it matches the current snapshot."""
+        now = asyncio.get_running_loop().time()
+
+        # a new wiki version must be applied even if the payload is the same
+        await localization_service.refresh()
+        localization_version = localization_service.version
+
+        payload_hash = hashlib.blake2b(payload, digest_size=16).digest()
+        if payload_hash != self._payload_hash:
+            header = msgspec.json.decode(payload, type=WorldstateHeader, strict=False)
+        else:
+            header = self._header
+
+        if (
+            self._cached_data is not None
+            and header == self._header
+            and localization_version == self._localization_version
+        ):
+            self._payload_hash = payload_hash
+            self._cached_at = now
+            self._stats["unchanged"] += 1
+            return False
+
+        previous = self._cached_data
+        if settings.WORLDSTATE_LAZY_DECODE:
+            # sections are decoded and localized when first read
+            self._cached_data = LazyWorldstate.decode(
+                payload,
+                previous if isinstance(previous, LazyWorldstate) else None,
+            )
+        else:
+            self._cached_data = msgspec.json.decode(
+                payload, type=WorldstateModel, strict=False
+            )
+        self._payload_hash = payload_hash
+        self._header = header
+        self._localization_version = localization_version
+        self._cached_at = now
+        self._version += 1
+        self._stats["decoded"] += 1
+        logger.info("Worldstate data updated")
+
+        # every replica decodes the snapshot but only the leader notifies,
+        # or each of them would send the same notifications
+        if self._lease.held:
+            events = diff_worldstate(previous, self._cached_data)
+            if events:
+                self._stats["events"] += len(events)
+                self._dispatch(events)
+        return True
+
+    def add_listener(self, listener: WorldstateListener) -> None:
+        """
+        Register a coroutine called with the events of every new snapshot.
+        Only the replica holding the worldstate lease calls its listeners.
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: WorldstateListener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _dispatch(self, events: list[WorldstateEvent]) -> None:
+        # listeners run on their own so a slow one never holds up the refresh
+        for listener in self._listeners:
+            task = asyncio.create_task(self._notify(listener, events))
+            self._listener_tasks.add(task)
+            task.add_done_callback(self._listener_tasks.discard)
+
+    async def _notify(
+        self, listener: WorldstateListener, events: list[WorldstateEvent]
+    ) -> None:
+        try:
+            await listener(events)
+        except Exception as e:
+            logger.error(f"Worldstate listener {listener} failed: {e}")
+
+    @property
+    def version(self) -> int:
+        """Incremented every time a new snapshot is decoded."""
+        return self._version
+
+    @property
+    def has_snapshot(self) -> bool:
+        return self._cached_data is not None
+
+    @property
+    def is_polling(self) -> bool:
+        return self._poller is not None and not self._poller.done()
+
+    def start_polling(self, interval: int | None = None) -> asyncio.Task:
+        """Start the background task that keeps the worldstate fresh."""
+        if not self.is_polling:
+            self._poller = asyncio.create_task(
+                self._poll(interval or settings.WORLDSTATE_POLL_INTERVAL)
+            )
+        return self._poller
+
+    async def stop_polling(self):
+        if self._poller is not None:
+            self._poller.cancel()
             try:
-                session = await self._get_session()
-                async with session.get(settings.WORLDSTATE_URL) as response:
-                    if response.status == 200:
-                        data = await response.text()
-                        self._cached_data = msgspec.json.decode(
-                            data, type=WorldstateModel, strict=False
-                        )
-
-                        self._cached_at = now
-                        logger.info("Worldstate data updated")
-                    else:
-                        logger.error(f"Worldstate API error: {response.status}")
-                        if self._cached_data is None:
-                            raise Exception(
-                                f"Failed to fetch worldstate and no cache available: {response.status}"
-                            )
-            except Exception as e:
-                logger.error(f"Error fetching worldstate: {e}")
-                if self._cached_data is None:
-                    raise e
+                await self._poller
+            except asyncio.CancelledError:
+                pass
+            self._poller = None
+        await self._lease.release()
 
-        return self._cached_data
+    async def _poll(self, interval: int):
+        logger.info(f"Worldstate poller started, every {interval}s")
+        while True:
+            await self.refresh()
+            await asyncio.sleep(interval)
+
+    def stats(self) -> dict:
+        return {
+            "polling": self.is_polling,
+            "role": "leader" if self._lease.held else "follower",
+            "lease_token": self._lease.token,
+            "build_label": self._header.build_label if self._header else None,
+            "time": self._header.time if self._header else None,
+            "sections_decoded": (
+                self._cached_data.decoded_sections
+                if isinstance(self._cached_data, LazyWorldstate)
+                else None
+            ),
+            **self._stats,
+        }
 
-    def from_dict(self, data: dict) -> WorldstateModel:
+    async def from_dict(self, data: dict) -> WorldstateModel:
+        await localization_service.refresh()
         return msgspec.convert(data, type=WorldstateModel, strict=False)
 
     async def clear_cache(self):
         """Clear cached worldstate data."""
         self._cached_data = None
         self._cached_at = None
+        self._etag = None
+        self._last_modified = None
+        self._payload_hash = None
+        self._header = None
+        self._version += 1
         logger.info("Worldstate cache cleared")
 
     async def close(self):
-        """Close aiohttp session."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        """Stop polling, the HTTP session is shared and closed by http_client."""
+        await self.stop_polling()
 
 
 worldstate_client = WorldstateClient()
@@ -0,0 +1,124 @@
+import hashlib
+import logging
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable
+
+import msgspec
+
+from app.clients.warframe.worldstate.parsers.worldstate import (
+    LazyWorldstate,
+    WorldstateModel,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeKind(str, Enum):
+    ADDED = "added"
+    REMOVED = "removed"
+    CHANGED = "changed"
+
+
+@dataclass(frozen=True)
+class WorldstateEvent:
+    """A single entry that appeared, disappeared or changed between snapshots."""
+
+    section: str
+    kind: ChangeKind
+    key: str
+    old: Any | None = None
+    new: Any | None = None
+
+    @property
+    def entry(self) -> Any:
+        """The current entry, or the last known one for removals."""
+        return self.new if self.new is not None else self.old
+
+
+def _oid(entry: Any) -> str:
+    if entry.id:
+        return entry.id
+    # entries without an _id are keyed by their content, so they no longer
+    # all collide on "", a changed one shows up as removed and added
+    return hashlib.sha1(msgspec.json.encode(entry)).hexdigest()
+
+
+def _darvo_key(entry: Any) -> str:
+    # daily deals carry no _id, the item and start time identify a deal
+    return f"{entry.store_item}@{entry.activation}"
+
+
+# section -> (entries of a snapshot, stable key of an entry)
+SECTIONS: dict[
+    str, tuple[Callable[[WorldstateModel], list], Callable[[Any], str]]
+] = {
+    "active_missions": (lambda ws: ws.active_missions, _oid),
+    "void_storms": (lambda ws: ws.void_storms, _oid),
+    "alerts": (lambda ws: ws.alerts, _oid),
+    "void_traders": (lambda ws: ws.void_traders, _oid),
+    "daily_deals": (lambda ws: ws.daily_deals, _darvo_key),
+    "sorties": (lambda ws: ws.sorties, _oid),
+    "lite_sorties": (lambda ws: ws.lite_sorties, _oid),
+    # nightwave is a single season, what rotates are its challenges
+    "season_info": (lambda ws: ws.season_info.active_challenges, _oid),
+}
+
+
+def diff_section(section: str, old: list, new: list) -> list[WorldstateEvent]:
+    """Compare two lists of entries keyed by id in a single pass over each."""
+    _, key = SECTIONS[section]
+    previous = {key(entry): entry for entry in old}
+
+    events = []
+    for entry in new:
+        entry_key = key(entry)
+        before = previous.pop(entry_key, None)
+        if before is None:
+            events.append(
+                WorldstateEvent(section, ChangeKind.ADDED, entry_key, new=entry)
+            )
+        elif before != entry:
+            events.append(
+                WorldstateEvent(
+                    section, ChangeKind.CHANGED, entry_key, old=before, new=entry
+                )
+            )
+
+    for entry_key, entry in previous.items():
+        events.append(
+            WorldstateEvent(section, ChangeKind.REMOVED, entry_key, old=entry)
+        )
+    return events
+
+
+def _unchanged(section: str, old: Any, new: Any) -> bool:
+    # lazy snapshots compare the raw JSON of a section, so sections nobody
+    # read are not decoded just to find out that nothing changed
+    if isinstance(old, LazyWorldstate) and isinstance(new, LazyWorldstate):
+        return old.raw(section) == new.raw(section)
+    return False
+
+
+def diff_worldstate(
+    old: WorldstateModel | LazyWorldstate | None,
+    new: WorldstateModel | LazyWorldstate,
+) -> list[WorldstateEvent]:
+    """
+    Events between two snapshots.
+
+    The first snapshot only sets the baseline and produces no events, so a
+    restart does not report everything currently active as new.
+    """
+    if old is None:
+        return []
+
+    events = []
+    for section, (entries, _) in SECTIONS.items():
+        if _unchanged(section, old, new):
+            continue
+        try:
+            events.extend(diff_section(section, entries(old), entries(new)))
+        except Exception as e:
+            logger.error(f"Failed to diff worldstate section {section}: {e}")
+    return events
@@ -11,7 +11,9 @@ from app.clients.warframe.utils.localization import (
     localize_internal_mission_name,
     localize_internal_mission_type,
     localize_internal_name,
+    localize_many,
 )
+from app.clients.warframe.worldstate.parsers.mongo import MongoEntry
 
 
 def parse_mongo_date(date_dict: dict) -> datetime:
@@ -39,7 +41,7 @@ class _missionReward(Struct):
 
     def __post_init__(self):
         if len(self.items) != 0:
-            self.items = [localize_internal_name(item) for item in self.items]
+            self.items = localize_many(self.items)
 
 
 class _MissionInfo(Struct, kw_only=True):
@@ -64,15 +66,15 @@ class _MissionInfo(Struct, kw_only=True):
             self.faction = localize_internal_faction_type(self.faction)
 
 
-class Alert(Struct):
+class Alert(MongoEntry):
     activation: datetime | dict = field(name="Activation")
     expiry: datetime | dict = field(name="Expiry")
     tag: str = field(name="Tag")
     mission_info: _MissionInfo = field(name="MissionInfo")
-    _id: dict | None = field(name="_id", default=None)
     force_unlock: bool | None = field(name="ForceUnlock", default=None)
 
     def __post_init__(self):
+        super().__post_init__()
         if isinstance(self.activation, dict):
             self.activation = parse_mongo_date(self.activation)
         if isinstance(self.expiry, dict):
@@ -10,6 +10,7 @@ from app.clients.warframe.utils.localization import (
     localize_internal_mission_name,
     localize_internal_mission_type,
 )
+from app.clients.warframe.worldstate.parsers.mongo import MongoEntry
 
 
 def parse_mongo_date(date_dict: dict) -> datetime:
@@ -30,7 +31,7 @@ class _Mission(Struct):
             self.node = localize_internal_mission_name(self.node)
 
 
-class ArchonHunt(Struct):
+class ArchonHunt(MongoEntry):
     activation: datetime | dict = field(name="Activation")
     expiry: datetime | dict = field(name="Expiry")
     reward: str = field(name="Reward")
@@ -39,6 +40,7 @@ class ArchonHunt(Struct):
     missions: list[_Mission] = field(name="Missions")
 
     def __post_init__(self):
+        super().__post_init__()
         if isinstance(self.activation, dict):
             self.activation = parse_mongo_date(self.activation)
         if isinstance(self.expiry, dict):
@@ -10,6 +10,7 @@ from app.clients.warframe.utils.localization import (
     localize_internal_mission_name,
     localize_internal_name,
 )
+from app.clients.warframe.worldstate.parsers.mongo import MongoEntry
 
 
 def parse_mongo_date(date_dict: dict) -> datetime:
@@ -30,7 +31,7 @@ class _Inventory(Struct):
             self.item_type = localize_internal_name(self.item_type)
 
 
-class Baro(Struct):
+class Baro(MongoEntry):
     activation: datetime | dict = field(name="Activation")
     expiry: datetime | dict = field(name="Expiry")
     character: str = field(name="Character")
@@ -38,6 +39,7 @@ class Baro(Struct):
     manifest: list[_Inventory] = field(name="Manifest", default_factory=list)
 
     def __post_init__(self):
+        super().__post_init__()
         if isinstance(self.activation, dict):
             self.activation = parse_mongo_date(self.activation)
         if isinstance(self.expiry, dict):
@@ -3,7 +3,7 @@
 ######################################################
 from datetime import datetime
 
-from msgspec import Struct, field
+from msgspec import field
 from pytz import UTC
 
 from app.clients.warframe.utils.constant import VOID_TYPE
@@ -11,6 +11,7 @@ from app.clients.warframe.utils.localization import (
     localize_internal_mission_name,
     localize_internal_mission_type,
 )
+from app.clients.warframe.worldstate.parsers.mongo import MongoEntry
 
 
 def parse_mongo_date(date_dict: dict) -> datetime:
@@ -20,7 +21,7 @@ def parse_mongo_date(date_dict: dict) -> datetime:
     return datetime.fromtimestamp(timestamp_ms / 1000, tz=UTC)
 
 
-class Fissure(Struct):
+class Fissure(MongoEntry):
     activation: datetime | dict = field(name="Activation")
     expiry: datetime | dict = field(name="Expiry")
     region: int = field(name="Region")
@@ -32,6 +33,7 @@ class Fissure(Struct):
     tier: int = field(default=0)
 
     def __post_init__(self):
+        super().__post_init__()
         if isinstance(self.activation, dict):
             self.activation = parse_mongo_date(self.activation)
         if isinstance(self.expiry, dict):
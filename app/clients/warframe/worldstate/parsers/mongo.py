@@ -0,0 +1,14 @@
+from msgspec import Struct, field
+
+
+class MongoEntry(Struct, kw_only=True):
+    """
+    A worldstate entry with a Mongo _id, sent as {"$oid": "..."} and exposed
+    as a plain string. Entries without one get an empty id.
+    """
+
+    id: str | dict = field(name="_id", default="")
+
+    def __post_init__(self):
+        if isinstance(self.id, dict):
+            self.id = self.id.get("$oid", "")
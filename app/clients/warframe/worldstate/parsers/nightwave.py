@@ -9,6 +9,7 @@ from pytz import UTC
 from app.clients.warframe.utils.localization import (
     localize_internal_name,
 )
+from app.clients.warframe.worldstate.parsers.mongo import MongoEntry
 
 
 def parse_mongo_date(date_dict: dict) -> datetime:
@@ -18,13 +19,14 @@ def parse_mongo_date(date_dict: dict) -> datetime:
     return datetime.fromtimestamp(timestamp_ms / 1000, tz=UTC)
 
 
-class _ActiveChallenge(Struct):
+class _ActiveChallenge(MongoEntry):
     activation: datetime | dict = field(name="Activation")
     expiry: datetime | dict = field(name="Expiry")
     challenge: str = field(name="Challenge")
     challenge_type: str = ""
 
     def __post_init__(self):
+        super().__post_init__()
         if isinstance(self.activation, dict):
             self.activation = parse_mongo_date(self.activation)
         if isinstance(self.expiry, dict):
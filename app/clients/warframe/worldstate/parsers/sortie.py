@@ -10,6 +10,7 @@ from app.clients.warframe.utils.localization import (
     localize_internal_mission_name,
     localize_internal_mission_type,
 )
+from app.clients.warframe.worldstate.parsers.mongo import MongoEntry
 
 
 def parse_mongo_date(date_dict: dict) -> datetime:
@@ -32,7 +33,7 @@ class _Variant(Struct):
             self.node = localize_internal_mission_name(self.node)
 
 
-class Sortie(Struct):
+class Sortie(MongoEntry):
     activation: datetime | dict = field(name="Activation")
     expiry: datetime | dict = field(name="Expiry")
     reward: str = field(name="Reward")
@@ -43,6 +44,7 @@ class Sortie(Struct):
     twitter: bool = field(name="Twitter", default=False)
 
     def __post_init__(self):
+        super().__post_init__()
         if isinstance(self.activation, dict):
             self.activation = parse_mongo_date(self.activation)
         if isinstance(self.expiry, dict):
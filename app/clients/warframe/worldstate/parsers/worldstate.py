@@ -1,4 +1,9 @@
+import logging
+from typing import Any
+
+import msgspec
 from msgspec import Struct, field
+from typing_extensions import Self
 
 from app.clients.warframe.worldstate.parsers.alert import Alert
 from app.clients.warframe.worldstate.parsers.archimedea import Archimedea
@@ -11,6 +16,8 @@ from app.clients.warframe.worldstate.parsers.nightwave import Nightwave
 from app.clients.warframe.worldstate.parsers.sortie import Sortie
 from app.clients.warframe.worldstate.parsers.voidstorm import VoidStorm
 
+logger = logging.getLogger(__name__)
+
 
 class WorldstateModel(Struct, kw_only=True):
     version: int = field(name="Version")
@@ -53,3 +60,146 @@ class WorldstateModel(Struct, kw_only=True):
         self.active_missions.sort(key=lambda fissure: fissure.tier, reverse=True)
         # sort void storms by tier
         self.void_storms.sort(key=lambda storm: storm.tier, reverse=True)
+
+
+# section -> (type, field name in the payload)
+SECTIONS: dict[str, tuple[Any, str]] = {
+    "alerts": (list[Alert], "Alerts"),
+    "conquests": (list[Archimedea], "Conquests"),
+    "lite_sorties": (list[ArchonHunt], "LiteSorties"),
+    "void_traders": (list[Baro], "VoidTraders"),
+    "circuits": (list[Circuit], "EndlessXpChoices"),
+    "daily_deals": (list[Darvo], "DailyDeals"),
+    "active_missions": (list[Fissure], "ActiveMissions"),
+    "void_storms": (list[VoidStorm], "VoidStorms"),
+    "season_info": (Nightwave, "SeasonInfo"),
+    "sorties": (list[Sortie], "Sorties"),
+}
+
+_EMPTY = msgspec.Raw(b"[]")
+
+
+class _RawWorldstate(Struct, kw_only=True):
+    """The worldstate with every section left as undecoded JSON."""
+
+    version: int = field(name="Version")
+    mobile_version: str = field(name="MobileVersion")
+    build_label: str = field(name="BuildLabel")
+    time: int = field(name="Time")
+
+    alerts: msgspec.Raw = field(name="Alerts", default=_EMPTY)
+    conquests: msgspec.Raw = field(name="Conquests")
+    lite_sorties: msgspec.Raw = field(name="LiteSorties")
+    void_traders: msgspec.Raw = field(name="VoidTraders")
+    circuits: msgspec.Raw = field(name="EndlessXpChoices")
+    daily_deals: msgspec.Raw = field(name="DailyDeals")
+    active_missions: msgspec.Raw = field(name="ActiveMissions")
+    void_storms: msgspec.Raw = field(name="VoidStorms")
+    season_info: msgspec.Raw = field(name="SeasonInfo")
+    sorties: msgspec.Raw = field(name="Sorties")
+
+
+class LazyWorldstate:
+    """
+    Same attributes as WorldstateModel, but a section is only decoded and
+    localized the first time it is read, then kept for this snapshot.
+
+    A refresh only checks that the sections are there, so Baro's manifest
+    and the like cost nothing until someone asks for them. A section that
+    fails to decode is logged and replaced by the one of the previous
+    snapshot, or an empty list, so one bad section leaves the others usable.
+    """
+
+    def __init__(self, raw: _RawWorldstate, previous: Self | None = None):
+        self._raw = raw
+        self._sections: dict[str, Any] = {}
+        # only the sections the previous snapshot decoded, not the snapshot,
+        # so snapshots do not keep each other alive
+        self._fallback: dict[str, Any] = previous._sections if previous else {}
+        self.version = raw.version
+        self.mobile_version = raw.mobile_version
+        self.build_label = raw.build_label
+        self.time = raw.time
+
+    @classmethod
+    def decode(cls, payload: bytes, previous: Self | None = None) -> Self:
+        return cls(
+            msgspec.json.decode(payload, type=_RawWorldstate, strict=False),
+            previous,
+        )
+
+    def raw(self, section: str) -> bytes:
+        """Undecoded JSON of a section, equal across snapshots if unchanged."""
+        return bytes(getattr(self._raw, section))
+
+    def section(self, section: str) -> Any:
+        if section not in self._sections:
+            try:
+                value = self._decode(section)
+            except Exception as e:
+                logger.error(f"Failed to decode worldstate section {section}: {e}")
+                value = self._fallback_for(section, e)
+            self._sections[section] = value
+        return self._sections[section]
+
+    def _decode(self, section: str) -> Any:
+        type, _ = SECTIONS[section]
+        value = msgspec.json.decode(
+            getattr(self._raw, section), type=type, strict=False
+        )
+        if section in ("active_missions", "void_storms"):
+            value.sort(key=lambda entry: entry.tier, reverse=True)
+        return value
+
+    def _fallback_for(self, section: str, error: Exception) -> Any:
+        if section in self._fallback:
+            return self._fallback[section]
+        type, _ = SECTIONS[section]
+        if getattr(type, "__origin__", None) is list:
+            return []
+        # nightwave has no empty value, the reader gets the error
+        raise error
+
+    @property
+    def decoded_sections(self) -> list[str]:
+        return list(self._sections)
+
+    @property
+    def alerts(self) -> list[Alert]:
+        return self.section("alerts")
+
+    @property
+    def conquests(self) -> list[Archimedea]:
+        return self.section("conquests")
+
+    @property
+    def lite_sorties(self) -> list[ArchonHunt]:
+        return self.section("lite_sorties")
+
+    @property
+    def void_traders(self) -> list[Baro]:
+        return self.section("void_traders")
+
+    @property
+    def circuits(self) -> list[Circuit]:
+        return self.section("circuits")
+
+    @property
+    def daily_deals(self) -> list[Darvo]:
+        return self.section("daily_deals")
+
+    @property
+    def active_missions(self) -> list[Fissure]:
+        return self.section("active_missions")
+
+    @property
+    def void_storms(self) -> list[VoidStorm]:
+        return self.section("void_storms")
+
+    @property
+    def season_info(self) -> Nightwave:
+        return self.section("season_info")
+
+    @property
+    def sorties(self) -> list[Sortie]:
+        return self.section("sorties")
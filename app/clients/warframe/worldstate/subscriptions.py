@@ -0,0 +1,347 @@
+import json
+import logging
+import uuid
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from itertools import product
+from typing import Any, Callable, Literal
+
+from redis.asyncio.client import Pipeline
+
+from app.clients.redis import async_redis_client
+from app.clients.warframe.worldstate.diff import ChangeKind, WorldstateEvent
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+SubscriptionKind = Literal["fissure", "baro", "alert"]
+TargetType = Literal["channel", "user"]
+
+# stands for "any value" in the fissure index
+_ANY = "*"
+
+
+def normalize(value: str) -> str:
+    return " ".join(value.lower().split())
+
+
+@dataclass(frozen=True)
+class Subscription:
+    """
+    A filter registered by a channel or user.
+
+    Unset fields match anything. Fissures filter on tier, mission type and
+    steel path, Baro and alerts on words of an item name, so "forma" matches
+    a Forma Blueprint.
+    """
+
+    id: str
+    kind: SubscriptionKind
+    target_type: TargetType
+    target_id: int
+    owner_id: int
+    tier: str | None = None
+    mission_type: str | None = None
+    hard: bool | None = None
+    item: str | None = None
+
+    @property
+    def description(self) -> str:
+        if self.kind == "fissure":
+            parts = [
+                self.tier or "Any tier",
+                self.mission_type or "any mission",
+                {True: "(Steel Path)", False: "(Normal)", None: ""}[self.hard],
+            ]
+            return f"Fissure: {' '.join(part for part in parts if part)}"
+        if self.item:
+            return f"{self.kind.title()}: {self.item}"
+        return f"{self.kind.title()}: any"
+
+
+@dataclass(frozen=True)
+class Match:
+    """An entry from the worldstate and the subscriptions it satisfies."""
+
+    event: WorldstateEvent
+    subscriptions: tuple[Subscription, ...]
+    items: tuple[str, ...] = ()
+
+
+class SubscriptionIndex:
+    """
+    Lookup tables from entry attributes to subscriptions.
+
+    Matching an entry costs a handful of dict lookups no matter how many
+    subscriptions exist, instead of testing every filter. Item filters are
+    indexed by their first word and match any item name containing their
+    words in order.
+    """
+
+    def __init__(self, subscriptions: list[Subscription]):
+        # (tier, mission type, hard) with _ANY for unset fields
+        self.fissures: dict[tuple[str, str, str], list[Subscription]] = defaultdict(
+            list
+        )
+        # kind -> first word of the item filter -> (its words, subscription)
+        self.items: dict[
+            str, dict[str, list[tuple[tuple[str, ...], Subscription]]]
+        ] = defaultdict(lambda: defaultdict(list))
+        # kind -> subscriptions without an item filter
+        self.any_item: dict[str, list[Subscription]] = defaultdict(list)
+
+        for subscription in subscriptions:
+            self.add(subscription)
+
+    def add(self, subscription: Subscription) -> None:
+        if subscription.kind == "fissure":
+            self.fissures[self._fissure_key(subscription)].append(subscription)
+        elif subscription.item and subscription.item.strip():
+            words = tuple(normalize(subscription.item).split())
+            self.items[subscription.kind][words[0]].append((words, subscription))
+        else:
+            self.any_item[subscription.kind].append(subscription)
+
+    @staticmethod
+    def _fissure_key(subscription: Subscription) -> tuple[str, str, str]:
+        return (
+            normalize(subscription.tier) if subscription.tier else _ANY,
+            normalize(subscription.mission_type)
+            if subscription.mission_type
+            else _ANY,
+            str(subscription.hard) if subscription.hard is not None else _ANY,
+        )
+
+    def match_fissure(
+        self, tier: str, mission_type: str, hard: bool
+    ) -> list[Subscription]:
+        matched = []
+        for key in product(
+            (normalize(tier), _ANY), (normalize(mission_type), _ANY), (str(hard), _ANY)
+        ):
+            matched.extend(self.fissures.get(key, ()))
+        return matched
+
+    def match_items(
+        self, kind: SubscriptionKind, items: list[str]
+    ) -> tuple[list[Subscription], tuple[str, ...]]:
+        """Subscriptions wanting any of the items, and the items that matched."""
+        by_word = self.items.get(kind, {})
+        matched = []
+        matched_items = []
+        for item in items:
+            words = normalize(item).split()
+            subscriptions = [
+                subscription
+                for start, word in enumerate(words)
+                for wanted, subscription in by_word.get(word, ())
+                if tuple(words[start : start + len(wanted)]) == wanted
+            ]
+            if subscriptions:
+                matched.extend(subscriptions)
+                matched_items.append(item)
+        return matched, tuple(matched_items)
+
+
+def _alert_items(alert: Any) -> list[str]:
+    reward = alert.mission_info.mission_reward
+    return [*reward.items, *(counted.item for counted in reward.counted_items)]
+
+
+def _new_baro_items(event: WorldstateEvent) -> list[str]:
+    before = {entry.item_type for entry in event.old.manifest} if event.old else set()
+    return [
+        entry.item_type
+        for entry in event.new.manifest
+        if entry.item_type not in before
+    ]
+
+
+def match_events(
+    index: SubscriptionIndex, events: list[WorldstateEvent]
+) -> list[Match]:
+    """Resolve diff events to the subscriptions they should notify."""
+    matches = []
+    for event in events:
+        if event.kind == ChangeKind.REMOVED:
+            continue
+
+        subscriptions: list[Subscription] = []
+        items: tuple[str, ...] = ()
+
+        if event.section == "active_missions" and event.kind == ChangeKind.ADDED:
+            fissure = event.new
+            subscriptions = index.match_fissure(
+                fissure.modifier, fissure.mission_type, fissure.hard
+            )
+        elif event.section == "alerts" and event.kind == ChangeKind.ADDED:
+            subscriptions, items = index.match_items("alert", _alert_items(event.new))
+            subscriptions += index.any_item.get("alert", [])
+        elif event.section == "void_traders":
+            new_items = _new_baro_items(event)
+            if not new_items:
+                continue
+            subscriptions, items = index.match_items("baro", new_items)
+            # plain arrival subscriptions only fire when the inventory appears
+            if not event.old or not event.old.manifest:
+                subscriptions += index.any_item.get("baro", [])
+
+        if subscriptions:
+            unique = tuple({sub.id: sub for sub in subscriptions}.values())
+            matches.append(Match(event=event, subscriptions=unique, items=items))
+    return matches
+
+
+class SubscriptionStore:
+    """
+    Subscriptions persisted in a Redis hash, with an in-memory index.
+
+    Writes go to Redis first and then update the index, so the index is
+    always a view of what is stored. Every write also bumps a counter, and
+    the index is reloaded when the counter moved, so writes made through
+    other replicas show up here too. Subscriptions are user data, not a
+    cache, so the key does not change with CACHE_VERSION.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._subscriptions = {}
+            cls._instance._index = SubscriptionIndex([])
+            cls._instance._loaded = False
+            cls._instance._version = None
+        return cls._instance
+
+    key = "subscriptions"
+    version_key = "subscriptions_version"
+
+    @property
+    def legacy_key(self) -> str:
+        # where subscriptions were kept before the key was made persistent
+        return f"subscriptions:{settings.CACHE_VERSION}"
+
+    @property
+    def index(self) -> SubscriptionIndex:
+        return self._index
+
+    async def load(self) -> None:
+        client = async_redis_client.get_client()
+        try:
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.get(self.version_key)
+                pipe.hgetall(self.key)
+                version, stored = await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to load subscriptions: {e}")
+            return
+        if not stored:
+            stored = await self._migrate_legacy()
+        subscriptions = {}
+        for sub_id, value in stored.items():
+            try:
+                subscriptions[sub_id] = Subscription(**json.loads(value))
+            except Exception as e:
+                logger.error(f"Skipping invalid subscription {sub_id}: {e}")
+        self._subscriptions = subscriptions
+        self._index = SubscriptionIndex(list(subscriptions.values()))
+        self._loaded = True
+        self._version = version
+        logger.info(f"Loaded {len(subscriptions)} subscriptions")
+
+    async def _migrate_legacy(self) -> dict[str, str]:
+        """Move subscriptions from the versioned key, once."""
+        stored = await async_redis_client.hgetall(self.legacy_key)
+        if not stored:
+            return {}
+        client = async_redis_client.get_client()
+        try:
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.hset(self.key, mapping=stored)
+                pipe.delete(self.legacy_key)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to migrate subscriptions: {e}")
+        else:
+            logger.info(f"Migrated {len(stored)} subscriptions to {self.key}")
+        return stored
+
+    async def _ensure_loaded(self) -> None:
+        """Reload the index if any replica changed the subscriptions since."""
+        if self._loaded:
+            try:
+                version = await async_redis_client.get_client().get(
+                    self.version_key
+                )
+            except Exception as e:
+                # keep matching against what we have until Redis is back
+                logger.warning(f"Failed to check subscriptions version: {e}")
+                return
+            if version == self._version:
+                return
+        await self.load()
+
+    async def _write(self, apply: Callable[[Pipeline], Any]) -> None:
+        """Apply a change to the hash and bump the version with it."""
+        client = async_redis_client.get_client()
+        async with client.pipeline(transaction=True) as pipe:
+            apply(pipe)
+            pipe.incr(self.version_key)
+            *_, version = await pipe.execute()
+        # only skip the next reload if nobody else wrote in between
+        if int(self._version or 0) + 1 == version:
+            self._version = str(version)
+
+    async def add(self, **fields) -> Subscription | None:
+        await self._ensure_loaded()
+        subscription = Subscription(id=uuid.uuid4().hex[:8], **fields)
+
+        value = json.dumps(asdict(subscription))
+        try:
+            await self._write(lambda pipe: pipe.hset(self.key, subscription.id, value))
+        except Exception as e:
+            logger.error(f"Failed to store subscription: {e}")
+            return None
+
+        self._subscriptions[subscription.id] = subscription
+        self._index.add(subscription)
+        return subscription
+
+    async def remove(self, sub_id: str, owner_id: int | None = None) -> bool:
+        """Remove a subscription, optionally only if owned by owner_id."""
+        await self._ensure_loaded()
+        subscription = self._subscriptions.get(sub_id)
+        if subscription is None:
+            return False
+        if owner_id is not None and subscription.owner_id != owner_id:
+            return False
+
+        try:
+            await self._write(lambda pipe: pipe.hdel(self.key, sub_id))
+        except Exception as e:
+            logger.error(f"Failed to remove subscription {sub_id}: {e}")
+            return False
+
+        del self._subscriptions[sub_id]
+        self._index = SubscriptionIndex(list(self._subscriptions.values()))
+        return True
+
+    async def for_owner(self, owner_id: int) -> list[Subscription]:
+        await self._ensure_loaded()
+        return [
+            sub for sub in self._subscriptions.values() if sub.owner_id == owner_id
+        ]
+
+    async def match(self, events: list[WorldstateEvent]) -> list[Match]:
+        await self._ensure_loaded()
+        return match_events(self._index, events)
+
+    def stats(self) -> dict[str, int]:
+        counts: dict[str, int] = defaultdict(int)
+        for subscription in self._subscriptions.values():
+            counts[subscription.kind] += 1
+        return dict(counts)
+
+
+subscription_store = SubscriptionStore()
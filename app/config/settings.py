@@ -18,6 +18,14 @@ class Settings:
     REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
     REDIS_DB: int = int(os.getenv("REDIS_DB", "1"))
     REDIS_PASSWORD: str | None = os.getenv("REDIS_PASSWORD")
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "20"))
+    REDIS_POOL_TIMEOUT: int = int(os.getenv("REDIS_POOL_TIMEOUT", "5"))
+    # how large cached values are stored, see app/clients/redis/codec.py
+    REDIS_ENCODING: str = os.getenv("REDIS_ENCODING", "msgpack")
+    REDIS_COMPRESSION: str = os.getenv("REDIS_COMPRESSION", "zstd")
+    REDIS_COMPRESSION_MIN_SIZE: int = int(
+        os.getenv("REDIS_COMPRESSION_MIN_SIZE", "1024")
+    )
     REDIS_URL: str = os.getenv(
         "REDIS_URL", f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
     )
@@ -29,10 +37,34 @@ class Settings:
     WORLDSTATE_CACHE_TTL: int = int(
         os.getenv("WORLDSTATE_CACHE_TTL", "300")
     )  # 5 minutes
+    WORLDSTATE_POLL_INTERVAL: int = int(os.getenv("WORLDSTATE_POLL_INTERVAL", "60"))
+    WORLDSTATE_LAZY_DECODE: bool = (
+        os.getenv("WORLDSTATE_LAZY_DECODE", "true").lower() == "true"
+    )
+
+    # Shared HTTP client
+    HTTP_POOL_SIZE: int = int(os.getenv("HTTP_POOL_SIZE", "100"))
+    HTTP_POOL_SIZE_PER_HOST: int = int(os.getenv("HTTP_POOL_SIZE_PER_HOST", "10"))
+    HTTP_DNS_CACHE_TTL: int = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+    HTTP_KEEPALIVE_TIMEOUT: float = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))
+    HTTP_TIMEOUT: float = float(os.getenv("HTTP_TIMEOUT", "30"))
+    HTTP_CONNECT_TIMEOUT: float = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+    HTTP_MAX_RETRIES: int = int(os.getenv("HTTP_MAX_RETRIES", "2"))
+    HTTP_RETRY_BACKOFF: float = float(os.getenv("HTTP_RETRY_BACKOFF", "0.5"))
 
     # Job Configuration
     JOB_MAX_RETRIES: int = int(os.getenv("JOB_MAX_RETRIES", "5"))
     JOB_RETRY_DELAY: int = int(os.getenv("JOB_RETRY_DELAY", "2"))
+    # seconds a replica keeps a job or poller lease without renewing it
+    LEASE_TTL: int = int(os.getenv("LEASE_TTL", "30"))
+    JOB_JITTER_SECONDS: int = int(os.getenv("JOB_JITTER_SECONDS", "30"))
+    # share of a cache TTL left when the refresh job runs
+    JOB_REFRESH_AHEAD: float = float(os.getenv("JOB_REFRESH_AHEAD", "0.2"))
+    # optional cron expression (UTC) replacing DATA_REFRESH_INTERVAL for the wiki
+    WIKI_REFRESH_CRON: str | None = os.getenv("WIKI_REFRESH_CRON")
+    # serve the last known-good data at startup and refresh in the background
+    WARM_START: bool = os.getenv("WARM_START", "true").lower() == "true"
+    SNAPSHOT_DIR: str = os.getenv("SNAPSHOT_DIR", "data/snapshot")
 
     # Jobs-specific configuration
     GITHUB_DATA_URL: str = os.getenv(
@@ -43,6 +75,74 @@ class Settings:
         os.getenv("DATA_REFRESH_INTERVAL", "3600")
     )  # 1 hour
     DATA_CACHE_SECONDS: int = int(os.getenv("DATA_CACHE_SECONDS", "3600"))  # 1 hour
+    WIKI_VERSION_CHECK_SECONDS: int = int(
+        os.getenv("WIKI_VERSION_CHECK_SECONDS", "30")
+    )
+    WIKI_LOAD_CONCURRENCY: int = int(os.getenv("WIKI_LOAD_CONCURRENCY", "4"))
+
+    # Warframe Market order cache
+    MARKET_ORDERS_TTL: int = int(os.getenv("MARKET_ORDERS_TTL", "60"))
+    MARKET_ORDERS_STALE_TTL: int = int(os.getenv("MARKET_ORDERS_STALE_TTL", "600"))
+    MARKET_ORDERS_LOCAL_SIZE: int = int(os.getenv("MARKET_ORDERS_LOCAL_SIZE", "2048"))
+
+    # Price history of every order cache refresh, retention in seconds
+    PRICE_HISTORY_ENABLED: bool = (
+        os.getenv("PRICE_HISTORY_ENABLED", "true").lower() == "true"
+    )
+    PRICE_HISTORY_RAW_RETENTION: int = int(
+        os.getenv("PRICE_HISTORY_RAW_RETENTION", "172800")
+    )
+    PRICE_HISTORY_HOURLY_RETENTION: int = int(
+        os.getenv("PRICE_HISTORY_HOURLY_RETENTION", "2592000")
+    )
+    PRICE_HISTORY_DAILY_RETENTION: int = int(
+        os.getenv("PRICE_HISTORY_DAILY_RETENTION", "31536000")
+    )
+    PRICE_HISTORY_COMPACT_INTERVAL: int = int(
+        os.getenv("PRICE_HISTORY_COMPACT_INTERVAL", "3600")
+    )
+
+    # Warframe Market request scheduler
+    MARKET_RATE_LIMIT: float = float(os.getenv("MARKET_RATE_LIMIT", "3"))
+    MARKET_RATE_BURST: int = int(os.getenv("MARKET_RATE_BURST", "3"))
+    MARKET_MAX_RETRIES: int = int(os.getenv("MARKET_MAX_RETRIES", "3"))
+    MARKET_RETRY_BACKOFF: float = float(os.getenv("MARKET_RETRY_BACKOFF", "1"))
+
+    # Live order books from the market websocket, REST polling while it is down
+    MARKET_WS_ENABLED: bool = os.getenv("MARKET_WS_ENABLED", "false").lower() == "true"
+    MARKET_WS_URL: str = os.getenv("MARKET_WS_URL", "wss://ws.warframe.market/socket")
+    MARKET_WS_HEARTBEAT: float = float(os.getenv("MARKET_WS_HEARTBEAT", "30"))
+    MARKET_WS_MAX_BACKOFF: float = float(os.getenv("MARKET_WS_MAX_BACKOFF", "60"))
+
+    # Relic values, from a price snapshot of every relic and prime part
+    RELIC_VALUES_REFRESH_INTERVAL: int = int(
+        os.getenv("RELIC_VALUES_REFRESH_INTERVAL", "3600")
+    )
+    PRICE_SNAPSHOT_CONCURRENCY: int = int(os.getenv("PRICE_SNAPSHOT_CONCURRENCY", "4"))
+
+    # Screenshot price checks, screenshots read, matched and priced at once
+    PRICECHECK_SCRAPE_CONCURRENCY: int = int(
+        os.getenv("PRICECHECK_SCRAPE_CONCURRENCY", "3")
+    )
+    PRICECHECK_MATCH_CONCURRENCY: int = int(
+        os.getenv("PRICECHECK_MATCH_CONCURRENCY", "2")
+    )
+    PRICECHECK_PRICE_CONCURRENCY: int = int(
+        os.getenv("PRICECHECK_PRICE_CONCURRENCY", "6")
+    )
+    # seconds between updates of the results while prices come in
+    PRICECHECK_RENDER_INTERVAL: float = float(
+        os.getenv("PRICECHECK_RENDER_INTERVAL", "2")
+    )
+
+    # Prime set valuations, PRIME_SETS_BATCH of the most due sets per run
+    PRIME_SETS_REFRESH_INTERVAL: int = int(
+        os.getenv("PRIME_SETS_REFRESH_INTERVAL", "300")
+    )
+    PRIME_SETS_BATCH: int = int(os.getenv("PRIME_SETS_BATCH", "20"))
+
+    # Notification Configuration
+    NOTIFY_MAX_CONCURRENCY: int = int(os.getenv("NOTIFY_MAX_CONCURRENCY", "5"))
 
     # Web Server Configuration
     ENABLE_FASTAPI: bool = os.getenv("ENABLE_FASTAPI", "false").lower() == "true"
@@ -105,8 +205,10 @@ class Settings:
         "app.bot.cogs.prime",
         "app.bot.cogs.pset",
         "app.bot.cogs.relic",
+        "app.bot.cogs.relicev",
         "app.bot.cogs.riven",
         "app.bot.cogs.sortie",
+        "app.bot.cogs.subscribe",
         "app.bot.cogs.weapons",
         "app.bot.cogs.wfm",
     )
@@ -7,6 +7,10 @@ from typing import Any
 
 from pytz import UTC
 
+from app.clients.redis.async_client import async_redis_client
+from app.clients.redis.lease import Lease
+from app.config.settings import settings
+
 
 class JobStatus(str, Enum):
     PENDING = "pending"
@@ -14,6 +18,7 @@ class JobStatus(str, Enum):
     SUCCESS = "success"
     FAILED = "failed"
     CANCELLED = "cancelled"
+    SKIPPED = "skipped"
 
 
 class JobResult:
@@ -55,10 +60,15 @@ class JobResult:
 
 
 class BaseJob(ABC):
+    # exclusive jobs run on one replica at a time, under a Redis lease
+    exclusive: bool = True
+
     def __init__(self, name: str, logger: logging.Logger | None = None):
         self.name = name
         self.logger = logger or logging.getLogger(f"job.{name}")
         self._cancelled = False
+        # set by JobRunner while an exclusive job runs, for fenced writes
+        self.lease: Lease | None = None
 
     @abstractmethod
     async def execute(self, *args, **kwargs) -> JobResult:
@@ -105,10 +115,77 @@ class JobRunner:
     def __init__(self):
         self.logger = logging.getLogger("job_runner")
 
-    async def run_job(self, job: BaseJob, *args, **kwargs) -> JobResult:
-        """Run a job and handle errors and cancellation."""
+    async def run_job(
+        self, job: BaseJob, *args, fresh_for: float | None = None, **kwargs
+    ) -> JobResult:
+        """
+        Run a job and handle errors and cancellation.
+
+        Exclusive jobs only run if this replica gets the job's lease, other
+        replicas skip the run and read what the holder publishes. With
+        fresh_for, a successful run also leaves a fenced marker for that many
+        seconds, and the job is skipped everywhere while the marker exists.
+        """
         started_at = datetime.now(tz=UTC)
 
+        if job.exclusive and fresh_for and await self._ran_recently(job):
+            self.logger.info(f"Job {job.name} ran recently on another replica")
+            return JobResult(
+                job_name=job.name,
+                status=JobStatus.SKIPPED,
+                started_at=started_at,
+                completed_at=datetime.now(tz=UTC),
+                duration_seconds=0,
+                message="Job ran recently on another replica",
+            )
+
+        if job.exclusive:
+            lease = Lease(f"job:{job.name}")
+            if not await lease.acquire():
+                self.logger.info(
+                    f"Job {job.name} is running on another replica, skipping"
+                )
+                return JobResult(
+                    job_name=job.name,
+                    status=JobStatus.SKIPPED,
+                    started_at=started_at,
+                    completed_at=datetime.now(tz=UTC),
+                    duration_seconds=0,
+                    message="Job is running on another replica",
+                )
+            job.lease = lease
+
+        try:
+            result = await self._run(job, started_at, *args, **kwargs)
+            if job.lease is not None and fresh_for:
+                await self._mark_ran(job, result, fresh_for)
+            return result
+        finally:
+            if job.lease is not None:
+                await job.lease.release()
+                job.lease = None
+
+    @staticmethod
+    def _last_run_key(job: BaseJob) -> str:
+        return f"job_last_run:{job.name}:{settings.CACHE_VERSION}"
+
+    async def _ran_recently(self, job: BaseJob) -> bool:
+        return await async_redis_client.exists(self._last_run_key(job))
+
+    async def _mark_ran(self, job: BaseJob, result: JobResult, fresh_for: float):
+        """Keep other replicas from rerunning a successful job for fresh_for."""
+        if result.status != JobStatus.SUCCESS:
+            return
+        ttl = int(fresh_for - (result.duration_seconds or 0))
+        if ttl < 1:
+            return
+        key = self._last_run_key(job)
+        completed_at = (result.completed_at or datetime.now(tz=UTC)).isoformat()
+        await job.lease.fenced(lambda pipe: pipe.set(key, completed_at, ex=ttl))
+
+    async def _run(
+        self, job: BaseJob, started_at: datetime, *args, **kwargs
+    ) -> JobResult:
         try:
             self.logger.info(f"Starting job: {job.name}")
             result = await job.execute(*args, **kwargs)
@@ -1,11 +1,14 @@
 from datetime import datetime
 
+import msgspec
 from pytz import UTC
-from warframe_market.client import WarframeMarketClient
 from warframe_market.common import Subtype
 
-from app.clients.redis import redis_client
+from app.clients.redis import async_redis_client, redis_codec
+from app.clients.warframe.market.client import market_client
+from app.clients.warframe.market.scheduler import Priority, market_priority
 from app.config.settings import settings
+from app.utils.local_snapshot import local_snapshot
 
 from .base import BaseJob, JobResult, JobRunner, JobStatus
 
@@ -13,7 +16,7 @@ from .base import BaseJob, JobResult, JobRunner, JobStatus
 class LoadMarketItemsJob(BaseJob):
     def __init__(self):
         super().__init__("load_market_items")
-        self.redis = redis_client
+        self.redis = async_redis_client
         self.cache_version = settings.CACHE_VERSION
         self.cache_ttl = settings.DATA_CACHE_SECONDS
 
@@ -22,8 +25,8 @@ class LoadMarketItemsJob(BaseJob):
 
         try:
             self.logger.info("Loading market items from Warframe Market API")
-            client = WarframeMarketClient()
-            items_response = await client.get_all_items()
+            with market_priority(Priority.BACKGROUND):
+                items_response = await market_client.get_all_items()
 
             serialized = []
             for item in items_response.data:
@@ -38,21 +41,29 @@ class LoadMarketItemsJob(BaseJob):
 
                 serialized.append(
                     {
+                        "id": item.id,
                         "name": en_name,
                         "slug": item.slug,
                         "max_rank": item.max_rank,
                         "max_charges": item.max_charges,
                         "subtypes": item.subtypes,
                         "tags": item.tags,
+                        "ducats": item.ducats,
                     }
                 )
 
-            import json
-
-            redis_client.set(
-                f"market_items:{self.cache_version}",
-                json.dumps(serialized),
-                ex=self.cache_ttl,
+            key = f"market_items:{self.cache_version}"
+            payload = redis_codec.encode(serialized)
+            if self.lease is not None:
+                stored = await self.lease.fenced(
+                    lambda pipe: pipe.set(key, payload, ex=self.cache_ttl)
+                )
+                if not stored:
+                    raise RuntimeError("Lost the job lease, not storing market items")
+            else:
+                await async_redis_client.set(key, payload, ex=self.cache_ttl)
+            await local_snapshot.save(
+                "market", "items", msgspec.json.encode(serialized)
             )
 
             completed_at = datetime.now(tz=UTC)
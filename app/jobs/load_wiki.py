@@ -1,69 +1,217 @@
 import asyncio
 import json
+import time
 from datetime import datetime
 from typing import Any
 
+import msgspec
 from pytz import UTC
+from redis.asyncio.client import Pipeline
 
-from app.clients.redis import redis_client
+from app.clients.redis import async_redis_client, redis_codec
+from app.clients.warframe.wiki.hash_store import wiki_hash_store
+from app.clients.warframe.wiki.models import DATASET_TYPES
+from app.clients.warframe.wiki.snapshot import wiki_snapshot_store
 from app.config.settings import settings
 from app.utils.http import http_client
+from app.utils.local_snapshot import local_snapshot
 
 from .base import BaseJob, JobResult, JobRunner, JobStatus
 
 
 class LoadWikiJob(BaseJob):
-    """Job to load and cache wiki data from external sources."""
+    """
+    Job to load and cache wiki data from external sources.
+
+    Sources are fetched concurrently with conditional requests. The
+    ETag/Last-Modified of every stored source is kept in Redis, so files
+    that did not change upstream come back as 304 and are not downloaded,
+    parsed or written again. Sources with a model in DATASET_TYPES are
+    validated against it first, an invalid file is reported and not stored.
+
+    Changed sources, their validators and the hashes built from them are
+    written in the transaction that publishes the new version, fenced by
+    the job's lease, so a loader that lost the lease writes nothing.
+    """
 
     def __init__(self):
         super().__init__("load_wiki")
-        self.redis = redis_client
+        self.redis = async_redis_client
         self.sources = settings.GITHUB_SOURCES
         self.cache_version = settings.CACHE_VERSION
 
+    @property
+    def validators_key(self) -> str:
+        return f"wiki_validators:{self.cache_version}"
+
+    async def _conditional_headers(self, key: str, validators: str | None) -> dict:
+        # without the stored data a 304 would leave nothing to serve
+        if not validators or not await self.redis.exists(
+            f"{key}:{self.cache_version}"
+        ):
+            return {}
+        stored = json.loads(validators)
+        headers = {}
+        if stored.get("etag"):
+            headers["If-None-Match"] = stored["etag"]
+        if stored.get("last_modified"):
+            headers["If-Modified-Since"] = stored["last_modified"]
+        return headers
+
+    async def _load_source(
+        self,
+        semaphore: asyncio.Semaphore,
+        key: str,
+        url: str,
+        validators: str | None,
+    ) -> tuple[dict[str, Any], Any | None, Any | None, tuple | None]:
+        """
+        Fetch one source. Returns its stats and, if it changed, the parsed
+        data, its model (the data itself for sources without one) and what
+        to store: the encoded data, its validators and the raw file.
+        """
+        async with semaphore:
+            started = time.perf_counter()
+            stats: dict[str, Any] = {"url": url, "bytes": 0, "cache_hit": False}
+            data = model = store = None
+            try:
+                headers = await self._conditional_headers(key, validators)
+                async with http_client.get(url, headers=headers) as response:
+                    stats["http_status"] = response.status
+                    if response.status == 304:
+                        stats["status"] = "not_modified"
+                        stats["cache_hit"] = True
+                    elif response.status == 200:
+                        raw = await response.read()
+                        stats["bytes"] = len(raw)
+                        data = msgspec.json.decode(raw)
+                        model = data
+                        if key in DATASET_TYPES:
+                            model = msgspec.json.decode(
+                                raw, type=DATASET_TYPES[key], strict=False
+                            )
+                        encoded = redis_codec.encode(data)
+                        stats["stored_bytes"] = len(encoded)
+                        validators = json.dumps(
+                            {
+                                "etag": response.headers.get("ETag"),
+                                "last_modified": response.headers.get(
+                                    "Last-Modified"
+                                ),
+                            }
+                        )
+                        store = (encoded, validators, raw)
+                        stats["status"] = "loaded"
+                    else:
+                        stats["status"] = "failed"
+                        self.logger.warning(
+                            f"Failed to load wiki data from {url}: {response.status}"
+                        )
+            except msgspec.ValidationError as e:
+                # the last valid version stays in place
+                data = model = store = None
+                stats["status"] = "invalid"
+                stats["error"] = str(e)
+                self.logger.error(f"Wiki data from {url} failed validation: {e}")
+            except Exception as e:
+                data = model = store = None
+                stats["status"] = "failed"
+                stats["error"] = str(e)
+                self.logger.error(f"Failed to load wiki data from {url}: {e}")
+
+            stats["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            return stats, data, model, store
+
     async def execute(self, *args, **kwargs) -> JobResult:
         started_at = datetime.now(tz=UTC)
 
         try:
             self.logger.info("Loading wiki data from github sources")
 
-            result_data = {}
-            async with http_client.get_session() as session:
-                for key, url in self.sources.items():
-                    result_started_at = datetime.now(tz=UTC)
-
-                    async with session.get(url) as response:
-                        if response.status == 200:
-                            try:
-                                # see if data is json serializable
-                                data = await response.json(content_type=None)
-
-                                redis_client.set(
-                                    f"{key}:{self.cache_version}", json.dumps(data)
-                                )
-                            except Exception as e:
-                                self.logger.error(
-                                    f"Failed to parse JSON data from {url}: {e}"
-                                )
-                        else:
-                            self.logger.warning(
-                                f"Failed to load wiki data from {url}: {response.status}"
-                            )
-                    result_data[key] = {
-                        "url": url,
-                        "status": "success",
-                        "started_at": result_started_at,
-                        "completed_at": datetime.now(tz=UTC),
-                    }
+            validators = await self.redis.hgetall(self.validators_key)
+            semaphore = asyncio.Semaphore(settings.WIKI_LOAD_CONCURRENCY)
+            results = await asyncio.gather(
+                *(
+                    self._load_source(semaphore, key, url, validators.get(key))
+                    for key, url in self.sources.items()
+                )
+            )
 
-            completed_at = datetime.now(tz=UTC)
+            result_data: dict[str, Any] = {}
+            loaded_datasets = {}
+            loaded_models = {}
+            stores = {}
+            for key, (stats, data, model, store) in zip(self.sources, results):
+                result_data[key] = stats
+                if data is not None:
+                    loaded_datasets[key] = data
+                    loaded_models[key] = model
+                    stores[key] = store
+
+            unchanged = [
+                key
+                for key, stats in result_data.items()
+                if stats["status"] == "not_modified"
+            ]
+            if loaded_datasets:
+                # hashes are staged now and swapped in with the new version
+                counts, swap_hashes = await wiki_hash_store.stage(loaded_datasets)
+                result_data["hash_datasets"] = counts
+
+                def writes(pipe: Pipeline) -> None:
+                    for key, (encoded, validators, _) in stores.items():
+                        pipe.set(f"{key}:{self.cache_version}", encoded)
+                        pipe.hset(self.validators_key, key, validators)
+                    swap_hashes(pipe)
+
+                await wiki_snapshot_store.publish(
+                    started_at.isoformat(),
+                    loaded_models,
+                    unchanged=unchanged,
+                    lease=self.lease,
+                    writes=writes,
+                )
+                for key, (_, _, raw) in stores.items():
+                    await local_snapshot.save("wiki", key, raw)
+                await local_snapshot.save("wiki", "version", started_at.isoformat())
 
+            completed_at = datetime.now(tz=UTC)
+            invalid = {
+                key: result_data[key]["error"]
+                for key in self.sources
+                if result_data[key]["status"] == "invalid"
+            }
+            failed = (
+                len(self.sources) - len(loaded_datasets) - len(unchanged) - len(invalid)
+            )
+            result_data["summary"] = {
+                "loaded": len(loaded_datasets),
+                "not_modified": len(unchanged),
+                "invalid": len(invalid),
+                "failed": failed,
+                "bytes": sum(result_data[key]["bytes"] for key in self.sources),
+                "stored_bytes": sum(
+                    result_data[key].get("stored_bytes", 0) for key in self.sources
+                ),
+            }
+
+            message = (
+                "Wiki data loaded successfully"
+                if loaded_datasets
+                else "Wiki data unchanged"
+            )
+            if invalid:
+                message += f", {', '.join(invalid)} failed validation"
+            validation_errors = "\n".join(
+                f"{key}: {error}" for key, error in invalid.items()
+            )
             return self.create_result(
                 status=JobStatus.SUCCESS,
-                message="Wiki data loaded successfully",
+                message=message,
                 started_at=started_at,
                 completed_at=completed_at,
                 data=result_data,
+                error_details=validation_errors or None,
             )
 
         except Exception as e:
@@ -0,0 +1,72 @@
+import asyncio
+from datetime import datetime
+
+from pytz import UTC
+
+from app.clients.warframe.market.price_history import price_history
+
+from .base import BaseJob, JobResult, JobRunner, JobStatus
+
+
+class PriceHistoryJob(BaseJob):
+    """
+    Compact the price history: closed hours of raw points become hourly
+    points, closed days of hourly points daily ones, and every resolution
+    is trimmed to its retention.
+    """
+
+    def __init__(self):
+        super().__init__("price_history")
+
+    async def execute(self, *args, **kwargs) -> JobResult:
+        started_at = datetime.now(tz=UTC)
+
+        try:
+            written = await price_history.compact(self.lease)
+
+            completed_at = datetime.now(tz=UTC)
+            self.logger.info(f"Compacted price history into {written} points")
+            return self.create_result(
+                status=JobStatus.SUCCESS,
+                message=f"Compacted price history into {written} points",
+                started_at=started_at,
+                completed_at=completed_at,
+                data={"points": written},
+            )
+
+        except Exception as e:
+            completed_at = datetime.now(tz=UTC)
+            self.logger.error(f"Failed to compact price history: {str(e)}")
+
+            return self.create_result(
+                status=JobStatus.FAILED,
+                message="Failed to compact price history",
+                started_at=started_at,
+                completed_at=completed_at,
+                error_details=str(e),
+            )
+
+
+async def execute():
+    from app.config.logging import setup_logging
+
+    setup_logging()
+
+    job = PriceHistoryJob()
+    runner = JobRunner()
+
+    result = await runner.run_job(job)
+
+    print(f"Job completed with status: {result.status}")
+    if result.message:
+        print(f"Message: {result.message}")
+    if result.error_details:
+        print(f"Error details: {result.error_details}")
+    if result.data:
+        print(f"Data: {result.data}")
+
+    return result
+
+
+if __name__ == "__main__":
+    asyncio.run(execute())
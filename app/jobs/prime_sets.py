@@ -0,0 +1,101 @@
+import asyncio
+from datetime import datetime
+
+from pytz import UTC
+
+from app.clients.warframe.market.prime_sets import prime_set_store, value_prime_set
+from app.clients.warframe.wiki.client import wiki_client
+from app.config.settings import settings
+
+from .base import BaseJob, JobResult, JobRunner, JobStatus
+
+
+class PrimeSetsJob(BaseJob):
+    """
+    Refresh the valuation of the PRIME_SETS_BATCH prime sets that are due
+    the most, so the whole table is kept fresh a few sets at a time.
+    """
+
+    def __init__(self):
+        super().__init__("prime_sets")
+
+    async def execute(self, *args, **kwargs) -> JobResult:
+        started_at = datetime.now(tz=UTC)
+
+        try:
+            names = await wiki_client.get_prime_names()
+            if not names:
+                raise RuntimeError("Void data is not loaded")
+
+            table = await prime_set_store.all()
+            due = await prime_set_store.due(names, settings.PRIME_SETS_BATCH)
+            semaphore = asyncio.Semaphore(settings.PRICE_SNAPSHOT_CONCURRENCY)
+
+            async def refresh(name: str):
+                async with semaphore:
+                    try:
+                        return await value_prime_set(name, known=table.get(name))
+                    except Exception as e:
+                        self.logger.warning(f"Failed to value {name}: {e}")
+                        return None
+
+            results = await asyncio.gather(*(refresh(name) for name in due))
+            values = [value for value in results if value is not None]
+            if due and not values:
+                raise RuntimeError("No prime set could be valued")
+            if not await prime_set_store.save(values, self.lease):
+                raise RuntimeError("Failed to store prime set values")
+
+            completed_at = datetime.now(tz=UTC)
+            self.logger.info(
+                f"Valued {len(values)}/{len(due)} prime sets, "
+                f"{len(names)} sets in total"
+            )
+            return self.create_result(
+                status=JobStatus.SUCCESS,
+                message=f"Valued {len(values)} prime sets",
+                started_at=started_at,
+                completed_at=completed_at,
+                data={
+                    "valued": len(values),
+                    "failed": len(due) - len(values),
+                    "sets": len(names),
+                },
+            )
+
+        except Exception as e:
+            completed_at = datetime.now(tz=UTC)
+            self.logger.error(f"Failed to value prime sets: {str(e)}")
+
+            return self.create_result(
+                status=JobStatus.FAILED,
+                message="Failed to value prime sets",
+                started_at=started_at,
+                completed_at=completed_at,
+                error_details=str(e),
+            )
+
+
+async def execute():
+    from app.config.logging import setup_logging
+
+    setup_logging()
+
+    job = PrimeSetsJob()
+    runner = JobRunner()
+
+    result = await runner.run_job(job)
+
+    print(f"Job completed with status: {result.status}")
+    if result.message:
+        print(f"Message: {result.message}")
+    if result.error_details:
+        print(f"Error details: {result.error_details}")
+    if result.data:
+        print(f"Data: {result.data}")
+
+    return result
+
+
+if __name__ == "__main__":
+    asyncio.run(execute())
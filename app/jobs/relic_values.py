@@ -0,0 +1,106 @@
+from datetime import datetime
+
+from pytz import UTC
+
+from app.clients.warframe.market.price_snapshot import (
+    price_snapshot_store,
+    take_price_snapshot,
+)
+from app.clients.warframe.market.relic_value import (
+    compute_relic_values,
+    relic_value_store,
+)
+from app.clients.warframe.wiki.client import wiki_client
+
+from .base import BaseJob, JobResult, JobRunner, JobStatus
+
+
+class RelicValuesJob(BaseJob):
+    """
+    Price every prime part and relic of the void dataset, then compute the
+    expected value of every relic from that snapshot.
+    """
+
+    def __init__(self):
+        super().__init__("relic_values")
+
+    async def execute(self, *args, **kwargs) -> JobResult:
+        started_at = datetime.now(tz=UTC)
+
+        try:
+            void_data = await wiki_client.get_void_data()
+            if not void_data or not void_data.relic_data:
+                raise RuntimeError("Void data is not loaded")
+            relics = void_data.relic_data
+
+            names = {f"{name} Relic" for name in relics}
+            for relic in relics.values():
+                names.update(drop.name for drop in relic.drops)
+
+            self.logger.info(f"Pricing {len(names)} relics and prime parts")
+            snapshot = await take_price_snapshot(names)
+            if not snapshot.prices:
+                raise RuntimeError("No prices found, market items may not be loaded")
+            values = compute_relic_values(relics, snapshot)
+
+            if not await price_snapshot_store.save(snapshot, self.lease):
+                raise RuntimeError("Failed to store the price snapshot")
+            if not await relic_value_store.save(values, self.lease):
+                raise RuntimeError("Failed to store the relic values")
+
+            completed_at = datetime.now(tz=UTC)
+            self.logger.info(
+                f"Computed values of {len(values.relics)} relics, "
+                f"{len(snapshot.missing)} items without a price"
+            )
+            return self.create_result(
+                status=JobStatus.SUCCESS,
+                message=f"Computed values of {len(values.relics)} relics",
+                started_at=started_at,
+                completed_at=completed_at,
+                data={
+                    "relic_count": len(values.relics),
+                    "priced": len(snapshot.prices),
+                    "missing": len(snapshot.missing),
+                    "unpriced_drops": len(values.unpriced),
+                },
+            )
+
+        except Exception as e:
+            completed_at = datetime.now(tz=UTC)
+            self.logger.error(f"Failed to compute relic values: {str(e)}")
+
+            return self.create_result(
+                status=JobStatus.FAILED,
+                message="Failed to compute relic values",
+                started_at=started_at,
+                completed_at=completed_at,
+                error_details=str(e),
+            )
+
+
+async def execute():
+    from app.config.logging import setup_logging
+
+    setup_logging()
+
+    job = RelicValuesJob()
+    runner = JobRunner()
+
+    result = await runner.run_job(job)
+
+    print(f"Job completed with status: {result.status}")
+    if result.message:
+        print(f"Message: {result.message}")
+    if result.error_details:
+        print(f"Error details: {result.error_details}")
+    if result.data:
+        print(f"Data: {result.data}")
+
+    return result
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    asyncio.run(execute())
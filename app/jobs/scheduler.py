@@ -0,0 +1,295 @@
+import asyncio
+import logging
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable
+
+from pytz import UTC
+
+from app.config.settings import settings
+
+from .base import BaseJob, JobResult, JobRunner, JobStatus
+
+
+class IntervalTrigger:
+    """Fires every `seconds` seconds."""
+
+    def __init__(self, seconds: float):
+        if seconds <= 0:
+            raise ValueError("Interval must be positive")
+        self.seconds = seconds
+
+    def next_run(self, after: datetime) -> datetime:
+        return after + timedelta(seconds=self.seconds)
+
+    def __repr__(self) -> str:
+        return f"every {self.seconds:g}s"
+
+
+class CronTrigger:
+    """
+    Fires on a standard five field cron expression, evaluated in UTC.
+
+    Fields are minute, hour, day of month, month and day of week (0 or 7 is
+    Sunday). Each accepts *, values, ranges, lists and /steps. When both day
+    fields are restricted a day matching either one fires, as in cron.
+    """
+
+    _RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression!r}")
+        self.expression = expression
+        parsed = [
+            self._parse(value, low, high)
+            for value, (low, high) in zip(fields, self._RANGES)
+        ]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        # cron counts sunday as 0 or 7, python as 6
+        self.weekdays = {(day - 1) % 7 for day in weekdays}
+        # as in cron, a field starting with * counts as unrestricted, */2 too
+        self._any_day = fields[2].startswith("*")
+        self._any_weekday = fields[4].startswith("*")
+
+    @staticmethod
+    def _parse(value: str, low: int, high: int) -> set[int]:
+        values: set[int] = set()
+        for part in value.split(","):
+            step = 1
+            if "/" in part:
+                part, step_text = part.split("/", 1)
+                step = int(step_text)
+            if part == "*":
+                start, end = low, high
+            elif "-" in part:
+                start, end = (int(bound) for bound in part.split("-", 1))
+            else:
+                start = int(part)
+                end = high if step > 1 else start
+            if start < low or end > high or start > end or step < 1:
+                raise ValueError(f"Invalid cron field {value!r}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day = moment.day in self.days
+        weekday = moment.weekday() in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day and weekday
+        return day or weekday
+
+    def next_run(self, after: datetime) -> datetime:
+        moment = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        # four years covers every combination, including 29 February
+        limit = moment + timedelta(days=366 * 4)
+        while moment < limit:
+            if moment.month not in self.months:
+                moment = (moment.replace(day=1) + timedelta(days=32)).replace(
+                    day=1, hour=0, minute=0
+                )
+            elif not self._day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+            elif moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+            elif moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment
+        raise ValueError(f"Cron expression never fires: {self.expression!r}")
+
+    def __repr__(self) -> str:
+        return f"cron {self.expression!r}"
+
+
+Trigger = IntervalTrigger | CronTrigger
+
+
+def refresh_before_expiry(
+    ttl: float, jitter: float = 0, at_most: float | None = None
+) -> IntervalTrigger:
+    """
+    Interval that refreshes data cached for `ttl` seconds before it expires,
+    leaving JOB_REFRESH_AHEAD of the TTL (and the jitter) as headroom.
+    """
+    interval = ttl * (1 - settings.JOB_REFRESH_AHEAD) - jitter
+    if at_most is not None:
+        interval = min(interval, at_most)
+    return IntervalTrigger(max(1.0, interval))
+
+
+class CallableJob(BaseJob):
+    """
+    Runs an async callable as a job, for refreshes that need no result data.
+
+    These refresh memory of the process running them, so every replica runs
+    its own instead of waiting for a lease.
+    """
+
+    exclusive = False
+
+    def __init__(self, name: str, func: Callable[[], Awaitable[Any]]):
+        super().__init__(name)
+        self.func = func
+
+    async def execute(self, *args, **kwargs) -> JobResult:
+        started_at = datetime.now(tz=UTC)
+        await self.func()
+        return self.create_result(
+            status=JobStatus.SUCCESS,
+            message=f"{self.name} refreshed",
+            started_at=started_at,
+            completed_at=datetime.now(tz=UTC),
+        )
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    factory: Callable[[], BaseJob]
+    trigger: Trigger
+    jitter: float = 0
+    run_on_start: bool = True
+    max_retries: int = settings.JOB_MAX_RETRIES
+    retry_delay: float = settings.JOB_RETRY_DELAY
+    # called with the result of every run that was not skipped for overlap
+    on_result: Callable[[JobResult], None] | None = None
+    next_run: datetime | None = None
+    last_result: JobResult | None = None
+    runs: int = 0
+    failures: int = 0
+    skipped: int = 0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class JobScheduler:
+    """
+    Runs jobs on intervals or cron expressions.
+
+    Every job has its own loop. A run that is still going when the job is
+    due again (or triggered by hand) is not started twice, failed runs are
+    retried with exponential backoff, and a random jitter spreads the start
+    times so several processes do not refresh at the same moment.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance.logger = logging.getLogger("job_scheduler")
+            cls._instance.runner = JobRunner()
+            cls._instance._jobs = {}
+            cls._instance._tasks = {}
+        return cls._instance
+
+    def add(
+        self,
+        name: str,
+        factory: Callable[[], BaseJob],
+        trigger: Trigger,
+        **options: Any,
+    ) -> ScheduledJob:
+        if name in self._jobs:
+            raise ValueError(f"Job {name} is already scheduled")
+        scheduled = ScheduledJob(name=name, factory=factory, trigger=trigger, **options)
+        self._jobs[name] = scheduled
+        return scheduled
+
+    async def run_startup_jobs(self) -> dict[str, JobResult | None]:
+        """Run every job marked run_on_start once. Returns results by name."""
+        names = [
+            name for name, scheduled in self._jobs.items() if scheduled.run_on_start
+        ]
+        results = await asyncio.gather(*(self.run_now(name) for name in names))
+        return dict(zip(names, results))
+
+    async def run_now(self, name: str) -> JobResult | None:
+        """Run a job with retries, unless a run of it is already in progress."""
+        scheduled = self._jobs[name]
+        if scheduled.lock.locked():
+            scheduled.skipped += 1
+            self.logger.warning(f"Job {name} is still running, skipping this run")
+            return None
+
+        async with scheduled.lock:
+            result = None
+            for attempt in range(scheduled.max_retries + 1):
+                if attempt:
+                    delay = scheduled.retry_delay * 2 ** (attempt - 1)
+                    self.logger.info(
+                        f"Retrying job {name} in {delay:g}s "
+                        f"(attempt {attempt + 1}/{scheduled.max_retries + 1})"
+                    )
+                    await asyncio.sleep(delay)
+                now = datetime.now(tz=UTC)
+                result = await self.runner.run_job(
+                    scheduled.factory(),
+                    fresh_for=(scheduled.trigger.next_run(now) - now).total_seconds(),
+                )
+                if result.status != JobStatus.FAILED:
+                    break
+
+            scheduled.runs += 1
+            if result.status == JobStatus.FAILED:
+                scheduled.failures += 1
+            scheduled.last_result = result
+            if scheduled.on_result is not None:
+                scheduled.on_result(result)
+            return result
+
+    async def _loop(self, scheduled: ScheduledJob) -> None:
+        while True:
+            now = datetime.now(tz=UTC)
+            scheduled.next_run = scheduled.trigger.next_run(now) + timedelta(
+                seconds=random.uniform(0, scheduled.jitter)
+            )
+            await asyncio.sleep((scheduled.next_run - now).total_seconds())
+            try:
+                await self.run_now(scheduled.name)
+            except Exception as e:
+                self.logger.error(f"Scheduled run of {scheduled.name} failed: {e}")
+
+    def start(self) -> asyncio.Task:
+        """Start every job loop. The returned task finishes once all stopped."""
+        for name, scheduled in self._jobs.items():
+            if name not in self._tasks or self._tasks[name].done():
+                self._tasks[name] = asyncio.create_task(self._loop(scheduled))
+                self.logger.info(f"Scheduled job {name} ({scheduled.trigger})")
+        return asyncio.create_task(self._wait())
+
+    async def _wait(self) -> None:
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def stop(self) -> None:
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = {}
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            name: {
+                "trigger": repr(scheduled.trigger),
+                "running": scheduled.lock.locked(),
+                "next_run": scheduled.next_run.isoformat()
+                if scheduled.next_run
+                else None,
+                "last_status": scheduled.last_result.status.value
+                if scheduled.last_result
+                else None,
+                "last_duration": scheduled.last_result.duration_seconds
+                if scheduled.last_result
+                else None,
+                "runs": scheduled.runs,
+                "failures": scheduled.failures,
+                "skipped": scheduled.skipped,
+            }
+            for name, scheduled in self._jobs.items()
+        }
+
+
+job_scheduler = JobScheduler()
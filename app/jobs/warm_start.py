@@ -0,0 +1,90 @@
+import logging
+
+import msgspec
+from redis.asyncio.client import Pipeline
+
+from app.clients.redis import Lease, async_redis_client, redis_codec
+from app.clients.warframe.wiki.hash_store import HASH_DATASETS, wiki_hash_store
+from app.clients.warframe.wiki.snapshot import wiki_snapshot_store
+from app.config.settings import settings
+from app.utils.local_snapshot import local_snapshot
+
+logger = logging.getLogger("warm_start")
+
+
+async def _warm_wiki() -> str | None:
+    if await wiki_snapshot_store.current_version():
+        return "redis"
+
+    version = await local_snapshot.load("wiki", "version")
+    if version is None:
+        return None
+
+    # restoring counts as a load, it must not race a replica's LoadWikiJob
+    lease = Lease("job:load_wiki")
+    if not await lease.acquire():
+        return None
+    try:
+        hash_sources = {source for source, _ in HASH_DATASETS.values()}
+        datasets = {}
+        encoded = {}
+        for key in settings.GITHUB_SOURCES:
+            raw = await local_snapshot.load("wiki", key)
+            if raw is None:
+                continue
+            data = msgspec.json.decode(raw)
+            encoded[f"{key}:{settings.CACHE_VERSION}"] = redis_codec.encode(data)
+            if key in hash_sources:
+                datasets[key] = data
+
+        _, swap_hashes = await wiki_hash_store.stage(datasets)
+
+        def writes(pipe: Pipeline) -> None:
+            for key, value in encoded.items():
+                pipe.set(key, value)
+            swap_hashes(pipe)
+
+        # written only if the lease is still held when the version moves
+        await wiki_snapshot_store.publish(
+            version.decode(), datasets, lease=lease, writes=writes
+        )
+    finally:
+        await lease.release()
+    return "disk"
+
+
+async def _warm_market_items() -> str | None:
+    key = f"market_items:{settings.CACHE_VERSION}"
+    if await async_redis_client.exists(key):
+        return "redis"
+
+    raw = await local_snapshot.load("market", "items")
+    if raw is None:
+        return None
+    # nx: a replica that just loaded fresh items wins over the old copy
+    await async_redis_client.get_client().set(
+        key,
+        redis_codec.encode(msgspec.json.decode(raw)),
+        ex=settings.DATA_CACHE_SECONDS,
+        nx=True,
+    )
+    return "disk"
+
+
+async def warm_start() -> dict[str, str | None]:
+    """
+    Make last known-good data available without waiting for the network.
+
+    Data already in Redis is used as is. Otherwise it is restored from the
+    local snapshot saved by the jobs. Returns where each dataset came from,
+    None when neither had a copy.
+    """
+    sources = {}
+    for name, warm in (("wiki", _warm_wiki), ("market_items", _warm_market_items)):
+        try:
+            sources[name] = await warm()
+        except Exception as e:
+            logger.error(f"Warm start of {name} failed: {e}")
+            sources[name] = None
+        logger.info(f"Warm start of {name}: {sources[name] or 'no copy found'}")
+    return sources
@@ -2,11 +2,35 @@ import asyncio
 import logging
 import signal
 import sys
+from typing import Awaitable, Callable
 
 from app.config.logging import setup_logging
 from app.config.settings import settings
+from app.jobs.base import JobResult, JobRunner, JobStatus
 from app.jobs.load_market_items import LoadMarketItemsJob
-from app.jobs.load_wiki import JobRunner, LoadWikiJob
+from app.jobs.load_wiki import LoadWikiJob
+from app.jobs.price_history import PriceHistoryJob
+from app.jobs.prime_sets import PrimeSetsJob
+from app.jobs.relic_values import RelicValuesJob
+from app.jobs.scheduler import (
+    CallableJob,
+    CronTrigger,
+    IntervalTrigger,
+    job_scheduler,
+    refresh_before_expiry,
+)
+from app.jobs.warm_start import warm_start
+from app.utils.http import http_client
+from app.utils.readiness import SERVING, ReadinessState, readiness
+
+# jobs that can be run once with python -m app.main job <job_name>
+JOBS = {
+    "load_wiki": LoadWikiJob,
+    "load_market_items": LoadMarketItemsJob,
+    "relic_values": RelicValuesJob,
+    "prime_sets": PrimeSetsJob,
+    "price_history": PriceHistoryJob,
+}
 
 
 class JeffersonApp:
@@ -14,12 +38,14 @@ class JeffersonApp:
         self.logger = logging.getLogger("jefferson_app")
         self.services = set()
         self.shutdown_requested = False
+        self._background = set()
 
     async def setup_discord_bot(self):
         try:
             from app.bot.bot import create_bot
 
             self.logger.info("Starting Discord bot...")
+            readiness.set("bot", ReadinessState.STARTING, "connecting")
             bot = await create_bot()
             bot_task = asyncio.create_task(bot.start(settings.DISCORD_TOKEN))
 
@@ -43,6 +69,179 @@ class JeffersonApp:
             pass
         await bot.close()
 
+    async def setup_worldstate_poller(self, warm: bool = False):
+        """Keep the worldstate snapshot fresh in the background."""
+        from app.clients.warframe.worldstate.client import worldstate_client
+
+        async def wait_for_snapshot():
+            while not worldstate_client.has_snapshot:
+                await worldstate_client.refresh()
+                if worldstate_client.has_snapshot:
+                    break
+                readiness.set(
+                    "worldstate", ReadinessState.UNAVAILABLE, "no snapshot yet"
+                )
+                await asyncio.sleep(settings.WORLDSTATE_POLL_INTERVAL)
+            readiness.set("worldstate", ReadinessState.READY)
+
+        if warm:
+            # commands fetch the snapshot themselves if they need it first
+            readiness.set("worldstate", ReadinessState.WARM, "loading")
+        else:
+            # first snapshot is loaded before commands are served
+            await worldstate_client.refresh()
+        self._run_in_background(wait_for_snapshot())
+        poller_task = worldstate_client.start_polling()
+
+        def cleanup_poller():
+            self.logger.info("Stopping worldstate poller...")
+            asyncio.create_task(worldstate_client.close())
+
+        self.services.add((poller_task, cleanup_poller))
+        self.logger.info("Worldstate poller started")
+
+    async def setup_market_feed(self):
+        """Follow the market websocket to serve orders from live books."""
+        from app.clients.warframe.market.order_feed import market_order_feed
+
+        feed_task = market_order_feed.start()
+
+        def cleanup_feed():
+            self.logger.info("Stopping market order feed...")
+            asyncio.create_task(market_order_feed.stop())
+
+        self.services.add((feed_task, cleanup_feed))
+        self.logger.info("Market order feed started")
+
+    def register_jobs(self):
+        """Periodic refreshes, each running before the data it feeds expires."""
+        from app.clients.warframe.market.riven_cache import riven_cache
+
+        jitter = settings.JOB_JITTER_SECONDS
+        job_scheduler.add(
+            "load_wiki",
+            LoadWikiJob,
+            CronTrigger(settings.WIKI_REFRESH_CRON)
+            if settings.WIKI_REFRESH_CRON
+            else IntervalTrigger(settings.DATA_REFRESH_INTERVAL),
+            jitter=jitter,
+            on_result=self.track_readiness("wiki", self._wiki_published),
+        )
+        # market_items:* expires after DATA_CACHE_SECONDS
+        job_scheduler.add(
+            "load_market_items",
+            LoadMarketItemsJob,
+            refresh_before_expiry(
+                settings.DATA_CACHE_SECONDS,
+                jitter,
+                at_most=settings.DATA_REFRESH_INTERVAL,
+            ),
+            jitter=jitter,
+            on_result=self.track_readiness(
+                "market_items", self._market_items_published
+            ),
+        )
+        # pricing every relic and part takes minutes at the market rate limit,
+        # so it is not a startup job, the last values stay in Redis meanwhile
+        job_scheduler.add(
+            "relic_values",
+            RelicValuesJob,
+            IntervalTrigger(settings.RELIC_VALUES_REFRESH_INTERVAL),
+            jitter=jitter,
+            run_on_start=False,
+        )
+        job_scheduler.add(
+            "prime_sets",
+            PrimeSetsJob,
+            IntervalTrigger(settings.PRIME_SETS_REFRESH_INTERVAL),
+            jitter=jitter,
+            run_on_start=False,
+        )
+        job_scheduler.add(
+            "price_history",
+            PriceHistoryJob,
+            IntervalTrigger(settings.PRICE_HISTORY_COMPACT_INTERVAL),
+            jitter=jitter,
+            run_on_start=False,
+        )
+        job_scheduler.add(
+            "refresh_riven_weapons",
+            lambda: CallableJob("refresh_riven_weapons", riven_cache.refresh),
+            refresh_before_expiry(riven_cache.ttl, jitter),
+            jitter=jitter,
+        )
+
+    def _run_in_background(self, coro):
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+    async def warm_up(self) -> bool:
+        """
+        Make the last known-good data available without waiting for the jobs.
+
+        Returns True if every startup dataset had a copy, in Redis or on
+        disk, so services can start before the jobs have refreshed it.
+        """
+        if not settings.WARM_START:
+            return False
+        sources = await warm_start()
+        for component, source in sources.items():
+            if source:
+                readiness.set(
+                    component, ReadinessState.WARM, f"restored from {source}"
+                )
+        return all(sources.values())
+
+    @staticmethod
+    async def _wiki_published() -> bool:
+        from app.clients.warframe.wiki.snapshot import wiki_snapshot_store
+
+        return await wiki_snapshot_store.current_version() is not None
+
+    @staticmethod
+    async def _market_items_published() -> bool:
+        from app.clients.redis.async_client import async_redis_client
+
+        return await async_redis_client.exists(
+            f"market_items:{settings.CACHE_VERSION}"
+        )
+
+    def track_readiness(
+        self, component: str, published: Callable[[], Awaitable[bool]]
+    ):
+        """Job result callback keeping the component's readiness current."""
+
+        async def ready_if_published(result: JobResult):
+            # a skipped run loaded nothing here, only the holder's data counts
+            if await published():
+                readiness.set(component, ReadinessState.READY, result.message)
+
+        def on_result(result: JobResult):
+            if result.status == JobStatus.SKIPPED:
+                self._run_in_background(ready_if_published(result))
+            elif result.status != JobStatus.FAILED:
+                readiness.set(component, ReadinessState.READY, result.message)
+            elif readiness.state(component) in SERVING:
+                # keep serving the last known-good data, the schedule retries
+                readiness.set(component, ReadinessState.STALE, "refresh failed")
+            else:
+                readiness.set(component, ReadinessState.UNAVAILABLE, "load failed")
+
+        return on_result
+
+    async def setup_job_scheduler(self):
+        """Run the periodic jobs for as long as the app is up."""
+        scheduler_task = job_scheduler.start()
+
+        def cleanup_scheduler():
+            self.logger.info("Stopping job scheduler...")
+            asyncio.create_task(job_scheduler.stop())
+
+        self.services.add((scheduler_task, cleanup_scheduler))
+        self.logger.info("Job scheduler started")
+
     async def setup_web_api(self):
         """Setup and run FastAPI web service."""
         try:
@@ -102,16 +301,29 @@ class JeffersonApp:
         self.logger.info("Starting Jefferson application...")
 
         self.setup_signal_handlers()
+        readiness.start()
+
+        self.register_jobs()
+        warm = await self.warm_up()
+        if warm:
+            # Serve the restored data now, the jobs refresh it meanwhile
+            self.logger.info("Warm start, refreshing data in the background")
+            self._run_in_background(job_scheduler.run_startup_jobs())
+        else:
+            # Caches are filled before any command can be served
+            await job_scheduler.run_startup_jobs()
 
-        # Run jobs once on startup
-        job = LoadWikiJob()
-        runner = JobRunner()
-        await runner.run_job(job)
+        try:
+            # Keep them fresh from now on
+            await self.setup_job_scheduler()
 
-        market_job = LoadMarketItemsJob()
-        await runner.run_job(market_job)
+            # Start worldstate poller
+            await self.setup_worldstate_poller(warm=warm)
+
+            # Start market order feed, commands poll REST without it
+            if settings.MARKET_WS_ENABLED:
+                await self.setup_market_feed()
 
-        try:
             # Start Discord bot
             await self.setup_discord_bot()
 
@@ -154,6 +366,7 @@ class JeffersonApp:
             raise
         finally:
             self.logger.info("Jefferson application shutting down...")
+            await http_client.close()
 
 
 async def run_single_job(job_name: str):
@@ -163,42 +376,21 @@ async def run_single_job(job_name: str):
 
     logger.info(f"Running single job: {job_name}")
 
-    if job_name == "load_wiki":
-        from app.jobs.base import JobRunner
-        from app.jobs.load_wiki import LoadWikiJob
-
-        job = LoadWikiJob()
-        runner = JobRunner()
-
-        result = await runner.run_job(job)
-
-        if result.status.value == "success":
-            logger.info(f"Job completed successfully: {result.message}")
-            sys.exit(0)
-        else:
-            logger.error(f"Job failed: {result.message}")
-            if result.error_details:
-                logger.error(f"Error details: {result.error_details}")
-            sys.exit(1)
-    elif job_name == "load_market_items":
-        from app.jobs.base import JobRunner
-        from app.jobs.load_market_items import LoadMarketItemsJob
-
-        job = LoadMarketItemsJob()
-        runner = JobRunner()
+    job_class = JOBS.get(job_name)
+    if job_class is None:
+        logger.error(f"Unknown job: {job_name}")
+        sys.exit(1)
 
-        result = await runner.run_job(job)
+    result = await JobRunner().run_job(job_class())
+    await http_client.close()
 
-        if result.status.value == "success":
-            logger.info(f"Job completed successfully: {result.message}")
-            sys.exit(0)
-        else:
-            logger.error(f"Job failed: {result.message}")
-            if result.error_details:
-                logger.error(f"Error details: {result.error_details}")
-            sys.exit(1)
+    if result.status.value == "success":
+        logger.info(f"Job completed successfully: {result.message}")
+        sys.exit(0)
     else:
-        logger.error(f"Unknown job: {job_name}")
+        logger.error(f"Job failed: {result.message}")
+        if result.error_details:
+            logger.error(f"Error details: {result.error_details}")
         sys.exit(1)
 
 
@@ -210,7 +402,7 @@ def main():
             asyncio.run(run_single_job(job_name))
         else:
             print("Usage: python -m app.main job <job_name>")
-            print("Available jobs: load_wiki, load_market_items")
+            print(f"Available jobs: {', '.join(JOBS)}")
             sys.exit(1)
 
     app = JeffersonApp()
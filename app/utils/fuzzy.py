@@ -0,0 +1,122 @@
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Generic, Iterable, TypeVar
+
+from Levenshtein import distance
+
+T = TypeVar("T")
+
+_SEPARATORS = re.compile(r"[\s_\-]+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase with spaces, underscores and dashes collapsed to one space."""
+    return _SEPARATORS.sub(" ", text.lower()).strip()
+
+
+def trigrams(text: str) -> set[str]:
+    """Character trigrams of text, padded so short words still produce some."""
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True)
+class FuzzyMatch(Generic[T]):
+    item: T
+    key: str
+    distance: int
+    score: float
+
+
+class FuzzyIndex(Generic[T]):
+    """
+    Approximate string lookup over a fixed set of keys.
+
+    A trigram inverted index picks the keys sharing the most trigrams with
+    the query, and only those are checked with a Levenshtein distance capped
+    at the worst distance the confidence threshold allows. Build it once per
+    catalogue and reuse it for every query.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[tuple[T, Iterable[str]]],
+        candidates: int = 64,
+    ):
+        self.candidates = candidates
+        self._keys: list[str] = []
+        self._items: list[T] = []
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        self._exact: dict[str, int] = {}
+
+        for item, keys in entries:
+            for key in {normalize(key) for key in keys if key}:
+                key_id = len(self._keys)
+                self._keys.append(key)
+                self._items.append(item)
+                self._exact.setdefault(key, key_id)
+                for gram in trigrams(key):
+                    self._postings[gram].append(key_id)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _candidates(self, query: str) -> list[int]:
+        postings = sorted(
+            (
+                self._postings[gram]
+                for gram in trigrams(query)
+                if gram in self._postings
+            ),
+            key=len,
+        )
+        # trigrams shared by a large part of the catalogue ("pri", "rim", ...)
+        # barely narrow the search and dominate the counting, so only the
+        # rarest ones are counted once enough of them were seen
+        common = max(self.candidates, len(self._keys) // 20)
+        shared: Counter[int] = Counter()
+        for index, posting in enumerate(postings):
+            if len(posting) > common and index >= 3:
+                break
+            shared.update(posting)
+        return [key_id for key_id, _ in shared.most_common(self.candidates)]
+
+    def search(
+        self, query: str, limit: int = 5, min_score: float = 0.0
+    ) -> list[FuzzyMatch[T]]:
+        """
+        Best matches for query, highest score first.
+
+        The score is 1 - distance / length of the longer string, so 1.0 is
+        an exact match. Matches below min_score are left out, and each item
+        appears once even when several of its keys match.
+        """
+        query = normalize(query)
+        if not query:
+            return []
+
+        exact = self._exact.get(query)
+        if exact is not None and limit == 1:
+            return [FuzzyMatch(self._items[exact], query, 0, 1.0)]
+
+        best: dict[int, FuzzyMatch[T]] = {}
+        for key_id in self._candidates(query):
+            key = self._keys[key_id]
+            longest = max(len(query), len(key))
+            cutoff = int(longest * (1 - min_score))
+            dist = distance(query, key, score_cutoff=cutoff)
+            if dist > cutoff:
+                continue
+
+            match = FuzzyMatch(self._items[key_id], key, dist, 1 - dist / longest)
+            item_id = id(match.item)
+            if item_id not in best or match.score > best[item_id].score:
+                best[item_id] = match
+
+        ranked = sorted(best.values(), key=lambda match: (-match.score, match.key))
+        return ranked[:limit]
+
+    def best(self, query: str, min_score: float = 0.0) -> FuzzyMatch[T] | None:
+        matches = self.search(query, limit=1, min_score=min_score)
+        return matches[0] if matches else None
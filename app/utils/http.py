@@ -1,8 +1,33 @@
+import asyncio
+import logging
+import random
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any, AsyncIterator
+
 import aiohttp
 
+from app.config.settings import settings
+from app.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# safe to send again, the request has no side effects a retry could repeat
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# 429 is left to the callers, the market scheduler paces those itself
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
 
 class HttpClient:
-    """Singleton HTTP client for shared aiohttp sessions."""
+    """
+    Singleton HTTP client, every outgoing request goes through its session.
+
+    The connector pools keep-alive connections with a limit per host and
+    caches DNS lookups, requests get total and connect timeouts, idempotent
+    requests are retried with jittered backoff on connection errors and
+    server errors, and each request is timed as http.<host> in the metrics.
+    """
 
     _instance = None
 
@@ -10,14 +35,150 @@ class HttpClient:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._session = None
+            cls._instance._stats = {
+                "requests": 0,
+                "retries": 0,
+                "errors": 0,
+            }
         return cls._instance
 
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_request_exception.append(self._on_request_exception)
+        return trace_config
+
+    async def _on_request_start(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestStartParams,
+    ) -> None:
+        context.started = time.perf_counter()
+        self._stats["requests"] += 1
+
+    async def _on_request_end(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestEndParams,
+    ) -> None:
+        metrics.observe(
+            f"http.{params.url.host}",
+            time.perf_counter() - context.started,
+            error=params.response.status >= 500,
+        )
+
+    async def _on_request_exception(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestExceptionParams,
+    ) -> None:
+        self._stats["errors"] += 1
+        metrics.observe(
+            f"http.{params.url.host}",
+            time.perf_counter() - context.started,
+            error=True,
+        )
+
     def get_session(self) -> aiohttp.ClientSession:
-        """Get or create shared aiohttp session."""
+        """Get or create the shared session. Callers must not close it."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(
+                limit=settings.HTTP_POOL_SIZE,
+                limit_per_host=settings.HTTP_POOL_SIZE_PER_HOST,
+                ttl_dns_cache=settings.HTTP_DNS_CACHE_TTL,
+                keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=settings.HTTP_TIMEOUT,
+                    connect=settings.HTTP_CONNECT_TIMEOUT,
+                ),
+                trace_configs=[self._trace_config()],
+            )
         return self._session
 
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        # full jitter, so replicas retrying the same outage spread out
+        return random.uniform(0, settings.HTTP_RETRY_BACKOFF * 2**attempt)
+
+    @asynccontextmanager
+    async def request(
+        self, method: str, url: str, retries: int | None = None, **kwargs: Any
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Send a request on the shared session and yield its response.
+
+        Idempotent methods are retried up to `retries` times (default
+        HTTP_MAX_RETRIES) on connection errors, timeouts and RETRY_STATUSES.
+        The last response is yielded whatever its status, errors from the
+        last attempt are raised.
+        """
+        method = method.upper()
+        if retries is None:
+            retries = settings.HTTP_MAX_RETRIES
+        if method not in IDEMPOTENT_METHODS:
+            retries = 0
+
+        session = self.get_session()
+        attempt = 0
+        while True:
+            try:
+                response = await session.request(method, url, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= retries:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(
+                    f"{method} {url} failed ({e!r}), retrying in {delay:.2f}s"
+                )
+            else:
+                if response.status not in RETRY_STATUSES or attempt >= retries:
+                    break
+                response.release()
+                delay = self._backoff(attempt)
+                logger.warning(
+                    f"{method} {url} returned {response.status}, "
+                    f"retrying in {delay:.2f}s"
+                )
+            attempt += 1
+            self._stats["retries"] += 1
+            await asyncio.sleep(delay)
+
+        try:
+            yield response
+        finally:
+            response.release()
+
+    def get(self, url: str, **kwargs: Any):
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any):
+        return self.request("HEAD", url, **kwargs)
+
+    def ws_connect(self, url: str, **kwargs: Any):
+        """Open a websocket on the shared session, used as a context manager."""
+        return self.get_session().ws_connect(url, **kwargs)
+
+    def stats(self) -> dict[str, Any]:
+        connector = self._session.connector if self._session else None
+        return {
+            **self._stats,
+            "open": self._session is not None and not self._session.closed,
+            "limit": connector.limit if connector else settings.HTTP_POOL_SIZE,
+            "limit_per_host": (
+                connector.limit_per_host
+                if connector
+                else settings.HTTP_POOL_SIZE_PER_HOST
+            ),
+            "latency": metrics.snapshot("http."),
+        }
+
     async def close(self):
         """Close the shared session."""
         if self._session and not self._session.closed:
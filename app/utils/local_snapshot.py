@@ -0,0 +1,60 @@
+import asyncio
+import logging
+import os
+from pathlib import Path
+from urllib.parse import quote
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LocalSnapshot:
+    """
+    Last known-good copies of loaded data on local disk.
+
+    Jobs save what they successfully stored in Redis, so a process that
+    starts with an empty Redis can still serve data immediately. Files are
+    replaced atomically, a crash never leaves a half-written copy behind.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance.root = Path(settings.SNAPSHOT_DIR)
+        return cls._instance
+
+    def path(self, section: str, name: str) -> Path:
+        return self.root / section / quote(name, safe="")
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    async def save(self, section: str, name: str, data: bytes | str) -> bool:
+        if isinstance(data, str):
+            data = data.encode()
+        try:
+            await asyncio.to_thread(self._write, self.path(section, name), data)
+            return True
+        except OSError as e:
+            logger.warning(f"Failed to save local snapshot {section}/{name}: {e}")
+            return False
+
+    async def load(self, section: str, name: str) -> bytes | None:
+        path = self.path(section, name)
+        try:
+            return await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Failed to read local snapshot {section}/{name}: {e}")
+            return None
+
+
+local_snapshot = LocalSnapshot()
@@ -0,0 +1,89 @@
+import time
+from enum import Enum
+from typing import Any
+
+from app.utils.metrics import metrics
+
+
+class ReadinessState(str, Enum):
+    STARTING = "starting"
+    # serving last known-good data while a refresh is pending
+    WARM = "warm"
+    READY = "ready"
+    # refresh failed, still serving last known-good data
+    STALE = "stale"
+    UNAVAILABLE = "unavailable"
+
+
+# states in which a component can answer requests
+SERVING = {ReadinessState.WARM, ReadinessState.READY, ReadinessState.STALE}
+
+
+class Readiness:
+    """Startup state of each component and how long serving took to begin."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._started = time.monotonic()
+            cls._instance._components = {}
+            cls._instance._first_command = None
+        return cls._instance
+
+    def start(self) -> None:
+        """Reset the clock, called once as the application starts."""
+        self._started = time.monotonic()
+        self._components = {}
+        self._first_command = None
+
+    def set(self, component: str, state: ReadinessState, detail: str = "") -> None:
+        self._components[component] = {
+            "state": state,
+            "detail": detail,
+            "since": round(time.monotonic() - self._started, 3),
+        }
+
+    def state(self, component: str) -> ReadinessState:
+        entry = self._components.get(component)
+        return entry["state"] if entry else ReadinessState.STARTING
+
+    def command_served(self) -> None:
+        """Record the first command answered since start."""
+        if self._first_command is None:
+            self._first_command = time.monotonic() - self._started
+            metrics.observe("startup.first_command", self._first_command)
+
+    @property
+    def overall(self) -> ReadinessState:
+        states = {entry["state"] for entry in self._components.values()}
+        if not states or ReadinessState.STARTING in states:
+            return ReadinessState.STARTING
+        if ReadinessState.UNAVAILABLE in states:
+            return ReadinessState.UNAVAILABLE
+        if states == {ReadinessState.READY}:
+            return ReadinessState.READY
+        if ReadinessState.STALE in states:
+            return ReadinessState.STALE
+        return ReadinessState.WARM
+
+    @property
+    def serving(self) -> bool:
+        return self.overall in SERVING
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "state": self.overall.value,
+            "uptime_seconds": round(time.monotonic() - self._started, 3),
+            "time_to_first_command_seconds": round(self._first_command, 3)
+            if self._first_command is not None
+            else None,
+            "components": {
+                name: {**entry, "state": entry["state"].value}
+                for name, entry in self._components.items()
+            },
+        }
+
+
+readiness = Readiness()
@@ -2,16 +2,17 @@ import logging
 import time
 from typing import Any, Dict
 
+import aiohttp
 from fastapi import APIRouter, HTTPException
 
-from app.clients.redis.client import RedisClient
+from app.clients.redis import async_redis_client
 from app.config.settings import settings
+from app.utils.http import http_client
+from app.utils.readiness import readiness
 
 router = APIRouter(prefix="/health", tags=["health"])
 logger = logging.getLogger(__name__)
 
-redis_client = RedisClient()
-
 
 @router.get("/")
 async def health_check() -> Dict[str, Any]:
@@ -21,8 +22,8 @@ async def health_check() -> Dict[str, Any]:
 
     # Check Redis connection
     try:
-        client = redis_client.get_client()
-        client.ping()
+        client = async_redis_client.get_client()
+        await client.ping()
         health_status["checks"]["redis"] = {
             "status": "healthy",
             "response_time": "< 1ms",
@@ -47,7 +48,7 @@ async def health_check() -> Dict[str, Any]:
 
     # Check GitHub data cache
     try:
-        github_data = redis_client.get("github_data")
+        github_data = await async_redis_client.get("github_data")
         if github_data:
             health_status["checks"]["github_data"] = {
                 "status": "healthy",
@@ -70,7 +71,7 @@ async def health_check() -> Dict[str, Any]:
 
     # Check Wiki data cache
     try:
-        wiki_data = redis_client.get("wiki_data")
+        wiki_data = await async_redis_client.get("wiki_data")
         if wiki_data:
             health_status["checks"]["wiki_data"] = {
                 "status": "healthy",
@@ -93,23 +94,22 @@ async def health_check() -> Dict[str, Any]:
 
     # Check Worldstate API
     try:
-        import aiohttp
-
-        async with aiohttp.ClientSession() as session:
-            async with session.head(settings.WORLDSTATE_URL, timeout=5) as response:
-                if response.status < 500:
-                    health_status["checks"]["worldstate_api"] = {
-                        "status": "healthy",
-                        "response_time": f"{response.status} response code",
-                        "details": "Worldstate API is reachable",
-                    }
-                else:
-                    health_status["checks"]["worldstate_api"] = {
-                        "status": "degraded",
-                        "response_code": response.status,
-                        "details": "Worldstate API responding with errors",
-                    }
-                    overall_healthy = False
+        async with http_client.head(
+            settings.WORLDSTATE_URL, timeout=aiohttp.ClientTimeout(total=5), retries=0
+        ) as response:
+            if response.status < 500:
+                health_status["checks"]["worldstate_api"] = {
+                    "status": "healthy",
+                    "response_time": f"{response.status} response code",
+                    "details": "Worldstate API is reachable",
+                }
+            else:
+                health_status["checks"]["worldstate_api"] = {
+                    "status": "degraded",
+                    "response_code": response.status,
+                    "details": "Worldstate API responding with errors",
+                }
+                overall_healthy = False
     except Exception as e:
         health_status["checks"]["worldstate_api"] = {
             "status": "unhealthy",
@@ -118,6 +118,12 @@ async def health_check() -> Dict[str, Any]:
         }
         overall_healthy = False
 
+    # Startup readiness, serving from last known-good data counts as healthy
+    health_status["checks"]["readiness"] = {
+        "status": "healthy" if readiness.serving else "warning",
+        **readiness.snapshot(),
+    }
+
     health_status["status"] = "healthy" if overall_healthy else "unhealthy"
 
     return health_status
@@ -129,8 +135,18 @@ async def simple_health_check() -> Dict[str, str]:
     Health check endpoint for load balancers.
     """
     try:
-        client = redis_client.get_client()
-        client.ping()
+        client = async_redis_client.get_client()
+        await client.ping()
         return {"status": "ok"}
     except Exception:
         raise HTTPException(status_code=503, detail="Service unhealthy")
+
+
+@router.get("/ready")
+async def readiness_check() -> Dict[str, Any]:
+    """
+    Readiness probe, OK once commands can be answered, even from warm data.
+    """
+    if not readiness.serving:
+        raise HTTPException(status_code=503, detail=readiness.snapshot())
+    return readiness.snapshot()
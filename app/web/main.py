@@ -5,10 +5,24 @@ from typing import Any, Dict
 import uvicorn
 from fastapi import FastAPI, HTTPException
 
-from app.clients.redis.client import RedisClient
+from app.bot.autocomplete import autocomplete
+from app.bot.render_cache import render_cache
+from app.clients.redis import async_redis_client
+from app.clients.warframe.market.order_cache import market_order_cache
+from app.clients.warframe.market.order_feed import market_order_feed
+from app.clients.warframe.market.price_history import price_history
+from app.clients.warframe.market.prime_sets import prime_set_store
+from app.clients.warframe.market.relic_value import relic_value_store
+from app.clients.warframe.market.scheduler import market_scheduler
+from app.clients.warframe.wiki.snapshot import wiki_snapshot_store
+from app.clients.warframe.worldstate.client import worldstate_client
 from app.config.logging import setup_logging
 from app.config.settings import settings
+from app.jobs.scheduler import job_scheduler
+from app.utils.http import http_client
+from app.utils.metrics import metrics
 from app.web.health import router as health_router
+from app.web.relics import router as relics_router
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -22,8 +36,7 @@ app = FastAPI(
 )
 
 app.include_router(health_router)
-
-redis_client = RedisClient()
+app.include_router(relics_router)
 
 
 @app.get("/")
@@ -43,10 +56,9 @@ async def get_metrics() -> Dict[str, Any]:
     Basic metrics endpoint.
     """
     try:
-        client = redis_client.get_client()
-        redis_info = client.info()
+        redis_info = await async_redis_client.info()
 
-        metrics = {
+        result = {
             "service": "jefferson-api",
             "timestamp": int(time.time()),
             "redis": {
@@ -56,15 +68,29 @@ async def get_metrics() -> Dict[str, Any]:
                 "total_commands_processed": redis_info.get(
                     "total_commands_processed", 0
                 ),
+                "pool": async_redis_client.pool_stats(),
+                "latency": metrics.snapshot("redis."),
             },
             "application": {
                 "environment": "development" if settings.WEB_DEBUG else "production",
-                "github_data_cached": bool(redis_client.get("github_data")),
-                "wiki_data_cached": bool(redis_client.get("wiki_data")),
+                "github_data_cached": await async_redis_client.exists("github_data"),
+                "wiki_data_cached": await async_redis_client.exists("wiki_data"),
+                "wiki_snapshot": wiki_snapshot_store.stats(),
+                "worldstate": worldstate_client.stats(),
+                "render_cache": render_cache.stats(),
+                "autocomplete": autocomplete.stats(),
+                "market_orders": market_order_cache.stats(),
+                "market_feed": market_order_feed.stats(),
+                "market_scheduler": market_scheduler.stats(),
+                "relic_values": relic_value_store.stats(),
+                "prime_sets": prime_set_store.stats(),
+                "price_history": price_history.stats(),
+                "http": http_client.stats(),
+                "jobs": job_scheduler.stats(),
             },
         }
 
-        return metrics
+        return result
 
     except Exception as e:
         logger.error(f"Failed to collect metrics: {str(e)}")
@@ -91,12 +117,14 @@ async def cache_info() -> Dict[str, Any]:
 
         for key in cache_keys:
             try:
-                client = redis_client.get_client()
-                ttl = client.ttl(key)
-                exists = client.exists(key)
+                client = async_redis_client.get_client()
+                ttl = await client.ttl(key)
+                exists = await client.exists(key)
+                size = await client.strlen(key)
 
                 cache_info["cache_status"][key] = {
                     "exists": bool(exists),
+                    "stored_bytes": size,
                     "ttl_seconds": ttl if ttl > 0 else None,
                     "status": "active" if ttl > 0 else "expired/not_found",
                 }
@@ -0,0 +1,57 @@
+import logging
+from typing import Any, Dict, Literal
+
+import msgspec
+from fastapi import APIRouter, HTTPException
+
+from app.clients.warframe.market.relic_value import relic_value_store
+
+router = APIRouter(prefix="/relics", tags=["relics"])
+logger = logging.getLogger(__name__)
+
+
+@router.get("/ev")
+async def relic_ranking(
+    refinement: Literal["intact", "exceptional", "flawless", "radiant"] = "radiant",
+    mode: Literal["solo", "radshare"] = "radshare",
+    currency: Literal["platinum", "ducats"] = "platinum",
+    limit: int = 20,
+    vaulted: bool = True,
+) -> Dict[str, Any]:
+    """
+    Relics ranked by expected value per relic opened, from the last computed
+    snapshot. limit <= 0 returns every relic.
+    """
+    values = await relic_value_store.get()
+    if values is None:
+        raise HTTPException(status_code=503, detail="Relic values not computed yet")
+
+    relics = await relic_value_store.ranking(
+        refinement, mode, currency, limit, include_vaulted=vaulted
+    )
+    return {
+        "computed_at": values.computed_at,
+        "prices_taken_at": values.prices_taken_at,
+        "refinement": refinement,
+        "mode": mode,
+        "currency": currency,
+        "relics": [
+            {
+                "relic": relic.relic,
+                "vaulted": relic.vaulted,
+                "is_baro": relic.is_baro,
+                "price": relic.price,
+                "value": relic.value(refinement, mode, currency),
+            }
+            for relic in relics
+        ],
+    }
+
+
+@router.get("/ev/{relic_name}")
+async def relic_value(relic_name: str) -> Dict[str, Any]:
+    """Expected platinum and ducats of one relic for every refinement and mode."""
+    relic = await relic_value_store.relic(relic_name)
+    if relic is None:
+        raise HTTPException(status_code=404, detail=f"Unknown relic {relic_name}")
+    return msgspec.to_builtins(relic)
@@ -0,0 +1,151 @@
+"""
+Compare the FuzzyIndex against the linear Levenshtein scan ItemValidator
+used to do.
+
+    python -m benchmarks.fuzzy_match              # synthetic catalogue
+    python -m benchmarks.fuzzy_match --live       # warframe.market items
+
+Queries are catalogue names with OCR-like noise (dropped, swapped and
+substituted characters, missing suffixes). Agreement is the share of
+queries for which both approaches pick the same item, and the last line
+shows how often each one recovers the name the query was made from.
+"""
+
+import argparse
+import asyncio
+import random
+import string
+import time
+from itertools import product
+
+from Levenshtein import distance
+
+from app.utils.fuzzy import FuzzyIndex, normalize
+
+WORDS = [
+    "ash", "atlas", "banshee", "baruuk", "caliban", "chroma", "ember", "equinox",
+    "excalibur", "frost", "gara", "garuda", "harrow", "hildryn", "hydroid",
+    "inaros", "ivara", "khora", "limbo", "loki", "mag", "mesa", "mirage", "nekros",
+    "nezha", "nidus", "nova", "nyx", "oberon", "octavia", "revenant", "rhino",
+    "saryn", "titania", "trinity", "valkyr", "vauban", "volt", "wisp", "wukong",
+    "zephyr", "akstiletto", "boltor", "braton", "burston", "galatine", "kronen",
+    "nikana", "orthos", "paris", "soma", "tigris", "vectis",
+]
+PARTS = [
+    "set", "blueprint", "chassis blueprint", "neuroptics blueprint",
+    "systems blueprint", "barrel", "receiver", "stock", "blade", "handle",
+    "string", "grip", "lower limb", "upper limb", "link",
+]
+
+MOD_PREFIXES = [
+    "primed", "galvanized", "amalgam", "archon", "umbral", "sacrificial",
+    "flawed", "augur", "gladiator", "vigilante", "arcane", "secondary",
+    "primary", "melee", "molt", "cascadia", "emergence", "conjunction",
+    "fractalized", "vitality", "hunter", "tactical", "energized", "corrupted",
+    "lethal", "blind", "rolling", "reflex", "natural", "heavy", "serrated",
+    "rift", "steel", "tainted", "ruthless", "spring", "quick", "power",
+    "streamlined", "overextended", "narrow", "intensify", "transient",
+    "constitution", "continuity", "flow", "redirection", "vitality", "fleeting",
+    "stretch", "blaze", "hellfire", "cryo", "stormbringer", "infected",
+]
+MOD_WORDS = [
+    "fury", "strike", "chamber", "shot", "aptitude", "scope", "barrage",
+    "instinct", "momentum", "velocity", "reach", "elementalist", "blitz",
+    "savagery", "dexterity", "acceleration", "diffusion", "exposure", "rage",
+]
+
+
+def synthetic_catalogue() -> list[str]:
+    names = [f"{word} prime {part}" for word, part in product(WORDS, PARTS)]
+    # mods and arcanes make up most of the real catalogue
+    names += [
+        f"{prefix} {word}"
+        for prefix, word in product(MOD_PREFIXES, WORDS + MOD_WORDS)
+    ]
+    return names
+
+
+async def live_catalogue() -> list[str]:
+    from app.clients.warframe.market.client import market_client
+
+    response = await market_client.get_all_items()
+    return [item.i18n["en"].name for item in response.data if "en" in item.i18n]
+
+
+def noisy(name: str, rng: random.Random) -> str:
+    chars = list(name)
+    for _ in range(rng.randint(0, 3)):
+        position = rng.randrange(len(chars))
+        operation = rng.choice(("drop", "swap", "replace"))
+        if operation == "drop" and len(chars) > 3:
+            del chars[position]
+        elif operation == "swap" and position < len(chars) - 1:
+            chars[position], chars[position + 1] = chars[position + 1], chars[position]
+        else:
+            chars[position] = rng.choice(string.ascii_lowercase)
+    text = "".join(chars)
+    if text.endswith(" blueprint") and rng.random() < 0.3:
+        text = text[: -len(" blueprint")]
+    return text
+
+
+def linear_scan(query: str, slugs: list[tuple[str, str]]) -> str:
+    query_slug = "_".join(query.lower().strip().split(" "))
+    return min(slugs, key=lambda entry: distance(query_slug, entry[0]))[1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--live", action="store_true")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    names = asyncio.run(live_catalogue()) if args.live else synthetic_catalogue()
+    rng = random.Random(args.seed)
+    sources = [rng.choice(names) for _ in range(args.queries)]
+    queries = [noisy(name, rng) for name in sources]
+    slugs = [("_".join(normalize(name).split(" ")), name) for name in names]
+
+    started = time.perf_counter()
+    index = FuzzyIndex((name, (name,)) for name in names)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    expected = [linear_scan(query, slugs) for query in queries]
+    linear_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    found = [index.best(query) for query in queries]
+    indexed_ms = (time.perf_counter() - started) * 1000
+
+    agree = sum(
+        match is not None and match.item == name
+        for match, name in zip(found, expected)
+    )
+    linear_correct = sum(name == source for name, source in zip(expected, sources))
+    indexed_correct = sum(
+        match is not None and match.item == source
+        for match, source in zip(found, sources)
+    )
+
+    print(f"catalogue: {len(names)} items, {len(queries)} queries")
+    print(f"index build: {build_ms:.1f} ms")
+    print(
+        f"linear scan: {linear_ms:.1f} ms total, "
+        f"{linear_ms / len(queries):.3f} ms/query"
+    )
+    print(
+        f"fuzzy index: {indexed_ms:.1f} ms total, "
+        f"{indexed_ms / len(queries):.3f} ms/query"
+    )
+    print(f"speedup: {linear_ms / indexed_ms:.1f}x")
+    print(f"agreement: {agree / len(queries):.1%}")
+    print(
+        f"recovered source name: linear {linear_correct / len(queries):.1%}, "
+        f"index {indexed_correct / len(queries):.1%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
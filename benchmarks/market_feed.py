@@ -0,0 +1,236 @@
+"""
+Run the market order feed against a local stand-in for the warframe.market
+websocket that replays a synthetic event stream.
+
+    python -m benchmarks.market_feed                    # replay and check
+    python -m benchmarks.market_feed --serve --port 8765
+    python -m benchmarks.market_feed --record out.jsonl --seconds 60
+
+The default run serves test/files/market_orders.jsonl on a free local port.
+Those events are synthetic, written by hand in the shape the market sends,
+not captured from it. The run seeds the order books the way REST fetches
+would, follows the replay with the real feed and compares every book with
+the same events applied to a plain list. It then times reads from the
+books. --serve only serves the events, for a bot started with
+MARKET_WS_ENABLED=true and MARKET_WS_URL=ws://localhost:<port>/socket.
+--record captures what the live websocket sends in the same format, one
+{"at", "message"} object per line, to replay real traffic instead.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import aiohttp
+from aiohttp import web
+
+from app.clients.warframe.market.order_book import (
+    BOOK_DEPTH,
+    ORDER_EVENTS,
+    order_book,
+)
+from app.clients.warframe.market.order_feed import SUBSCRIBE, market_order_feed
+from app.config.settings import settings
+from app.utils.http import http_client
+
+RECORDING = Path("test/files/market_orders.jsonl")
+
+# the items of the events and the orders a REST fetch would return for them,
+# keyed the way PriceCheck asks for them: rank 0 and 3 charges by default
+ITEMS = [
+    {"id": "5f1a2b3c4d5e6f7081920001", "slug": "soma_prime_set"},
+    {"id": "5f1a2b3c4d5e6f7081920002", "slug": "ash_prime_set"},
+    {"id": "5f1a2b3c4d5e6f7081920003", "slug": "primed_flow"},
+]
+SEEDS = {
+    ("soma_prime_set", 0, 3, None): [
+        ("ord0001", 32),
+        ("ord0002", 33),
+        ("ord0003", 35),
+        ("ord0004", 36),
+        ("ord0005", 40),
+    ],
+    ("ash_prime_set", 0, 3, None): [
+        ("ord0011", 41),
+        ("ord0012", 42),
+        ("ord0013", 44),
+        ("ord0014", 45),
+        ("ord0015", 50),
+    ],
+    ("primed_flow", 5, 3, None): [("ord0021", 20), ("ord0022", 25)],
+}
+
+
+def load_recording(path: Path) -> list[dict]:
+    with path.open() as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def replay_app(events: list[dict], speed: float) -> web.Application:
+    """A websocket at /socket replaying events to every subscriber."""
+
+    async def socket(request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse(protocols=("wfm",))
+        await ws.prepare(request)
+        subscribe = await ws.receive_json()
+        if subscribe.get("route") != SUBSCRIBE["route"]:
+            await ws.close(message=b"expected a subscription")
+            return ws
+
+        started = time.monotonic()
+        for event in events:
+            delay = event["at"] / speed - (time.monotonic() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await ws.send_json(event["message"])
+        # stay connected like the market does, the client decides when to leave
+        async for _ in ws:
+            pass
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/socket", socket)
+    return app
+
+
+async def start_server(app: web.Application, port: int) -> tuple[web.AppRunner, int]:
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "localhost", port)
+    await site.start()
+    return runner, site._server.sockets[0].getsockname()[1]
+
+
+def seed_orders(key: tuple, orders: list[tuple[str, int]]) -> list[SimpleNamespace]:
+    _, rank, charges, subtype = key
+    return [
+        SimpleNamespace(
+            id=order_id,
+            platinum=platinum,
+            quantity=1,
+            rank=rank,
+            charges=charges,
+            subtype=subtype,
+        )
+        for order_id, platinum in orders
+    ]
+
+
+def expected_books(events: list[dict]) -> dict[tuple, list[int]]:
+    """The events applied to plain lists, to check the books against."""
+    slugs = {item["id"]: item["slug"] for item in ITEMS}
+    books = {key: dict(orders) for key, orders in SEEDS.items()}
+    for event in events:
+        message = event["message"]
+        adds = ORDER_EVENTS.get(message["route"].rsplit("/", 1)[-1])
+        if adds is None:
+            continue
+        order = message["payload"]
+        for key, book in books.items():
+            book.pop(order["id"], None)
+            slug, rank, charges, _ = key
+            if (
+                adds
+                and order.get("type") == "sell"
+                and order.get("visible", True)
+                and (order.get("user") or {}).get("status") == "ingame"
+                and slugs.get(order.get("itemId")) == slug
+                and (rank is None or order.get("rank") in (rank, None))
+                and (charges is None or order.get("charges") in (charges, None))
+            ):
+                book[order["id"]] = order["platinum"]
+    return {key: sorted(book.values())[:BOOK_DEPTH] for key, book in books.items()}
+
+
+async def check(events: list[dict], speed: float, reads: int) -> None:
+    server, port = await start_server(replay_app(events, speed), 0)
+    try:
+        await order_book.load_items(ITEMS)
+        market_order_feed.start(f"ws://localhost:{port}/socket")
+        while not order_book.live:
+            await asyncio.sleep(0.01)
+        for key, orders in SEEDS.items():
+            order_book.seed(key, seed_orders(key, orders))
+
+        await asyncio.sleep(events[-1]["at"] / speed + 0.5)
+        expected = expected_books(events)
+        for key in SEEDS:
+            book = order_book.top(key)
+            platinum = [order.platinum for order in book] if book else None
+            status = "ok" if platinum == expected[key] else "MISMATCH"
+            print(f"{key[0]:<18}{str(platinum):<28}expected {expected[key]}  {status}")
+
+        key = next(iter(SEEDS))
+        started = time.perf_counter()
+        for _ in range(reads):
+            order_book.top(key)
+        elapsed = time.perf_counter() - started
+        print(f"\n{reads:,} book reads: {elapsed / reads * 1e6:.2f} us per read")
+        print(market_order_feed.stats())
+    finally:
+        await market_order_feed.stop()
+        await http_client.close()
+        await server.cleanup()
+
+
+async def serve(events: list[dict], speed: float, port: int) -> None:
+    server, port = await start_server(replay_app(events, speed), port)
+    print(f"Replaying {len(events)} events on ws://localhost:{port}/socket")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.cleanup()
+
+
+async def record(path: Path, seconds: float) -> None:
+    started = time.monotonic()
+    count = 0
+    try:
+        async with http_client.ws_connect(
+            settings.MARKET_WS_URL, protocols=("wfm",)
+        ) as ws, path.open("w") as file:
+            await ws.send_json(SUBSCRIBE)
+            while (remaining := seconds - (time.monotonic() - started)) > 0:
+                try:
+                    message = await ws.receive(timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if message.type != aiohttp.WSMsgType.TEXT:
+                    break
+                at = round(time.monotonic() - started, 3)
+                file.write(
+                    json.dumps({"at": at, "message": json.loads(message.data)}) + "\n"
+                )
+                count += 1
+    finally:
+        await http_client.close()
+    print(f"Recorded {count} messages to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--recording", type=Path, default=RECORDING)
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--reads", type=int, default=100_000)
+    parser.add_argument("--serve", action="store_true")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--record", type=Path)
+    parser.add_argument("--seconds", type=float, default=60)
+    args = parser.parse_args()
+
+    if args.record:
+        asyncio.run(record(args.record, args.seconds))
+        return
+
+    events = load_recording(args.recording)
+    if args.serve:
+        asyncio.run(serve(events, args.speed, args.port))
+    else:
+        asyncio.run(check(events, args.speed, args.reads))
+
+
+if __name__ == "__main__":
+    main()
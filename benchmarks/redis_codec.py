@@ -0,0 +1,124 @@
+"""
+Compare how the large cached datasets are stored in Redis: plain JSON text
+read with the stdlib parser, as before, against the RedisCodec encodings
+and compressions available in this environment.
+
+    python -m benchmarks.redis_codec              # local snapshot (SNAPSHOT_DIR)
+    python -m benchmarks.redis_codec --live       # download the wiki sources
+
+The local snapshot is written by the load_wiki and load_market_items jobs,
+--live fetches the wiki sources from GITHUB_DATA_URL instead (market items
+are then left out). Sizes are what Redis would store, times are the median
+of --repeat runs.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import aiohttp
+
+from app.clients.redis.codec import COMPRESSIONS, RedisCodec
+from app.config.settings import settings
+from app.utils.local_snapshot import local_snapshot
+
+DATASETS = ["internalnames:en", "recipe", "void", "weapon", "market_items"]
+
+
+async def local_datasets() -> dict[str, bytes]:
+    datasets = {}
+    for name in DATASETS:
+        if name == "market_items":
+            raw = await local_snapshot.load("market", "items")
+        else:
+            raw = await local_snapshot.load("wiki", name)
+        if raw is not None:
+            datasets[name] = raw
+    return datasets
+
+
+async def live_datasets() -> dict[str, bytes]:
+    datasets = {}
+    async with aiohttp.ClientSession() as session:
+        for name in DATASETS:
+            if name not in settings.GITHUB_SOURCES:
+                continue
+            async with session.get(settings.GITHUB_SOURCES[name]) as response:
+                response.raise_for_status()
+                datasets[name] = await response.read()
+    return datasets
+
+
+def median_ms(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--live", action="store_true")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    datasets = asyncio.run(live_datasets() if args.live else local_datasets())
+    if not datasets:
+        raise SystemExit(
+            f"No datasets in {settings.SNAPSHOT_DIR}, run the jobs or use --live"
+        )
+
+    codecs = [
+        RedisCodec(encoding, compression)
+        for encoding in ("json", "msgpack")
+        for compression in COMPRESSIONS
+    ]
+    print(f"compressions available: {', '.join(COMPRESSIONS)}\n")
+    print(
+        f"{'dataset':<18}{'format':<16}{'bytes':>12}{'ratio':>8}"
+        f"{'encode ms':>11}{'decode ms':>11}"
+    )
+
+    totals: dict[str, list[float]] = {}
+    for name, raw in datasets.items():
+        text = raw.decode()
+        decode_ms = median_ms(lambda: json.loads(text), args.repeat)
+        print(
+            f"{name:<18}{'json text':<16}{len(raw):>12,}{1:>8.2f}"
+            f"{'-':>11}{decode_ms:>11.1f}"
+        )
+        totals.setdefault("json text", [0, 0])
+        totals["json text"][0] += len(raw)
+        totals["json text"][1] += decode_ms
+
+        data = json.loads(text)
+        for codec in codecs:
+            label = f"{codec.encoding}+{codec.compression.name}"
+            encoded = codec.encode(data)
+            encode_ms = median_ms(lambda: codec.encode(data), args.repeat)
+            decode_ms = median_ms(lambda: codec.decode(encoded), args.repeat)
+            assert codec.decode(encoded) == data
+            print(
+                f"{'':<18}{label:<16}{len(encoded):>12,}"
+                f"{len(raw) / len(encoded):>8.2f}"
+                f"{encode_ms:>11.1f}{decode_ms:>11.1f}"
+            )
+            totals.setdefault(label, [0, 0])
+            totals[label][0] += len(encoded)
+            totals[label][1] += decode_ms
+
+    print("\ntotal")
+    baseline_size, baseline_ms = totals["json text"]
+    for label, (size, decode_ms) in totals.items():
+        print(
+            f"  {label:<16}{size:>12,} bytes ({baseline_size / size:.2f}x smaller)"
+            f"  decode {decode_ms:.1f} ms ({baseline_ms / decode_ms:.2f}x faster)"
+        )
+
+
+if __name__ == "__main__":
+    main()